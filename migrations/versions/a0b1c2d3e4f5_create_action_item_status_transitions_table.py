@@ -0,0 +1,66 @@
+"""create action_item_status_transitions table
+
+Revision ID: a0b1c2d3e4f5
+Revises: f9a0b1c2d3e4
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "a0b1c2d3e4f5"
+down_revision = "f9a0b1c2d3e4"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "action_item_status_transitions",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("action_item_id", sa.Integer(), nullable=False),
+        sa.Column("owner_id", sa.Integer(), nullable=False),
+        sa.Column("assignee", sa.String(length=255), nullable=True),
+        sa.Column("priority", sa.String(length=50), nullable=False),
+        sa.Column("from_status", sa.String(length=50), nullable=True),
+        sa.Column("to_status", sa.String(length=50), nullable=False),
+        sa.Column("changed_at", sa.DateTime(), server_default=sa.text("CURRENT_TIMESTAMP"), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_action_item_status_transitions_owner_status_changed",
+        "action_item_status_transitions",
+        ["owner_id", "to_status", "changed_at"],
+    )
+    op.create_index(
+        "ix_action_item_status_transitions_item_changed",
+        "action_item_status_transitions",
+        ["action_item_id", "changed_at"],
+    )
+    # Seed a history for the existing items: created as To Do at created_at and, unless
+    # still To Do, moved straight to the current status at updated_at. Afterwards the
+    # application appends every change as it happens.
+    op.execute(
+        """
+        INSERT INTO action_item_status_transitions
+            (action_item_id, owner_id, assignee, priority, from_status, to_status, changed_at)
+        SELECT a.id, m.owner_id, a.assignee, a.priority, NULL, 'To Do', a.created_at
+        FROM action_items a JOIN meetings m ON m.id = a.meeting_id
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO action_item_status_transitions
+            (action_item_id, owner_id, assignee, priority, from_status, to_status, changed_at)
+        SELECT a.id, m.owner_id, a.assignee, a.priority, 'To Do', a.status, a.updated_at
+        FROM action_items a JOIN meetings m ON m.id = a.meeting_id
+        WHERE a.status <> 'To Do'
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_action_item_status_transitions_item_changed", table_name="action_item_status_transitions")
+    op.drop_index("ix_action_item_status_transitions_owner_status_changed", table_name="action_item_status_transitions")
+    op.drop_table("action_item_status_transitions")
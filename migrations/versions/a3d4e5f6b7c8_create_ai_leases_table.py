@@ -0,0 +1,28 @@
+"""create ai_leases table
+
+Revision ID: a3d4e5f6b7c8
+Revises: f1c2d3e4a5b6
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "a3d4e5f6b7c8"
+down_revision = "f1c2d3e4a5b6"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "ai_leases",
+        sa.Column("lease_key", sa.String(length=64), primary_key=True),
+        sa.Column("holder", sa.String(length=64), nullable=False),
+        sa.Column("expires_at", sa.DateTime(), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("ai_leases")
@@ -0,0 +1,25 @@
+"""add completed_at and result to ai_leases
+
+Revision ID: b1c2d3e4f5a6
+Revises: a0b1c2d3e4f5
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "b1c2d3e4f5a6"
+down_revision = "a0b1c2d3e4f5"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("ai_leases", sa.Column("completed_at", sa.DateTime(), nullable=True))
+    op.add_column("ai_leases", sa.Column("result", sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("ai_leases", "result")
+    op.drop_column("ai_leases", "completed_at")
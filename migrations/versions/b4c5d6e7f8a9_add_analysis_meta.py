@@ -0,0 +1,23 @@
+"""add analysis_meta to meetings
+
+Revision ID: b4c5d6e7f8a9
+Revises: a3d4e5f6b7c8
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "b4c5d6e7f8a9"
+down_revision = "a3d4e5f6b7c8"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("meetings", sa.Column("analysis_meta", sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("meetings", "analysis_meta")
@@ -0,0 +1,41 @@
+"""create action_item_metrics table
+
+Revision ID: d6e7f8a9b0c1
+Revises: c5d6e7f8a9b0
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "d6e7f8a9b0c1"
+down_revision = "c5d6e7f8a9b0"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "action_item_metrics",
+        sa.Column("owner_id", sa.Integer(), nullable=False),
+        sa.Column("assignee", sa.String(length=255), server_default=sa.text("''"), nullable=False),
+        sa.Column("status", sa.String(length=50), nullable=False),
+        sa.Column("item_count", sa.Integer(), server_default=sa.text("0"), nullable=False),
+        sa.Column("overdue_count", sa.Integer(), server_default=sa.text("0"), nullable=False),
+        sa.PrimaryKeyConstraint("owner_id", "assignee", "status"),
+    )
+    # Count the existing action items; afterwards the application keeps the rows current
+    op.execute(
+        """
+        INSERT INTO action_item_metrics (owner_id, assignee, status, item_count, overdue_count)
+        SELECT m.owner_id, COALESCE(a.assignee, ''), a.status, COUNT(*),
+               SUM(CASE WHEN a.is_overdue THEN 1 ELSE 0 END)
+        FROM action_items a JOIN meetings m ON m.id = a.meeting_id
+        GROUP BY m.owner_id, COALESCE(a.assignee, ''), a.status
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("action_item_metrics")
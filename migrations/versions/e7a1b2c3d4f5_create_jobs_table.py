@@ -0,0 +1,42 @@
+"""create jobs table
+
+Revision ID: e7a1b2c3d4f5
+Revises: d1f2e3c4b5a6
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "e7a1b2c3d4f5"
+down_revision = "d1f2e3c4b5a6"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "jobs",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("kind", sa.String(length=50), nullable=False),
+        sa.Column("meeting_id", sa.Integer(), sa.ForeignKey("meetings.id"), nullable=False),
+        sa.Column("owner_id", sa.Integer(), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("status", sa.String(length=20), nullable=False, server_default=sa.text("'queued'")),
+        sa.Column("result", sa.JSON(), nullable=True),
+        sa.Column("error", sa.String(length=1024), nullable=True),
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=False),
+        sa.Column("started_at", sa.DateTime(), nullable=True),
+        sa.Column("finished_at", sa.DateTime(), nullable=True),
+    )
+    op.create_index("ix_jobs_meeting_id", "jobs", ["meeting_id"])
+    op.create_index("ix_jobs_owner_id", "jobs", ["owner_id"])
+    op.create_index("ix_jobs_status", "jobs", ["status"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_jobs_status", table_name="jobs")
+    op.drop_index("ix_jobs_owner_id", table_name="jobs")
+    op.drop_index("ix_jobs_meeting_id", table_name="jobs")
+    op.drop_table("jobs")
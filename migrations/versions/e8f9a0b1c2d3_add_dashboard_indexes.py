@@ -0,0 +1,28 @@
+"""add composite indexes for per-owner dashboard aggregation
+
+Revision ID: e8f9a0b1c2d3
+Revises: d6e7f8a9b0c1
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "e8f9a0b1c2d3"
+down_revision = "d6e7f8a9b0c1"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_meetings_owner_id_id", "meetings", ["owner_id", "id"])
+    op.create_index(
+        "ix_action_items_meeting_id_assignee_status",
+        "action_items",
+        ["meeting_id", "assignee", "status", "is_overdue"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_action_items_meeting_id_assignee_status", table_name="action_items")
+    op.drop_index("ix_meetings_owner_id_id", table_name="meetings")
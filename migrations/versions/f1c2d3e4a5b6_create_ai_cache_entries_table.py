@@ -0,0 +1,36 @@
+"""create ai_cache_entries table
+
+Revision ID: f1c2d3e4a5b6
+Revises: e7a1b2c3d4f5
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "f1c2d3e4a5b6"
+down_revision = "e7a1b2c3d4f5"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "ai_cache_entries",
+        sa.Column("cache_key", sa.String(length=64), primary_key=True),
+        sa.Column("kind", sa.String(length=50), nullable=False),
+        sa.Column("model", sa.String(length=255), nullable=False),
+        sa.Column("prompt_version", sa.String(length=50), nullable=False),
+        sa.Column("value", sa.JSON(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=False),
+        sa.Column("expires_at", sa.DateTime(), nullable=False),
+    )
+    op.create_index("ix_ai_cache_entries_created_at", "ai_cache_entries", ["created_at"])
+    op.create_index("ix_ai_cache_entries_expires_at", "ai_cache_entries", ["expires_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_ai_cache_entries_expires_at", table_name="ai_cache_entries")
+    op.drop_index("ix_ai_cache_entries_created_at", table_name="ai_cache_entries")
+    op.drop_table("ai_cache_entries")
@@ -0,0 +1,56 @@
+"""create action_item_daily_metrics table
+
+Revision ID: f9a0b1c2d3e4
+Revises: e8f9a0b1c2d3
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "f9a0b1c2d3e4"
+down_revision = "e8f9a0b1c2d3"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "action_item_daily_metrics",
+        sa.Column("owner_id", sa.Integer(), nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("created_count", sa.Integer(), server_default=sa.text("0"), nullable=False),
+        sa.Column("completed_count", sa.Integer(), server_default=sa.text("0"), nullable=False),
+        sa.Column("item_delta", sa.Integer(), server_default=sa.text("0"), nullable=False),
+        sa.Column("done_delta", sa.Integer(), server_default=sa.text("0"), nullable=False),
+        sa.Column("overdue_delta", sa.Integer(), server_default=sa.text("0"), nullable=False),
+        sa.PrimaryKeyConstraint("owner_id", "day"),
+    )
+    # Reconstruct history from the existing action items: creation on created_at, and
+    # completion / becoming overdue on the last update of items that are Done / overdue
+    # now. Afterwards the application records every change as it happens.
+    op.execute(
+        """
+        INSERT INTO action_item_daily_metrics
+            (owner_id, day, created_count, completed_count, item_delta, done_delta, overdue_delta)
+        SELECT owner_id, day, SUM(created), SUM(completed), SUM(created), SUM(completed), SUM(overdue)
+        FROM (
+            SELECT m.owner_id AS owner_id, DATE(a.created_at) AS day, 1 AS created, 0 AS completed, 0 AS overdue
+            FROM action_items a JOIN meetings m ON m.id = a.meeting_id
+            UNION ALL
+            SELECT m.owner_id, DATE(a.updated_at), 0, 1, 0
+            FROM action_items a JOIN meetings m ON m.id = a.meeting_id
+            WHERE a.status = 'Done'
+            UNION ALL
+            SELECT m.owner_id, DATE(a.updated_at), 0, 0, 1
+            FROM action_items a JOIN meetings m ON m.id = a.meeting_id
+            WHERE a.is_overdue
+        ) AS history
+        GROUP BY owner_id, day
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("action_item_daily_metrics")
@@ -1,15 +1,39 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 
+from ami_meeting_svc.services import ai_service
+# Registers the flush hook that keeps the dashboard counters current
+from ami_meeting_svc.services import metrics_rollup  # noqa: F401
+from ami_meeting_svc.services.job_queue import job_queue
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # The OpenAI client (and its HTTP connection pool) lives as long as the app
+    await ai_service.init_client()
+    await job_queue.start()
+    try:
+        yield
+    finally:
+        await job_queue.stop()
+        await ai_service.close_client()
+
+
 # Initialize FastAPI application
-app = FastAPI(debug=True)
+app = FastAPI(debug=True, lifespan=lifespan)
 
 # add routers
 from ami_meeting_svc.routers.auth import auth_router
 from ami_meeting_svc.routers.meetings import meetings_router
 from ami_meeting_svc.routers.action_items import action_items_router
 from ami_meeting_svc.routers.dashboard import dashboard_router
+from ami_meeting_svc.routers.monitoring import monitoring_router
+from ami_meeting_svc.routers.jobs import jobs_router
 
 app.include_router(auth_router)
 app.include_router(meetings_router, prefix="/meetings")
 app.include_router(action_items_router, prefix="/action-items")
 app.include_router(dashboard_router, prefix="/dashboard", tags=["dashboard"]) 
+app.include_router(jobs_router, prefix="/jobs")
+app.include_router(monitoring_router, prefix="/monitoring", tags=["monitoring"])
@@ -0,0 +1,76 @@
+import argparse
+import asyncio
+import json
+import logging
+import sys
+from contextlib import aclosing
+from datetime import datetime
+from typing import List, Optional
+
+from ami_meeting_svc import config
+from ami_meeting_svc.models.base import engine
+from ami_meeting_svc.services import ai_service
+from ami_meeting_svc.services.ai_service import OpenAIService
+from ami_meeting_svc.services.batch_analysis import run_batch_analysis, select_meetings
+
+
+# Set up logging for the command; progress events go to stdout, logs to stderr
+logging.basicConfig(level=logging.INFO, stream=sys.stderr)
+logger = logging.getLogger(__name__)
+
+
+def _parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="(Re)analyze meetings in bulk and print one JSON progress event per line."
+    )
+    parser.add_argument("meeting_ids", nargs="*", type=int, help="meeting ids (default: every meeting matching the filter)")
+    parser.add_argument("--owner-id", type=int, help="only meetings owned by this user")
+    parser.add_argument("--only-unanalyzed", action="store_true", help="skip meetings that already have an analysis")
+    parser.add_argument("--date-from", type=datetime.fromisoformat, help="only meetings on or after this ISO date")
+    parser.add_argument("--date-to", type=datetime.fromisoformat, help="only meetings before this ISO date")
+    parser.add_argument("--limit", type=int, help="analyze at most this many meetings")
+    parser.add_argument("--concurrency", type=int, default=config.BATCH_CONCURRENCY)
+    parser.add_argument("--rate-per-minute", type=float, default=config.BATCH_RATE_PER_MINUTE)
+    parser.add_argument("--commit-size", type=int, default=config.BATCH_COMMIT_SIZE)
+    return parser.parse_args(argv)
+
+
+async def _run(args: argparse.Namespace) -> int:
+    meetings = select_meetings(
+        engine,
+        owner_id=args.owner_id,
+        meeting_ids=args.meeting_ids or None,
+        only_unanalyzed=args.only_unanalyzed,
+        date_from=args.date_from,
+        date_to=args.date_to,
+        limit=args.limit,
+    )
+    if await ai_service.init_client() is None:
+        return 2
+
+    failed = 0
+    try:
+        events = run_batch_analysis(
+            engine,
+            meetings,
+            OpenAIService,
+            concurrency=args.concurrency,
+            rate_per_minute=args.rate_per_minute,
+            commit_size=args.commit_size,
+        )
+        async with aclosing(events):
+            async for event in events:
+                print(json.dumps(event, default=str), flush=True)
+                if event["event"] == "finished":
+                    failed = event["failed"]
+    finally:
+        await ai_service.close_client()
+    return 1 if failed else 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    return asyncio.run(_run(_parse_args(argv)))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,4 +1,6 @@
+import json
 import os
+import tempfile
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -19,8 +21,135 @@ def _parse_bool_env(value: str | None, default: bool) -> bool:
         return default
     return str(value).lower() in ("1", "true", "yes", "y")
 
+
+def _parse_int_env(value: str | None, default: int) -> int:
+    if value is None:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        return default
+
+
+def _parse_float_env(value: str | None, default: float) -> float:
+    if value is None:
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        return default
+
+
+def _parse_json_env(value: str | None, default):
+    if value is None:
+        return default
+    try:
+        return json.loads(value)
+    except ValueError:
+        return default
+
+
 COOKIE_SECURE = _parse_bool_env(os.getenv("COOKIE_SECURE"), True)
 
+# Database connection pool configuration (ignored for in-memory SQLite)
+DB_POOL_SIZE = _parse_int_env(os.getenv("DB_POOL_SIZE"), 5)
+DB_MAX_OVERFLOW = _parse_int_env(os.getenv("DB_MAX_OVERFLOW"), 10)
+DB_POOL_TIMEOUT = _parse_int_env(os.getenv("DB_POOL_TIMEOUT"), 30)
+# Seconds after which a pooled connection is recycled; -1 disables recycling
+DB_POOL_RECYCLE = _parse_int_env(os.getenv("DB_POOL_RECYCLE"), 1800)
+DB_POOL_PRE_PING = _parse_bool_env(os.getenv("DB_POOL_PRE_PING"), True)
+
 # OpenAI configuration
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 OPENAI_MODEL_NAME = os.getenv("OPENAI_MODEL_NAME", "gpt-3.5-turbo")
+# Alternative API endpoint, e.g. the local stub (python -m ami_meeting_svc.openai_stub)
+# at http://localhost:8001/v1; unset uses the OpenAI API
+OPENAI_BASE_URL = os.getenv("OPENAI_BASE_URL") or None
+# Model routing table: per task ("analysis", "extraction", "combined" or "default"),
+# an ordered list of {"max_tokens": N, "model": "..."} routes; the first route whose
+# max_tokens covers the estimated notes size wins (omit max_tokens for a catch-all).
+# Tasks without a matching route use OPENAI_MODEL_NAME. See services/model_routing.py.
+OPENAI_MODEL_ROUTES = _parse_json_env(os.getenv("OPENAI_MODEL_ROUTES"), {})
+# Per-request timeout (seconds) and HTTP connection pool of the shared OpenAI client
+OPENAI_TIMEOUT = _parse_float_env(os.getenv("OPENAI_TIMEOUT"), 60.0)
+OPENAI_MAX_CONNECTIONS = _parse_int_env(os.getenv("OPENAI_MAX_CONNECTIONS"), 100)
+OPENAI_MAX_KEEPALIVE_CONNECTIONS = _parse_int_env(os.getenv("OPENAI_MAX_KEEPALIVE_CONNECTIONS"), 20)
+OPENAI_KEEPALIVE_EXPIRY = _parse_float_env(os.getenv("OPENAI_KEEPALIVE_EXPIRY"), 30.0)
+
+# Background job worker pool used by the `?async=true` mode of the AI endpoints
+JOB_WORKER_CONCURRENCY = _parse_int_env(os.getenv("JOB_WORKER_CONCURRENCY"), 2)
+# On start, jobs left "running" for longer than this (a crash or restart mid-job) are
+# queued again, or failed once they have been attempted JOB_MAX_ATTEMPTS times
+JOB_STALE_SECONDS = _parse_int_env(os.getenv("JOB_STALE_SECONDS"), 900)
+JOB_MAX_ATTEMPTS = _parse_int_env(os.getenv("JOB_MAX_ATTEMPTS"), 3)
+
+# AI result cache: in-process LRU tier plus a persistent table tier
+AI_CACHE_ENABLED = _parse_bool_env(os.getenv("AI_CACHE_ENABLED"), True)
+AI_CACHE_TTL_SECONDS = _parse_int_env(os.getenv("AI_CACHE_TTL_SECONDS"), 86400)
+AI_CACHE_MAX_ENTRIES = _parse_int_env(os.getenv("AI_CACHE_MAX_ENTRIES"), 1024)
+AI_CACHE_DB_MAX_ENTRIES = _parse_int_env(os.getenv("AI_CACHE_DB_MAX_ENTRIES"), 100000)
+
+# Coalescing of identical concurrent AI requests across worker processes
+AI_LEASE_TTL_SECONDS = _parse_int_env(os.getenv("AI_LEASE_TTL_SECONDS"), 300)
+AI_LEASE_POLL_INTERVAL = _parse_float_env(os.getenv("AI_LEASE_POLL_INTERVAL"), 0.5)
+
+# Idempotency-Key support: how long a completed response is replayed, how long an
+# in-progress request holds its key before another may take it over, and how long
+# a concurrent duplicate waits for the first request before getting 409
+IDEMPOTENCY_KEY_TTL_SECONDS = _parse_int_env(os.getenv("IDEMPOTENCY_KEY_TTL_SECONDS"), 86400)
+IDEMPOTENCY_LOCK_SECONDS = _parse_int_env(os.getenv("IDEMPOTENCY_LOCK_SECONDS"), 300)
+IDEMPOTENCY_WAIT_SECONDS = _parse_float_env(os.getenv("IDEMPOTENCY_WAIT_SECONDS"), 60.0)
+IDEMPOTENCY_POLL_INTERVAL = _parse_float_env(os.getenv("IDEMPOTENCY_POLL_INTERVAL"), 0.5)
+
+# Where GET /dashboard/metrics reads from: "rollup" (the per-user counters kept by
+# every action item write) or "live" (one grouped query over the user's action items)
+DASHBOARD_METRICS_SOURCE = os.getenv("DASHBOARD_METRICS_SOURCE", "rollup").strip().lower()
+# Seconds a user's dashboard metrics are served from memory (0 disables the cache).
+# Writes invalidate it within this worker; other workers catch up when it expires.
+DASHBOARD_CACHE_TTL_SECONDS = _parse_float_env(os.getenv("DASHBOARD_CACHE_TTL_SECONDS"), 5.0)
+
+# Long notes are analyzed map-reduce style: split into chunks of at most this many
+# estimated tokens (0 disables chunking) and analyzed with bounded concurrency
+ANALYSIS_CHUNK_TOKEN_BUDGET = _parse_int_env(os.getenv("ANALYSIS_CHUNK_TOKEN_BUDGET"), 6000)
+ANALYSIS_CHUNK_CONCURRENCY = _parse_int_env(os.getenv("ANALYSIS_CHUNK_CONCURRENCY"), 4)
+
+# Extracted action items that fail validation get one follow-up AI call that sends
+# only those items and their errors; whatever still fails is reported, not persisted
+EXTRACTION_REPAIR_ENABLED = _parse_bool_env(os.getenv("EXTRACTION_REPAIR_ENABLED"), True)
+
+# Batch (re)analysis: meetings in flight, meetings started per minute (0 = unlimited),
+# results per commit, and the largest batch the HTTP endpoint accepts
+BATCH_CONCURRENCY = _parse_int_env(os.getenv("BATCH_CONCURRENCY"), 8)
+BATCH_RATE_PER_MINUTE = _parse_float_env(os.getenv("BATCH_RATE_PER_MINUTE"), 0.0)
+BATCH_COMMIT_SIZE = _parse_int_env(os.getenv("BATCH_COMMIT_SIZE"), 25)
+BATCH_MAX_MEETINGS = _parse_int_env(os.getenv("BATCH_MAX_MEETINGS"), 1000)
+
+# Proactive OpenAI rate limiting (0 disables a budget). The bucket state lives in a
+# local SQLite file so every worker process on the host shares the same budget.
+OPENAI_RPM_LIMIT = _parse_float_env(os.getenv("OPENAI_RPM_LIMIT"), 0.0)
+OPENAI_TPM_LIMIT = _parse_float_env(os.getenv("OPENAI_TPM_LIMIT"), 0.0)
+OPENAI_RATE_LIMIT_DB = os.getenv(
+    "OPENAI_RATE_LIMIT_DB", os.path.join(tempfile.gettempdir(), "ami_meeting_svc_rate_limit.db")
+)
+# Completion tokens reserved per call until the response reports actual usage
+OPENAI_COMPLETION_TOKEN_ESTIMATE = _parse_int_env(os.getenv("OPENAI_COMPLETION_TOKEN_ESTIMATE"), 512)
+
+# OpenAI circuit breaker: open after this many consecutive upstream failures and
+# fail fast (503) for the recovery window before probing again
+OPENAI_CIRCUIT_FAILURE_THRESHOLD = _parse_int_env(os.getenv("OPENAI_CIRCUIT_FAILURE_THRESHOLD"), 5)
+OPENAI_CIRCUIT_RECOVERY_SECONDS = _parse_float_env(os.getenv("OPENAI_CIRCUIT_RECOVERY_SECONDS"), 30.0)
+# Total seconds one completion may spend across retries and backoff
+OPENAI_REQUEST_DEADLINE = _parse_float_env(os.getenv("OPENAI_REQUEST_DEADLINE"), 90.0)
+
+# AI call instrumentation (GET /monitoring/metrics). Prices are USD per million tokens
+# and only feed the cost estimates; models missing from the table are left unpriced.
+OPENAI_MODEL_PRICES = _parse_json_env(
+    os.getenv("OPENAI_MODEL_PRICES"),
+    {
+        "gpt-3.5-turbo": {"prompt": 0.50, "completion": 1.50},
+        "gpt-4o-mini": {"prompt": 0.15, "cached_prompt": 0.075, "completion": 0.60},
+        "gpt-4o": {"prompt": 2.50, "cached_prompt": 1.25, "completion": 10.00},
+    },
+)
+# Log one JSON line per AI call on the "ami_meeting_svc.ai_calls" logger
+AI_CALL_LOG_ENABLED = _parse_bool_env(os.getenv("AI_CALL_LOG_ENABLED"), True)
@@ -2,3 +2,10 @@ from .base import Base, get_db
 from .user import User
 from .meeting import Meeting
 from .action_item import ActionItem
+from .job import Job
+from .ai_cache_entry import AICacheEntry
+from .ai_lease import AILease
+from .idempotency_key import IdempotencyKey
+from .action_item_metric import ActionItemMetric
+from .action_item_daily_metric import ActionItemDailyMetric
+from .action_item_status_transition import ActionItemStatusTransition
@@ -1,11 +1,15 @@
 import sqlalchemy as sa
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Boolean, func
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Boolean, Index, func
 
 from .base import Base
 
 
 class ActionItem(Base):
     __tablename__ = "action_items"
+    __table_args__ = (
+        # Covers the per-owner dashboard aggregation: reached by meeting id, counted without touching the rows
+        Index("ix_action_items_meeting_id_assignee_status", "meeting_id", "assignee", "status", "is_overdue"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True, unique=True)
     meeting_id = Column(Integer, ForeignKey("meetings.id"), nullable=False)
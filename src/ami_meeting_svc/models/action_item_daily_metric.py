@@ -0,0 +1,31 @@
+import sqlalchemy as sa
+from sqlalchemy import Column, Date, Integer
+
+from .base import Base
+
+
+class ActionItemDailyMetric(Base):
+    """Per-owner action item activity for one UTC day, maintained on every write.
+
+    `created_count` and `completed_count` count the day's events (items added,
+    items moved to Done). The `*_delta` columns are the day's net change in the
+    number of items, Done items and overdue items, so summing them up to a day
+    gives the totals at the end of it. Adjusted alongside `action_item_metrics`
+    (see services/metrics_rollup.py).
+    """
+
+    __tablename__ = "action_item_daily_metrics"
+
+    owner_id = Column(Integer, primary_key=True)
+    day = Column(Date, primary_key=True)
+    created_count = Column(Integer, nullable=False, default=0, server_default=sa.text("0"))
+    completed_count = Column(Integer, nullable=False, default=0, server_default=sa.text("0"))
+    item_delta = Column(Integer, nullable=False, default=0, server_default=sa.text("0"))
+    done_delta = Column(Integer, nullable=False, default=0, server_default=sa.text("0"))
+    overdue_delta = Column(Integer, nullable=False, default=0, server_default=sa.text("0"))
+
+    def __repr__(self) -> str:
+        return (
+            f"<ActionItemDailyMetric(owner_id={self.owner_id}, day={self.day}, "
+            f"created_count={self.created_count}, completed_count={self.completed_count})>"
+        )
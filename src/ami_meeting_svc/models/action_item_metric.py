@@ -0,0 +1,30 @@
+import sqlalchemy as sa
+from sqlalchemy import Column, Integer, String
+
+from .base import Base
+
+# Stored in place of NULL so the key columns can form the primary key
+UNASSIGNED = ""
+
+
+class ActionItemMetric(Base):
+    """Per-owner action item counts by assignee and status, maintained on every write.
+
+    Rows are adjusted in the transaction that inserts, updates or deletes action
+    items (see services/metrics_rollup.py), so the dashboard reads these counts
+    instead of aggregating `action_items`.
+    """
+
+    __tablename__ = "action_item_metrics"
+
+    owner_id = Column(Integer, primary_key=True)
+    assignee = Column(String(255), primary_key=True, server_default=sa.text("''"))
+    status = Column(String(50), primary_key=True)
+    item_count = Column(Integer, nullable=False, default=0, server_default=sa.text("0"))
+    overdue_count = Column(Integer, nullable=False, default=0, server_default=sa.text("0"))
+
+    def __repr__(self) -> str:
+        return (
+            f"<ActionItemMetric(owner_id={self.owner_id}, assignee='{self.assignee}', "
+            f"status='{self.status}', item_count={self.item_count})>"
+        )
@@ -0,0 +1,38 @@
+import sqlalchemy as sa
+from sqlalchemy import Column, DateTime, Index, Integer, String, func
+
+from .base import Base
+
+
+class ActionItemStatusTransition(Base):
+    """One status change of an action item; rows are only ever appended.
+
+    Written in the transaction that creates an item (`from_status` NULL) or
+    changes its status (see services/metrics_rollup.py). Owner, assignee and
+    priority are copied from the item at the time of the change, so the
+    cycle-time analytics read this table alone. No foreign key to
+    `action_items`: the history outlives the item.
+    """
+
+    __tablename__ = "action_item_status_transitions"
+    __table_args__ = (
+        # The owner's completions in a date range
+        Index("ix_action_item_status_transitions_owner_status_changed", "owner_id", "to_status", "changed_at"),
+        # One item's history in order
+        Index("ix_action_item_status_transitions_item_changed", "action_item_id", "changed_at"),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    action_item_id = Column(Integer, nullable=False)
+    owner_id = Column(Integer, nullable=False)
+    assignee = Column(String(255), nullable=True)
+    priority = Column(String(50), nullable=False)
+    from_status = Column(String(50), nullable=True)
+    to_status = Column(String(50), nullable=False)
+    changed_at = Column(DateTime, nullable=False, default=func.now(), server_default=sa.text("CURRENT_TIMESTAMP"))
+
+    def __repr__(self) -> str:
+        return (
+            f"<ActionItemStatusTransition(action_item_id={self.action_item_id}, "
+            f"from_status='{self.from_status}', to_status='{self.to_status}')>"
+        )
@@ -0,0 +1,22 @@
+import sqlalchemy as sa
+from sqlalchemy import Column, String, DateTime, func
+from sqlalchemy import JSON as SAJSON
+
+from .base import Base
+
+
+class AICacheEntry(Base):
+    """Persistent tier of the AI result cache, keyed by a content hash of the request."""
+
+    __tablename__ = "ai_cache_entries"
+
+    cache_key = Column(String(64), primary_key=True)
+    kind = Column(String(50), nullable=False)
+    model = Column(String(255), nullable=False)
+    prompt_version = Column(String(50), nullable=False)
+    value = Column(SAJSON, nullable=False)
+    created_at = Column(DateTime, nullable=False, default=func.now(), server_default=sa.text('CURRENT_TIMESTAMP'), index=True)
+    expires_at = Column(DateTime, nullable=False, index=True)
+
+    def __repr__(self) -> str:
+        return f"<AICacheEntry(cache_key='{self.cache_key}', kind='{self.kind}')>"
@@ -0,0 +1,19 @@
+from sqlalchemy import JSON, Column, String, DateTime
+
+from .base import Base
+
+
+class AILease(Base):
+    """Cross-process lease held while one worker computes an AI result for a cache key."""
+
+    __tablename__ = "ai_leases"
+
+    lease_key = Column(String(64), primary_key=True)
+    holder = Column(String(64), nullable=False)
+    expires_at = Column(DateTime, nullable=False)
+    # Set once the holder has the result; waiters in other workers read it from here
+    completed_at = Column(DateTime, nullable=True)
+    result = Column(JSON, nullable=True)
+
+    def __repr__(self) -> str:
+        return f"<AILease(lease_key='{self.lease_key}', holder='{self.holder}')>"
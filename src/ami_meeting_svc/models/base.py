@@ -1,19 +1,105 @@
+import threading
+import time
+from typing import Any, Dict
+
 from sqlalchemy import Column, PrimaryKeyConstraint, String
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, exc
+from sqlalchemy.engine import Engine, make_url
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import scoped_session, sessionmaker, Session
+from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.pool import QueuePool
 
-from ami_meeting_svc.config import DATABASE_URL
+from ami_meeting_svc.config import (
+    DATABASE_URL,
+    DB_MAX_OVERFLOW,
+    DB_POOL_PRE_PING,
+    DB_POOL_RECYCLE,
+    DB_POOL_SIZE,
+    DB_POOL_TIMEOUT,
+)
 
 Base = declarative_base()
 
-engine = create_engine(DATABASE_URL)
+
+class MonitoredQueuePool(QueuePool):
+    """QueuePool that also counts checkouts which had to wait for a connection.
+
+    SQLAlchemy exposes size/checked-in/checked-out/overflow but not contention,
+    which is what tells us the pool is too small for the traffic.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._stats_lock = threading.Lock()
+        self.waits = 0
+        self.wait_seconds = 0.0
+        self.timeouts = 0
+
+    def _do_get(self):
+        at_capacity = (
+            self._max_overflow > -1
+            and self.checkedin() == 0
+            and self.overflow() >= self._max_overflow
+        )
+        if not at_capacity:
+            return super()._do_get()
+
+        start = time.monotonic()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            with self._stats_lock:
+                self.timeouts += 1
+            raise
+        finally:
+            with self._stats_lock:
+                self.waits += 1
+                self.wait_seconds += time.monotonic() - start
+
+
+def _engine_kwargs(database_url: str) -> Dict[str, Any]:
+    url = make_url(database_url)
+    kwargs: Dict[str, Any] = {"pool_pre_ping": DB_POOL_PRE_PING, "pool_recycle": DB_POOL_RECYCLE}
+    if url.get_backend_name() == "sqlite":
+        # Sync routes and dependencies run in FastAPI's threadpool, so a session's
+        # connection may be used from a different thread than the one that opened it.
+        kwargs["connect_args"] = {"check_same_thread": False}
+        if url.database in (None, "", ":memory:"):
+            # In-memory databases keep SQLAlchemy's default single-connection pool
+            return kwargs
+    kwargs.update(
+        poolclass=MonitoredQueuePool,
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_timeout=DB_POOL_TIMEOUT,
+    )
+    return kwargs
+
+
+engine = create_engine(DATABASE_URL, **_engine_kwargs(DATABASE_URL))
 SessionLocal = sessionmaker(bind=engine)
 
 
+def get_pool_stats(bind: Engine | None = None) -> Dict[str, Any]:
+    """Return a snapshot of connection pool usage for monitoring."""
+    pool = (bind or engine).pool
+    stats: Dict[str, Any] = {"pool_class": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        stats.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=max(pool.overflow(), 0),
+        )
+    if isinstance(pool, MonitoredQueuePool):
+        with pool._stats_lock:
+            stats.update(waits=pool.waits, wait_seconds=round(pool.wait_seconds, 6), timeouts=pool.timeouts)
+    return stats
+
+
 def get_db() -> Session:
-    session = scoped_session(sessionmaker(bind=engine))
+    session = SessionLocal()
     try:
         yield session
     finally:
-        session.close()
\ No newline at end of file
+        session.close()
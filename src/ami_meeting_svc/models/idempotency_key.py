@@ -0,0 +1,29 @@
+import sqlalchemy as sa
+from sqlalchemy import Column, DateTime, Integer, String, func
+from sqlalchemy import JSON as SAJSON
+
+from .base import Base
+
+
+class IdempotencyKey(Base):
+    """A client's Idempotency-Key: the request it was first used for and, once done, its response."""
+
+    __tablename__ = "idempotency_keys"
+
+    # sha256 of the owner id and the header value, so keys never collide across users
+    key_hash = Column(String(64), primary_key=True)
+    owner_id = Column(Integer, nullable=False)
+    # sha256 of method, path and body; a reused key must come with the same request
+    fingerprint = Column(String(64), nullable=False)
+    status = Column(String(20), nullable=False, default="in_progress")
+    holder = Column(String(64), nullable=True)
+    response_status = Column(Integer, nullable=True)
+    response_body = Column(SAJSON, nullable=True)
+    response_headers = Column(SAJSON, nullable=True)
+    created_at = Column(DateTime, nullable=False, default=func.now(), server_default=sa.text('CURRENT_TIMESTAMP'))
+    # An in-progress claim older than this is considered abandoned and can be taken over
+    locked_until = Column(DateTime, nullable=False)
+    expires_at = Column(DateTime, nullable=False, index=True)
+
+    def __repr__(self) -> str:
+        return f"<IdempotencyKey(key_hash='{self.key_hash}', status='{self.status}')>"
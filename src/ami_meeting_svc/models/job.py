@@ -0,0 +1,27 @@
+import sqlalchemy as sa
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, func
+from sqlalchemy import JSON as SAJSON
+
+from .base import Base
+
+
+class Job(Base):
+    """Background AI job (analyze / extract_actions) processed by the in-process worker pool."""
+
+    __tablename__ = "jobs"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    kind = Column(String(50), nullable=False)
+    meeting_id = Column(Integer, ForeignKey("meetings.id"), nullable=False, index=True)
+    owner_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    # queued -> running -> succeeded | failed
+    status = Column(String(20), nullable=False, default="queued", server_default=sa.text("'queued'"), index=True)
+    result = Column(SAJSON, nullable=True)
+    error = Column(String(1024), nullable=True)
+    attempts = Column(Integer, nullable=False, default=0, server_default=sa.text("0"))
+    created_at = Column(DateTime, nullable=False, default=func.now(), server_default=sa.text('CURRENT_TIMESTAMP'))
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+
+    def __repr__(self) -> str:
+        return f"<Job(id={self.id}, kind='{self.kind}', status='{self.status}')>"
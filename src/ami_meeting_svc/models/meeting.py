@@ -1,5 +1,5 @@
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, func
+from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Index, func
 from sqlalchemy import JSON as SAJSON
 
 from .base import Base
@@ -7,6 +7,10 @@ from .base import Base
 
 class Meeting(Base):
     __tablename__ = "meetings"
+    __table_args__ = (
+        # An owner's meeting ids straight from the index (dashboard joins, meeting lists)
+        Index("ix_meetings_owner_id_id", "owner_id", "id"),
+    )
 
     id: int = Column(Integer, primary_key=True, autoincrement=True, unique=True)
     owner_id: int = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -16,6 +20,8 @@ class Meeting(Base):
     notes: str = Column(Text, nullable=False)
     # New analysis_result column to store AI analysis output
     analysis_result: dict = Column(SAJSON, nullable=True)
+    # How the stored AI results were produced, per task: model, prompt version, estimated tokens
+    analysis_meta: dict = Column(SAJSON, nullable=True)
     created_at = Column(DateTime, server_default=func.now(), nullable=False)
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now(), nullable=False)
 
@@ -0,0 +1,307 @@
+import argparse
+import asyncio
+import hashlib
+import json
+import logging
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+from ami_meeting_svc.services import prompts
+from ami_meeting_svc.services.chunking import estimate_tokens
+
+
+# Local stand-in for the OpenAI chat completions API, for load, latency and retry
+# testing without network access or cost. Point the service at it with
+#   OPENAI_BASE_URL=http://localhost:8001/v1 OPENAI_API_KEY=stub
+# Replies are deterministic JSON shaped like the analysis, incremental analysis,
+# extraction, extraction repair, combined and summary-merge responses (derived
+# from the notes), so every AI endpoint persists valid results. Latency and
+# 429/500 injection are configurable.
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+_PRIORITIES = ("High", "Medium", "Low")
+_ACTION_HINT = re.compile(r"\b(will|todo|action|needs? to|should|must|follow up)\b", re.IGNORECASE)
+_DECISION_HINT = re.compile(r"\b(decid\w*|agree\w*|approv\w*|settled)\b", re.IGNORECASE)
+_SPEAKER = re.compile(r"^\s*(?:\[[^\]]*\]\s*)?([A-Z][\w .'-]{0,40}):\s*(.*)$")
+
+
+@dataclass
+class StubSettings:
+    # Time to first token: log-normal around the median (sigma 0 = fixed)
+    latency_ms: float = 200.0
+    latency_sigma: float = 0.0
+    # Extra time per completion token (spread across the chunks when streaming)
+    token_ms: float = 0.0
+    # Fraction of requests answered with 429 (with Retry-After) or 500
+    rate_limit_ratio: float = 0.0
+    error_ratio: float = 0.0
+    retry_after: float = 1.0
+    # Seeds latency and error injection so runs are reproducible
+    seed: Optional[int] = None
+
+
+@dataclass
+class _StubState:
+    rng: random.Random
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    seen_prefixes: set = field(default_factory=set)
+    counters: Dict[str, int] = field(
+        default_factory=lambda: {"requests": 0, "rate_limited": 0, "errors": 0, "streams": 0}
+    )
+
+
+def _notes_of(user_message: str) -> str:
+    marker = "Meeting notes:\n"
+    index = user_message.rfind(marker)
+    return user_message[index + len(marker):] if index >= 0 else user_message
+
+
+def _lines(notes: str) -> List[str]:
+    return [" ".join(line.split()) for line in notes.splitlines() if line.strip()]
+
+
+def _shorten(text: str, limit: int) -> str:
+    return text if len(text) <= limit else text[: limit - 3].rstrip() + "..."
+
+
+def _analysis_payload(notes: str) -> Dict[str, Any]:
+    lines = _lines(notes)
+    first = _shorten(lines[0], 120) if lines else "no content"
+    return {
+        "summary": f"Meeting of {len(lines)} lines. It opened with: {first}",
+        "key_discussion_points": [_shorten(line, 80) for line in lines[:3]],
+        "decisions": [_shorten(line, 100) for line in lines if _DECISION_HINT.search(line)][:3],
+    }
+
+
+def _incremental_payload(user_message: str) -> Dict[str, Any]:
+    head, _, appended = user_message.partition("\n\nMeeting notes appended since:\n")
+    try:
+        previous = json.loads(head.partition("\n")[2])
+    except ValueError:
+        previous = {}
+    update = _analysis_payload(appended)
+    return {
+        "summary": f"{previous.get('summary', '')} Then: {update['summary']}".strip(),
+        "key_discussion_points": list(previous.get("key_discussion_points") or []) + update["key_discussion_points"],
+        "decisions": list(previous.get("decisions") or []) + update["decisions"],
+    }
+
+
+def _action_items_payload(notes: str) -> List[Dict[str, Any]]:
+    lines = _lines(notes)
+    candidates = [line for line in lines if _ACTION_HINT.search(line)][:5] or lines[:1]
+    items = []
+    for line in candidates:
+        match = _SPEAKER.match(line)
+        assignee, description = (match.group(1), match.group(2) or line) if match else (None, line)
+        digest = hashlib.sha256(line.encode("utf8")).digest()
+        items.append(
+            {
+                "description": _shorten(description, 200),
+                "assignee": assignee,
+                "priority": _PRIORITIES[digest[0] % len(_PRIORITIES)],
+                "deadline": None,
+            }
+        )
+    return items
+
+
+def _repair_payload(user_message: str) -> List[Dict[str, Any]]:
+    _, _, listing = user_message.partition("Action items that failed validation:\n")
+    try:
+        rejected = json.loads(listing)
+    except ValueError:
+        rejected = []
+    items = []
+    for entry in rejected:
+        item = entry.get("item") if isinstance(entry, dict) else None
+        item = item if isinstance(item, dict) else {"description": str(item or "")}
+        priority = str(item.get("priority") or "").strip().title()
+        items.append(
+            {
+                "description": str(item.get("description") or "Follow up on the meeting").strip(),
+                "assignee": item.get("assignee"),
+                "priority": priority if priority in _PRIORITIES else "Medium",
+                "deadline": None,
+            }
+        )
+    return items
+
+
+def _reply_content(system_message: str, user_message: str, json_mode: bool) -> str:
+    """Pick the reply shape from the prompt template that produced the request."""
+    notes = _notes_of(user_message)
+    if system_message == prompts.SUMMARY_MERGE.system:
+        parts = len(re.findall(r"^\d+\. ", user_message, re.MULTILINE))
+        payload: Dict[str, Any] = {"summary": f"Merged summary of {parts} parts."}
+    elif system_message == prompts.EXTRACTION.system:
+        payload = {"action_items": _action_items_payload(notes)}
+    elif system_message == prompts.EXTRACTION_REPAIR.system:
+        payload = {"action_items": _repair_payload(user_message)}
+    elif system_message == prompts.INCREMENTAL_ANALYSIS.system:
+        payload = _incremental_payload(user_message)
+    elif system_message == prompts.COMBINED.system:
+        payload = dict(_analysis_payload(notes), action_items=_action_items_payload(notes))
+    elif system_message == prompts.ANALYSIS.system or json_mode:
+        payload = _analysis_payload(notes)
+    else:
+        return f"Stub reply to a {estimate_tokens(user_message)}-token prompt."
+    return json.dumps(payload)
+
+
+def _usage(state: _StubState, system_message: str, prompt_tokens: int, content: str) -> Dict[str, Any]:
+    # Mimic the provider's prompt cache: a system prefix of 1024+ tokens seen
+    # before is served from cache in 128-token increments
+    system_tokens = estimate_tokens(system_message)
+    with state.lock:
+        cached = system_message in state.seen_prefixes
+        state.seen_prefixes.add(system_message)
+    cached_tokens = (system_tokens // 128) * 128 if cached and system_tokens >= 1024 else 0
+    completion_tokens = estimate_tokens(content)
+    return {
+        "prompt_tokens": prompt_tokens,
+        "completion_tokens": completion_tokens,
+        "total_tokens": prompt_tokens + completion_tokens,
+        "prompt_tokens_details": {"cached_tokens": cached_tokens},
+    }
+
+
+def _error(status_code: int, message: str, error_type: str, headers: Dict[str, str] | None = None) -> JSONResponse:
+    body = {"error": {"message": message, "type": error_type, "param": None, "code": None}}
+    return JSONResponse(status_code=status_code, content=body, headers=headers)
+
+
+def _chunks(content: str, size: int = 16) -> List[str]:
+    return [content[i:i + size] for i in range(0, len(content), size)] or [""]
+
+
+def create_app(settings: StubSettings | None = None) -> FastAPI:
+    settings = settings or StubSettings()
+    state = _StubState(rng=random.Random(settings.seed))
+    app = FastAPI(title="OpenAI stub")
+
+    def first_token_delay() -> float:
+        with state.lock:
+            if settings.latency_sigma > 0:
+                return state.rng.lognormvariate(0.0, settings.latency_sigma) * settings.latency_ms / 1000
+            return settings.latency_ms / 1000
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        body = await request.json()
+        messages = body.get("messages") or []
+        model = body.get("model") or "stub-model"
+        with state.lock:
+            state.counters["requests"] += 1
+            request_number = state.counters["requests"]
+            roll = state.rng.random()
+
+        if roll < settings.rate_limit_ratio:
+            with state.lock:
+                state.counters["rate_limited"] += 1
+            return _error(
+                429, "Rate limit reached (stub)", "requests", headers={"Retry-After": f"{settings.retry_after:g}"}
+            )
+        if roll < settings.rate_limit_ratio + settings.error_ratio:
+            with state.lock:
+                state.counters["errors"] += 1
+            await asyncio.sleep(first_token_delay())
+            return _error(500, "The server had an error (stub)", "server_error")
+
+        system_message = next((m.get("content") or "" for m in messages if m.get("role") == "system"), "")
+        user_message = next((m.get("content") or "" for m in reversed(messages) if m.get("role") == "user"), "")
+        json_mode = (body.get("response_format") or {}).get("type") == "json_object"
+        content = _reply_content(system_message, user_message, json_mode)
+        prompt_tokens = estimate_tokens("".join(m.get("content") or "" for m in messages))
+        usage = _usage(state, system_message, prompt_tokens, content)
+        completion_id = f"chatcmpl-stub-{request_number}"
+        created = int(time.time())
+        delay = first_token_delay()
+
+        if not body.get("stream"):
+            await asyncio.sleep(delay + usage["completion_tokens"] * settings.token_ms / 1000)
+            return {
+                "id": completion_id,
+                "object": "chat.completion",
+                "created": created,
+                "model": model,
+                "choices": [
+                    {"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}
+                ],
+                "usage": usage,
+            }
+
+        include_usage = bool((body.get("stream_options") or {}).get("include_usage"))
+        with state.lock:
+            state.counters["streams"] += 1
+
+        async def events():
+            def chunk(choices: list, **extra) -> str:
+                payload = {
+                    "id": completion_id, "object": "chat.completion.chunk", "created": created,
+                    "model": model, "choices": choices, **extra,
+                }
+                return f"data: {json.dumps(payload)}\n\n"
+
+            await asyncio.sleep(delay)
+            for piece in _chunks(content):
+                await asyncio.sleep(estimate_tokens(piece) * settings.token_ms / 1000)
+                yield chunk([{"index": 0, "delta": {"role": "assistant", "content": piece}, "finish_reason": None}])
+            yield chunk([{"index": 0, "delta": {}, "finish_reason": "stop"}])
+            if include_usage:
+                yield chunk([], usage=usage)
+            yield "data: [DONE]\n\n"
+
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+    @app.get("/stub/stats")
+    async def stats():
+        with state.lock:
+            return dict(state.counters)
+
+    return app
+
+
+def _parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    defaults = StubSettings()
+    parser = argparse.ArgumentParser(description="Serve a local OpenAI-compatible chat completions stub.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument("--latency-ms", type=float, default=defaults.latency_ms, help="median time to first token")
+    parser.add_argument("--latency-sigma", type=float, default=defaults.latency_sigma, help="log-normal sigma (0 = fixed)")
+    parser.add_argument("--token-ms", type=float, default=defaults.token_ms, help="extra milliseconds per completion token")
+    parser.add_argument("--rate-limit-ratio", type=float, default=defaults.rate_limit_ratio, help="fraction answered 429")
+    parser.add_argument("--error-ratio", type=float, default=defaults.error_ratio, help="fraction answered 500")
+    parser.add_argument("--retry-after", type=float, default=defaults.retry_after, help="Retry-After seconds on 429")
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = _parse_args(argv)
+    settings = StubSettings(
+        latency_ms=args.latency_ms,
+        latency_sigma=args.latency_sigma,
+        token_ms=args.token_ms,
+        rate_limit_ratio=args.rate_limit_ratio,
+        error_ratio=args.error_ratio,
+        retry_after=args.retry_after,
+        seed=args.seed,
+    )
+    logger.info("OpenAI stub listening on http://%s:%s/v1 (%s)", args.host, args.port, settings)
+    uvicorn.run(create_app(settings), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
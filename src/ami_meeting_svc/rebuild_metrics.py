@@ -0,0 +1,45 @@
+import argparse
+import json
+import logging
+import sys
+from typing import List, Optional
+
+from sqlalchemy.orm import Session
+
+from ami_meeting_svc.models.base import engine
+from ami_meeting_svc.services.metrics_rollup import rebuild_daily_metrics, rebuild_metrics
+
+
+# Logs go to stderr; the summary line goes to stdout
+logging.basicConfig(level=logging.INFO, stream=sys.stderr)
+logger = logging.getLogger(__name__)
+
+
+def _parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Recompute the dashboard counters (action_item_metrics) from the action items."
+    )
+    parser.add_argument("--owner-id", type=int, help="only rebuild this user's counters (default: every user)")
+    parser.add_argument(
+        "--daily",
+        action="store_true",
+        help="also replace the daily rollups (action_item_daily_metrics) with an approximate backfill",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = _parse_args(argv)
+    try:
+        with Session(bind=engine) as db:
+            rows = rebuild_metrics(db, owner_id=args.owner_id)
+            daily_rows = rebuild_daily_metrics(db, owner_id=args.owner_id) if args.daily else None
+    except Exception as e:
+        logger.error(e, exc_info=True)
+        return 1
+    print(json.dumps({"owner_id": args.owner_id, "metric_rows": rows, "daily_rows": daily_rows}), flush=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
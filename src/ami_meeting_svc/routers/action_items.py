@@ -18,7 +18,7 @@ action_items_router = APIRouter(tags=["action-items"])
 
 
 @action_items_router.patch("/{action_item_id}", response_model=ActionItemResponse)
-async def update_action_item(
+def update_action_item(
     action_item_id: int, payload: ActionItemUpdate, db: Session = Depends(get_db)
 ) -> ActionItem:
     try:
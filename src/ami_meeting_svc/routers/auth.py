@@ -23,7 +23,7 @@ auth_router = APIRouter(prefix="/auth", tags=["auth"])
 
 
 @auth_router.post("/login", response_model=Token)
-async def login(login: UserLogin, response: Response, db: Session = Depends(get_db)) -> Token:
+def login(login: UserLogin, response: Response, db: Session = Depends(get_db)) -> Token:
     try:
         stmt = select(User).where(User.username == login.username)
         user = db.execute(stmt).scalar_one_or_none()
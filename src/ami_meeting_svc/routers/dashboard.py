@@ -1,29 +1,111 @@
 from __future__ import annotations
 
 import logging
-from fastapi import APIRouter, Depends, HTTPException, status
+from datetime import date, datetime, timedelta
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session
 
 from ami_meeting_svc.models.base import get_db
 from ami_meeting_svc.models import User
 from ami_meeting_svc.utils.security import get_current_user
-from ami_meeting_svc.services.dashboard_service import get_dashboard_metrics
-from ami_meeting_svc.schemas.dashboard import DashboardMetrics
+from ami_meeting_svc.services.cycle_times import get_cycle_times
+from ami_meeting_svc.services.dashboard_cache import dashboard_cache
+from ami_meeting_svc.services.dashboard_service import (
+    MAX_TIMESERIES_DAYS,
+    get_dashboard_metrics,
+    get_dashboard_timeseries,
+)
+from ami_meeting_svc.schemas.dashboard import (
+    CycleTimeGroupBy,
+    CycleTimeReport,
+    DashboardMetrics,
+    DashboardTimeseries,
+    Granularity,
+)
 
 logger = logging.getLogger(__name__)
 
 dashboard_router = APIRouter()
 
+# Per-user data: browsers may keep it but must revalidate, shared caches must not store it
+_CACHE_CONTROL = "private, no-cache"
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        # If-None-Match compares weakly
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
 
 @dashboard_router.get("/metrics", response_model=DashboardMetrics)
-async def metrics(
-    current_user: User = Depends(get_current_user), db: Session = Depends(get_db)
-) -> DashboardMetrics:
+def metrics(
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
     try:
-        result = get_dashboard_metrics(db)
-        return result
+        cached = dashboard_cache.get(current_user.id, lambda: get_dashboard_metrics(db, current_user.id))
     except HTTPException:
         raise
     except Exception as e:
         logger.error(e, exc_info=True)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to compute dashboard metrics")
+
+    headers = {"ETag": cached.etag, "Cache-Control": _CACHE_CONTROL}
+    if _etag_matches(if_none_match, cached.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+    return cached.metrics
+
+
+@dashboard_router.get("/timeseries", response_model=DashboardTimeseries)
+def timeseries(
+    start: Optional[date] = Query(None, description="First day (UTC), default 29 days before `end`"),
+    end: Optional[date] = Query(None, description="Last day (UTC), default today"),
+    granularity: Granularity = Query("day"),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+) -> DashboardTimeseries:
+    end = end or datetime.utcnow().date()
+    start = start or end - timedelta(days=29)
+    if start > end:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="start must not be after end")
+    if (end - start).days + 1 > MAX_TIMESERIES_DAYS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Date range must not exceed {MAX_TIMESERIES_DAYS} days",
+        )
+    try:
+        return get_dashboard_timeseries(db, current_user.id, start, end, granularity)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(e, exc_info=True)
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to compute dashboard timeseries")
+
+
+@dashboard_router.get("/cycle-times", response_model=CycleTimeReport)
+def cycle_times(
+    group_by: CycleTimeGroupBy = Query("assignee"),
+    start: Optional[date] = Query(None, description="Earliest completion day (UTC)"),
+    end: Optional[date] = Query(None, description="Latest completion day (UTC)"),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+) -> CycleTimeReport:
+    if start is not None and end is not None and start > end:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="start must not be after end")
+    try:
+        return get_cycle_times(db, current_user.id, group_by, start, end)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(e, exc_info=True)
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to compute cycle times")
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import logging
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from ami_meeting_svc.models import Job, User
+from ami_meeting_svc.models.base import get_db
+from ami_meeting_svc.schemas.job import JobResponse
+from ami_meeting_svc.utils.security import get_current_user
+
+logger = logging.getLogger(__name__)
+
+jobs_router = APIRouter(tags=["jobs"])
+
+
+@jobs_router.get("/{job_id}", response_model=JobResponse)
+def get_job(
+    job_id: int, current_user: User = Depends(get_current_user), db: Session = Depends(get_db)
+) -> Job:
+    try:
+        stmt = select(Job).where(Job.id == job_id, Job.owner_id == current_user.id)
+        job = db.execute(stmt).scalar_one_or_none()
+    except Exception as e:
+        logger.error(e, exc_info=True)
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error")
+
+    if job is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found")
+    return job
@@ -2,47 +2,93 @@ from __future__ import annotations
 
 import json
 import logging
-from typing import List
-from datetime import datetime, timedelta, timezone
+from contextlib import aclosing
+from typing import AsyncIterator, List
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import JSONResponse, StreamingResponse
 from sqlalchemy import select
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
-from ami_meeting_svc.models import Meeting, User, ActionItem
+from ami_meeting_svc import config
+from ami_meeting_svc.models import Meeting, User
 from ami_meeting_svc.models.base import get_db
 from ami_meeting_svc.schemas.meeting import (
+    AnalyzeAndExtractResponse,
+    BatchAnalyzeRequest,
     MeetingCreate,
     MeetingResponse,
 )
 from ami_meeting_svc.schemas.action_item import ActionItemCreate, ActionItemResponse
+from ami_meeting_svc.schemas.job import JobResponse
 from ami_meeting_svc.utils.security import get_current_user
 from ami_meeting_svc.services.ai_service import OpenAIService
+from ami_meeting_svc.services.batch_analysis import run_batch_analysis, select_meetings
+from ami_meeting_svc.services.idempotency import IdempotentRequest, idempotency
+from ami_meeting_svc.services.job_queue import (
+    JOB_KIND_ANALYZE,
+    JOB_KIND_ANALYZE_AND_EXTRACT,
+    JOB_KIND_EXTRACT_ACTIONS,
+    enqueue_job,
+    job_queue,
+    mark_job_failed,
+)
+from ami_meeting_svc.services.meeting_ai import (
+    analyze_and_extract_meeting,
+    analyze_meeting_notes,
+    extract_meeting_actions,
+    require_notes,
+    stream_meeting_analysis,
+)
 
 logger = logging.getLogger(__name__)
 
 meetings_router = APIRouter(tags=["meetings"])
 
 
+# Blocking ORM helper. Routes that also await the AI service stay `async def`
+# and push it into the threadpool so queries never stall the event loop.
+def _get_owned_meeting(db: Session, meeting_id: int, owner_id: int) -> Meeting | None:
+    stmt = select(Meeting).where(Meeting.id == meeting_id, Meeting.owner_id == owner_id)
+    return db.execute(stmt).scalar_one_or_none()
+
+
+def _create_meeting(db: Session, owner_id: int, payload: MeetingCreate) -> Meeting:
+    meeting = Meeting(owner_id=owner_id, **payload.model_dump())
+    db.add(meeting)
+    db.commit()
+    db.refresh(meeting)
+    return meeting
+
+
+def _meeting_response(meeting: Meeting, status_code: int = status.HTTP_200_OK) -> JSONResponse:
+    content = MeetingResponse.model_validate(meeting).model_dump(mode="json")
+    return JSONResponse(status_code=status_code, content=content)
+
+
+# Routes accepting an Idempotency-Key build their JSONResponse themselves, so the
+# exact response can be stored and replayed (see services/idempotency.py).
 @meetings_router.post("/", response_model=MeetingResponse, status_code=status.HTTP_201_CREATED)
 async def create_meeting(
     payload: MeetingCreate,
+    idempotent: IdempotentRequest = Depends(idempotency),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
-) -> Meeting:
-    try:
-        meeting = Meeting(owner_id=current_user.id, **payload.model_dump())
-        db.add(meeting)
-        db.commit()
-        db.refresh(meeting)
-        return meeting
-    except Exception as e:
-        logger.error(e, exc_info=True)
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error")
+) -> Response:
+    async def create() -> Response:
+        try:
+            meeting = await run_in_threadpool(_create_meeting, db, current_user.id, payload)
+        except Exception as e:
+            logger.error(e, exc_info=True)
+            raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error")
+        return _meeting_response(meeting, status.HTTP_201_CREATED)
+
+    return await idempotent.run(create)
 
 
 @meetings_router.get("/", response_model=List[MeetingResponse])
-async def list_meetings(
+def list_meetings(
     current_user: User = Depends(get_current_user), db: Session = Depends(get_db)
 ) -> List[Meeting]:
     try:
@@ -54,13 +100,65 @@ async def list_meetings(
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error")
 
 
+@meetings_router.post("/batch-analyze", response_class=StreamingResponse)
+async def batch_analyze(
+    payload: BatchAnalyzeRequest,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+) -> StreamingResponse:
+    """(Re)analyze many meetings, streaming one NDJSON progress event per line."""
+    max_meetings = config.BATCH_MAX_MEETINGS
+    if payload.meeting_ids is not None and len(payload.meeting_ids) > max_meetings:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=f"At most {max_meetings} meetings per batch"
+        )
+
+    bind = db.get_bind()
+    try:
+        meetings = await run_in_threadpool(
+            select_meetings,
+            bind,
+            owner_id=current_user.id,
+            meeting_ids=payload.meeting_ids,
+            only_unanalyzed=payload.only_unanalyzed,
+            date_from=payload.date_from,
+            date_to=payload.date_to,
+            limit=min(payload.limit or max_meetings, max_meetings),
+        )
+    except Exception as e:
+        logger.error(e, exc_info=True)
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error")
+
+    not_found: List[int] = []
+    if payload.meeting_ids is not None:
+        found = {meeting_id for meeting_id, _ in meetings}
+        not_found = [meeting_id for meeting_id in dict.fromkeys(payload.meeting_ids) if meeting_id not in found]
+
+    async def stream() -> AsyncIterator[str]:
+        events = run_batch_analysis(
+            bind,
+            meetings,
+            OpenAIService,
+            concurrency=config.BATCH_CONCURRENCY,
+            rate_per_minute=config.BATCH_RATE_PER_MINUTE,
+            commit_size=config.BATCH_COMMIT_SIZE,
+            not_found=not_found,
+        )
+        # Close the generator as soon as the client goes away, so the results it has
+        # computed are saved now rather than whenever it is garbage-collected
+        async with aclosing(events):
+            async for event in events:
+                yield json.dumps(event, default=str) + "\n"
+
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
+
+
 @meetings_router.get("/{meeting_id}", response_model=MeetingResponse)
-async def get_meeting(
+def get_meeting(
     meeting_id: int, current_user: User = Depends(get_current_user), db: Session = Depends(get_db)
 ) -> Meeting:
     try:
-        stmt = select(Meeting).where(Meeting.id == meeting_id, Meeting.owner_id == current_user.id)
-        meeting = db.execute(stmt).scalar_one_or_none()
+        meeting = _get_owned_meeting(db, meeting_id, current_user.id)
         if meeting is None:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Meeting not found")
         return meeting
@@ -71,54 +169,137 @@ async def get_meeting(
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error")
 
 
-@meetings_router.post("/{meeting_id}/analyze", response_model=MeetingResponse)
+async def _enqueue(db: Session, kind: str, meeting: Meeting, owner_id: int) -> JSONResponse:
+    try:
+        job = await run_in_threadpool(enqueue_job, db, kind, meeting.id, owner_id)
+    except Exception as e:
+        logger.error(e, exc_info=True)
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to enqueue job")
+    try:
+        job_queue.submit(job.id, db.get_bind())
+    except Exception as e:
+        logger.error(e, exc_info=True)
+        # The row is committed; fail it rather than leave it queued with no worker on it
+        try:
+            await run_in_threadpool(mark_job_failed, db, job.id, "Failed to enqueue job")
+        except Exception as e:
+            logger.error(e, exc_info=True)
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to enqueue job")
+    body = JobResponse.model_validate(job).model_dump(mode="json")
+    return JSONResponse(
+        status_code=status.HTTP_202_ACCEPTED, content=body, headers={"Location": f"/jobs/{job.id}"}
+    )
+
+
+@meetings_router.post(
+    "/{meeting_id}/analyze",
+    response_model=MeetingResponse,
+    responses={status.HTTP_202_ACCEPTED: {"model": JobResponse}},
+)
 async def analyze_meeting(
-    meeting_id: int, current_user: User = Depends(get_current_user), db: Session = Depends(get_db)
-) -> Meeting:
+    meeting_id: int,
+    run_async: bool = Query(False, alias="async"),
+    idempotent: IdempotentRequest = Depends(idempotency),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+) -> Response:
     try:
         # Fetch meeting and ensure ownership
-        stmt = select(Meeting).where(Meeting.id == meeting_id, Meeting.owner_id == current_user.id)
-        meeting = db.execute(stmt).scalar_one_or_none()
+        meeting = await run_in_threadpool(_get_owned_meeting, db, meeting_id, current_user.id)
         if meeting is None:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Meeting not found")
 
-        # Validate notes
-        notes = meeting.notes or ""
-        if not notes.strip():
-            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Meeting notes are empty")
-
-        # Build prompt for AI
-        prompt = (
-            "Analyze the following meeting notes and return a single JSON object with keys: "
-            "summary (short text), key_discussion_points (array of key bullet points), "
-            "decisions (array of decisions). Return only the JSON object, no explanatory text, no markdown.\n\n"
-            f"Meeting notes:\n{notes}"
-        )
+        require_notes(meeting)
 
-        # Call OpenAI service in json mode
-        try:
-            ai_service = OpenAIService()
-            result = ai_service.get_completion(prompt=prompt, json_mode=True)
-        except HTTPException:
-            raise
-        except Exception as e:
-            logger.error(e, exc_info=True)
-            raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="AI service error")
+        async def analyze() -> Response:
+            if run_async:
+                return await _enqueue(db, JOB_KIND_ANALYZE, meeting, current_user.id)
+            return _meeting_response(await analyze_meeting_notes(db, meeting, OpenAIService))
 
-        if not isinstance(result, dict):
-            logger.error("AI returned non-dict result: %s", type(result))
-            raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Invalid AI response format")
+        return await idempotent.run(analyze)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(e, exc_info=True)
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Unexpected error")
+
+
+def _sse(event: str, data: object) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
 
-        # Persist analysis result
+
+@meetings_router.post("/{meeting_id}/analyze/stream", response_class=StreamingResponse)
+async def analyze_meeting_stream(
+    meeting_id: int,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+) -> StreamingResponse:
+    """Server-Sent Events variant of analyze: model output is streamed as it is generated."""
+    try:
+        meeting = await run_in_threadpool(_get_owned_meeting, db, meeting_id, current_user.id)
+    except Exception as e:
+        logger.error(e, exc_info=True)
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error")
+    if meeting is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Meeting not found")
+    notes = require_notes(meeting)
+    bind = db.get_bind()
+
+    async def stream() -> AsyncIterator[str]:
         try:
-            meeting.analysis_result = result
-            db.add(meeting)
-            db.commit()
-            db.refresh(meeting)
-            return meeting
+            async for event, data in stream_meeting_analysis(bind, meeting_id, notes, OpenAIService):
+                if event == "delta":
+                    yield _sse("delta", {"text": data})
+                elif event == "result":
+                    yield _sse("result", MeetingResponse.model_validate(data).model_dump(mode="json"))
+                else:
+                    yield _sse(event, data)
+        except HTTPException as e:
+            # Headers are already sent, so failures are reported in-band
+            yield _sse("error", {"status_code": e.status_code, "detail": e.detail, "headers": e.headers or {}})
         except Exception as e:
             logger.error(e, exc_info=True)
-            raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error")
+            yield _sse("error", {"status_code": 500, "detail": "Unexpected error", "headers": {}})
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        # Keep proxies from buffering the stream
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@meetings_router.post(
+    "/{meeting_id}/extract-actions",
+    response_model=List[ActionItemResponse],
+    responses={status.HTTP_202_ACCEPTED: {"model": JobResponse}},
+)
+async def extract_actions(
+    meeting_id: int,
+    run_async: bool = Query(False, alias="async"),
+    idempotent: IdempotentRequest = Depends(idempotency),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+) -> Response:
+    try:
+        # Ensure meeting exists and is owned by current user
+        meeting = await run_in_threadpool(_get_owned_meeting, db, meeting_id, current_user.id)
+        if meeting is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Meeting not found")
+
+        require_notes(meeting)
+
+        async def extract() -> Response:
+            if run_async:
+                return await _enqueue(db, JOB_KIND_EXTRACT_ACTIONS, meeting, current_user.id)
+            outcome = await extract_meeting_actions(db, meeting, OpenAIService)
+            return JSONResponse(
+                content=[item.model_dump(mode="json") for item in outcome.action_items],
+                # Details of the rejected items are kept in meeting.analysis_meta["extraction"]
+                headers={"X-Rejected-Action-Items": str(len(outcome.rejected_action_items))},
+            )
+
+        return await idempotent.run(extract)
     except HTTPException:
         raise
     except Exception as e:
@@ -126,131 +307,32 @@ async def analyze_meeting(
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Unexpected error")
 
 
-@meetings_router.post("/{meeting_id}/extract-actions", response_model=List[ActionItemResponse])
-async def extract_actions(
-    meeting_id: int, current_user: User = Depends(get_current_user), db: Session = Depends(get_db)
-) -> List[ActionItem]:
+@meetings_router.post(
+    "/{meeting_id}/analyze-and-extract",
+    response_model=AnalyzeAndExtractResponse,
+    responses={status.HTTP_202_ACCEPTED: {"model": JobResponse}},
+)
+async def analyze_and_extract(
+    meeting_id: int,
+    run_async: bool = Query(False, alias="async"),
+    idempotent: IdempotentRequest = Depends(idempotency),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+) -> Response:
     try:
-        # Ensure meeting exists and is owned by current user
-        stmt = select(Meeting).where(Meeting.id == meeting_id, Meeting.owner_id == current_user.id)
-        meeting = db.execute(stmt).scalar_one_or_none()
+        meeting = await run_in_threadpool(_get_owned_meeting, db, meeting_id, current_user.id)
         if meeting is None:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Meeting not found")
 
-        notes = meeting.notes or ""
-        if not notes.strip():
-            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Meeting notes are empty")
-
-        # Build prompt including current date, notes, and existing analysis result if any
-        current_date = datetime.now(timezone.utc).isoformat()
-        analysis_part = ""
-        if meeting.analysis_result:
-            try:
-                analysis_part = json.dumps(meeting.analysis_result)
-            except Exception:
-                analysis_part = str(meeting.analysis_result)
-
-        prompt = (
-            "Extract action items from the meeting notes. Return a single JSON object with a key \"action_items\" "
-            "whose value is a list of action item objects. Each action item must have: description (string), "
-            "assignee (string|null), priority (High/Medium/Low), deadline (ISO8601 string or null). "
-            "If deadline is not inferable, deadline can be null and the service will default to 7 days from now. "
-            "Return only the JSON object, no explanatory text, no markdown.\n\n"
-            f"Current date: {current_date}\n"
-            f"Meeting notes:\n{notes}\n"
-        )
-        if analysis_part:
-            prompt += f"Existing analysis result:\n{analysis_part}\n"
+        require_notes(meeting)
 
-        # Call AI service
-        try:
-            ai_service = OpenAIService()
-            result = ai_service.get_completion(prompt=prompt, json_mode=True)
-        except HTTPException:
-            raise
-        except Exception as e:
-            logger.error(e, exc_info=True)
-            raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="AI service error")
-
-        if not isinstance(result, dict) or "action_items" not in result:
-            logger.error("Invalid AI response structure: %s", result)
-            raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Invalid AI response format")
-
-        raw_items = result.get("action_items")
-        if not isinstance(raw_items, list):
-            raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Invalid AI response format")
-
-        created_items: List[ActionItem] = []
-        now_utc = datetime.now(timezone.utc)
-        default_deadline = now_utc + timedelta(days=7)
-
-        for idx, it in enumerate(raw_items):
-            if not isinstance(it, dict):
-                logger.error("AI returned non-dict action item at index %s: %s", idx, it)
-                raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Invalid AI response format")
-
-            desc = it.get("description")
-            if not desc or not str(desc).strip():
-                logger.error("AI returned action item without description: %s", it)
-                raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Invalid AI response format")
-
-            assignee = it.get("assignee")
-
-            pri_raw = it.get("priority")
-            if pri_raw is None:
-                logger.error("AI returned action item without priority: %s", it)
-                raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Invalid AI response format")
-            pri = str(pri_raw).strip().title()
-            if pri not in {"High", "Medium", "Low"}:
-                logger.error("AI returned invalid priority: %s", pri)
-                raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Invalid AI response format")
-
-            dl = it.get("deadline")
-            deadline_dt = None
-            try:
-                if dl is None:
-                    deadline_dt = default_deadline
-                elif isinstance(dl, str) and dl.strip() == "":
-                    deadline_dt = default_deadline
-                elif isinstance(dl, str):
-                    dl_str = dl.strip()
-                    if dl_str.endswith("Z"):
-                        dl_str = dl_str[:-1] + "+00:00"
-                    # datetime.fromisoformat supports offset-aware strings
-                    deadline_dt = datetime.fromisoformat(dl_str)
-                elif isinstance(dl, (int, float)):
-                    # unix timestamp
-                    deadline_dt = datetime.fromtimestamp(float(dl), tz=timezone.utc)
-                else:
-                    # unexpected type
-                    deadline_dt = default_deadline
-            except Exception as e:
-                logger.error(e, exc_info=True)
-                raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Invalid AI response format")
-
-            try:
-                ai_obj = ActionItem(
-                    meeting_id=meeting.id,
-                    description=str(desc).strip(),
-                    assignee=(str(assignee).strip() if assignee is not None else None),
-                    priority=pri,
-                    deadline=deadline_dt,
-                )
-                created_items.append(ai_obj)
-            except Exception as e:
-                logger.error(e, exc_info=True)
-                raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to construct action items")
-
-        # Persist all created items
-        try:
-            db.add_all(created_items)
-            db.commit()
-            for item in created_items:
-                db.refresh(item)
-            return created_items
-        except Exception as e:
-            logger.error(e, exc_info=True)
-            raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error")
+        async def analyze_and_extract() -> Response:
+            if run_async:
+                return await _enqueue(db, JOB_KIND_ANALYZE_AND_EXTRACT, meeting, current_user.id)
+            outcome = await analyze_and_extract_meeting(db, meeting, OpenAIService)
+            return JSONResponse(content=AnalyzeAndExtractResponse.model_validate(outcome).model_dump(mode="json"))
+
+        return await idempotent.run(analyze_and_extract)
     except HTTPException:
         raise
     except Exception as e:
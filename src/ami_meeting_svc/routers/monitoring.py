@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import logging
+
+from fastapi import APIRouter, HTTPException, status
+from fastapi.responses import PlainTextResponse
+
+from ami_meeting_svc.models.base import get_pool_stats
+from ami_meeting_svc.schemas.monitoring import AICacheStats, AIUsageStats, CircuitStats, PoolStats
+from ami_meeting_svc.services.ai_cache import ai_cache
+from ami_meeting_svc.services.ai_metrics import ai_metrics
+from ami_meeting_svc.services.ai_service import usage_totals
+from ami_meeting_svc.services.circuit_breaker import openai_breaker
+
+logger = logging.getLogger(__name__)
+
+monitoring_router = APIRouter()
+
+
+@monitoring_router.get("/db-pool", response_model=PoolStats)
+async def db_pool() -> PoolStats:
+    try:
+        return PoolStats(**get_pool_stats())
+    except Exception as e:
+        logger.error(e, exc_info=True)
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to read pool statistics")
+
+
+@monitoring_router.get("/ai-cache", response_model=AICacheStats)
+async def ai_cache_stats() -> AICacheStats:
+    return AICacheStats(**ai_cache.stats())
+
+
+@monitoring_router.get("/openai-circuit", response_model=CircuitStats)
+async def openai_circuit() -> CircuitStats:
+    return CircuitStats(**openai_breaker.stats())
+
+
+@monitoring_router.get("/ai-usage", response_model=AIUsageStats)
+async def ai_usage() -> AIUsageStats:
+    return AIUsageStats(**usage_totals.as_dict())
+
+
+@monitoring_router.get("/metrics", response_class=PlainTextResponse)
+async def metrics() -> PlainTextResponse:
+    """AI call latency, retries, tokens and estimated cost in the Prometheus text format."""
+    return PlainTextResponse(ai_metrics.render_prometheus(), media_type="text/plain; version=0.0.4")
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Optional
+from typing import Any, List, Optional
 
 from pydantic import BaseModel, ConfigDict, field_validator
 
@@ -66,3 +66,71 @@ class ActionItemResponse(BaseModel):
     updated_at: datetime
 
     model_config = ConfigDict(from_attributes=True)
+
+
+# Spellings models use for the three priorities besides the canonical ones
+_PRIORITY_ALIASES = {
+    "urgent": "High", "critical": "High", "highest": "High",
+    "normal": "Medium", "med": "Medium", "moderate": "Medium",
+    "minor": "Low", "lowest": "Low",
+}
+
+
+class ExtractedActionItem(BaseModel):
+    """One action item as returned by the AI, normalized where the intent is unambiguous."""
+
+    description: str
+    assignee: Optional[str] = None
+    priority: str
+    # None means "no deadline given"; the service then applies its default
+    deadline: Optional[datetime] = None
+
+    model_config = ConfigDict(extra="ignore")
+
+    @field_validator("description", mode="before")
+    @classmethod
+    def validate_description(cls, v: Any) -> Any:
+        if isinstance(v, str):
+            v = v.strip()
+            if not v:
+                raise ValueError("description must not be empty")
+        return v
+
+    @field_validator("assignee", mode="before")
+    @classmethod
+    def normalize_assignee(cls, v: Any) -> Optional[str]:
+        if v is None:
+            return None
+        v = str(v).strip()
+        return v or None
+
+    @field_validator("priority", mode="before")
+    @classmethod
+    def normalize_priority(cls, v: Any) -> Any:
+        if not isinstance(v, str):
+            return v
+        key = v.strip().lower()
+        normalized = _PRIORITY_ALIASES.get(key, key.title())
+        if normalized not in {"High", "Medium", "Low"}:
+            raise ValueError("priority must be one of High, Medium, Low")
+        return normalized
+
+    @field_validator("deadline", mode="before")
+    @classmethod
+    def normalize_deadline(cls, v: Any) -> Any:
+        if isinstance(v, str) and not v.strip():
+            return None
+        if isinstance(v, str):
+            return v.strip()
+        if isinstance(v, (int, float)) and not isinstance(v, bool):
+            return v
+        # Anything else carries no usable date; fall back to the default deadline
+        return v if isinstance(v, datetime) else None
+
+
+class RejectedActionItem(BaseModel):
+    """An AI action item that failed validation, with its position in the AI output."""
+
+    index: int
+    item: Any = None
+    errors: List[str]
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Optional, List
+from datetime import date
+from typing import Literal, Optional, List
 from pydantic import BaseModel, ConfigDict
 
 
@@ -19,3 +20,53 @@ class DashboardMetrics(BaseModel):
 
     # allow model population from attribute objects if needed
     model_config = ConfigDict(from_attributes=True)
+
+
+Granularity = Literal["day", "week"]
+
+
+class TimeseriesPoint(BaseModel):
+    # Inclusive bounds, clipped to the requested range
+    period_start: date
+    period_end: date
+    created_count: int
+    completed_count: int
+    # Totals at the end of the period
+    total_items: int
+    done_items: int
+    overdue_count: int
+    completion_rate: float
+
+
+class DashboardTimeseries(BaseModel):
+    start: date
+    end: date
+    granularity: Granularity
+    points: List[TimeseriesPoint]
+
+
+CycleTimeGroupBy = Literal["assignee", "priority"]
+
+
+class Percentiles(BaseModel):
+    p50: float
+    p90: float
+    p99: float
+
+
+class CycleTimeGroup(BaseModel):
+    # Assignee (null = unassigned) or priority, per the report's group_by
+    key: Optional[str] = None
+    completed_count: int
+    # Creation to completion
+    lead_time_hours: Percentiles
+    # First move to In Progress to completion; only items that went through In Progress
+    cycle_time_count: int
+    cycle_time_hours: Optional[Percentiles] = None
+
+
+class CycleTimeReport(BaseModel):
+    group_by: CycleTimeGroupBy
+    start: Optional[date] = None
+    end: Optional[date] = None
+    groups: List[CycleTimeGroup]
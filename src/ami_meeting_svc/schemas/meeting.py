@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import List
+from typing import List, Optional
 
-from pydantic import BaseModel, ConfigDict, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+from .action_item import ActionItemResponse, RejectedActionItem
 
 
 class MeetingBase(BaseModel):
@@ -38,5 +40,35 @@ class MeetingResponse(MeetingBase):
     created_at: datetime
     updated_at: datetime
     analysis_result: dict | None = None
+    analysis_meta: dict | None = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class TokenUsageResponse(BaseModel):
+    prompt_tokens: int
+    completion_tokens: int
+    total_tokens: int
+    cached_tokens: int
+    calls: int
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class AnalyzeAndExtractResponse(BaseModel):
+    meeting: MeetingResponse
+    action_items: List[ActionItemResponse]
+    usage: TokenUsageResponse
+    cached: bool
+    rejected_action_items: List[RejectedActionItem] = []
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class BatchAnalyzeRequest(BaseModel):
+    # Either explicit ids or a filter; both narrow the caller's own meetings
+    meeting_ids: Optional[List[int]] = None
+    only_unanalyzed: bool = False
+    date_from: Optional[datetime] = None
+    date_to: Optional[datetime] = None
+    limit: Optional[int] = Field(default=None, ge=1)
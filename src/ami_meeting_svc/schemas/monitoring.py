@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class PoolStats(BaseModel):
+    pool_class: str
+    size: Optional[int] = None
+    checked_in: Optional[int] = None
+    checked_out: Optional[int] = None
+    overflow: Optional[int] = None
+    waits: Optional[int] = None
+    wait_seconds: Optional[float] = None
+    timeouts: Optional[int] = None
+
+
+class AICacheStats(BaseModel):
+    enabled: bool
+    memory_hits: int
+    db_hits: int
+    misses: int
+    stores: int
+    db_evictions: int
+    memory_entries: int
+    memory_evictions: int
+    hit_ratio: float
+
+
+class CircuitStats(BaseModel):
+    name: str
+    state: str
+    consecutive_failures: int
+    opened: int
+    rejected: int
+
+
+class AIUsageStats(BaseModel):
+    prompt_tokens: int
+    completion_tokens: int
+    total_tokens: int
+    cached_tokens: int
+    calls: int
+    cached_ratio: float
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any, List
+
+from fastapi import HTTPException, status
+from pydantic import TypeAdapter, ValidationError
+
+from ami_meeting_svc.schemas.action_item import ExtractedActionItem, RejectedActionItem
+
+logger = logging.getLogger(__name__)
+
+# Validation of AI action item payloads, one item at a time: a single malformed
+# item must not throw away the valid ones of an already paid-for completion.
+
+# Built once at import; building a validator per call would cost more than the validation
+_ITEM_ADAPTER = TypeAdapter(ExtractedActionItem)
+_REJECTED_ADAPTER = TypeAdapter(List[RejectedActionItem])
+
+# Key under which salvaged payloads carry their rejected items (in the AI cache too)
+REJECTED_KEY = "rejected_action_items"
+
+
+@dataclass
+class ParsedActionItems:
+    items: List[ExtractedActionItem] = field(default_factory=list)
+    rejected: List[RejectedActionItem] = field(default_factory=list)
+
+
+def _error_messages(error: ValidationError) -> List[str]:
+    messages = []
+    for detail in error.errors(include_url=False):
+        location = ".".join(str(part) for part in detail["loc"])
+        messages.append(f"{location}: {detail['msg']}" if location else detail["msg"])
+    return messages
+
+
+def raw_action_items(result: object) -> List[Any]:
+    """Return the "action_items" list of an AI payload; nothing is salvageable without one."""
+    if not isinstance(result, dict) or not isinstance(result.get("action_items"), list):
+        logger.error("Invalid AI response structure: %s", result)
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Invalid AI response format")
+    return result["action_items"]
+
+
+def parse_action_items(result: object) -> ParsedActionItems:
+    """Validate each action item of an AI payload on its own.
+
+    Valid items are normalized, invalid ones are collected with their errors.
+    Rejections already recorded in a salvaged payload are carried over.
+    """
+    parsed = ParsedActionItems()
+    for index, raw in enumerate(raw_action_items(result)):
+        try:
+            parsed.items.append(_ITEM_ADAPTER.validate_python(raw))
+        except ValidationError as e:
+            parsed.rejected.append(RejectedActionItem(index=index, item=raw, errors=_error_messages(e)))
+
+    try:
+        previous = _REJECTED_ADAPTER.validate_python(result.get(REJECTED_KEY) or [])
+    except ValidationError:
+        logger.warning("Ignoring malformed %s in AI payload", REJECTED_KEY)
+        previous = []
+    parsed.rejected = previous + parsed.rejected
+    return parsed
+
+
+def apply_repairs(parsed: ParsedActionItems, repaired: List[Any]) -> ParsedActionItems:
+    """Merge a repair reply (one item per rejection, same order) into `parsed`.
+
+    Items that still fail validation stay rejected with their original errors.
+    """
+    if len(repaired) != len(parsed.rejected):
+        logger.warning("Repair returned %s action items for %s rejected", len(repaired), len(parsed.rejected))
+        return parsed
+
+    result = ParsedActionItems(items=list(parsed.items))
+    for rejection, raw in zip(parsed.rejected, repaired):
+        try:
+            result.items.append(_ITEM_ADAPTER.validate_python(raw))
+        except ValidationError:
+            result.rejected.append(rejection)
+    return result
+
+
+def salvaged_payload(result: dict, parsed: ParsedActionItems) -> dict:
+    """Return `result` with only the valid, normalized items and the rejections alongside."""
+    return dict(
+        result,
+        action_items=[item.model_dump(mode="json") for item in parsed.items],
+        **{REJECTED_KEY: [rejection.model_dump(mode="json") for rejection in parsed.rejected]},
+    )
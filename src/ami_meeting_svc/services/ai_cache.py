@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import delete, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from ami_meeting_svc import config
+from ami_meeting_svc.models import AICacheEntry
+
+logger = logging.getLogger(__name__)
+
+
+def make_cache_key(kind: str, prompt_version: str, model: str, notes: str, context: Any = None) -> str:
+    """Content hash of everything that determines the AI output for a request."""
+    payload = json.dumps(
+        {"kind": kind, "prompt_version": prompt_version, "model": model, "notes": notes, "context": context},
+        sort_keys=True,
+        default=str,
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class _LRUTier:
+    """Bounded in-process tier with per-entry expiry."""
+
+    def __init__(self, max_entries: int) -> None:
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                self.evictions += 1
+                return None
+            self._entries.move_to_end(key)
+            # Callers may mutate what they get back (e.g. ORM JSON columns)
+            return copy.deepcopy(value)
+
+    def put(self, key: str, value: Any, ttl_seconds: float) -> None:
+        if self._max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl_seconds, copy.deepcopy(value))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class AICache:
+    """Two-tier cache for AI analysis/extraction results.
+
+    Lookups hit the in-process LRU first, then the `ai_cache_entries` table
+    (promoting hits into memory). Database errors are logged and treated as a
+    miss so the cache can never fail a request.
+    """
+
+    def __init__(self, enabled: bool, ttl_seconds: int, max_entries: int, db_max_entries: int) -> None:
+        self.enabled = enabled
+        self._ttl_seconds = ttl_seconds
+        self._db_max_entries = db_max_entries
+        self._memory = _LRUTier(max_entries)
+        self._lock = threading.Lock()
+        self._counters: Dict[str, int] = {"memory_hits": 0, "db_hits": 0, "misses": 0, "stores": 0, "db_evictions": 0}
+
+    def _incr(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self._counters[name] += amount
+
+    def _db_get(self, bind: Engine, key: str) -> Optional[Any]:
+        with Session(bind=bind) as db:
+            stmt = select(AICacheEntry.value).where(
+                AICacheEntry.cache_key == key, AICacheEntry.expires_at > datetime.utcnow()
+            )
+            return db.execute(stmt).scalar_one_or_none()
+
+    def _db_put(self, bind: Engine, key: str, kind: str, model: str, prompt_version: str, value: Any) -> int:
+        now = datetime.utcnow()
+        with Session(bind=bind) as db:
+            db.merge(
+                AICacheEntry(
+                    cache_key=key,
+                    kind=kind,
+                    model=model,
+                    prompt_version=prompt_version,
+                    value=value,
+                    created_at=now,
+                    expires_at=now + timedelta(seconds=self._ttl_seconds),
+                )
+            )
+            db.flush()
+            # Evict expired rows, then the oldest rows beyond the size budget
+            evicted = db.execute(delete(AICacheEntry).where(AICacheEntry.expires_at <= now)).rowcount
+            overflow = (
+                select(AICacheEntry.cache_key)
+                .order_by(AICacheEntry.created_at.desc())
+                .offset(self._db_max_entries)
+                .scalar_subquery()
+            )
+            evicted += db.execute(
+                delete(AICacheEntry).where(AICacheEntry.cache_key.in_(overflow)), execution_options={"synchronize_session": False}
+            ).rowcount
+            db.commit()
+            return max(evicted, 0)
+
+    async def get(self, bind: Engine, key: str, record: bool = True) -> Optional[Any]:
+        """Look up a cached value. `record=False` skips hit/miss counters (used when polling)."""
+        if not self.enabled:
+            return None
+        value = self._memory.get(key)
+        if value is not None:
+            if record:
+                self._incr("memory_hits")
+            return value
+        try:
+            value = await run_in_threadpool(self._db_get, bind, key)
+        except Exception as e:
+            logger.error("AI cache lookup failed: %s", e, exc_info=True)
+            value = None
+        if value is None:
+            if record:
+                self._incr("misses")
+            return None
+        if record:
+            self._incr("db_hits")
+        self._memory.put(key, value, self._ttl_seconds)
+        return value
+
+    async def put(self, bind: Engine, key: str, kind: str, model: str, prompt_version: str, value: Any) -> None:
+        if not self.enabled:
+            return
+        self._memory.put(key, value, self._ttl_seconds)
+        self._incr("stores")
+        try:
+            evicted = await run_in_threadpool(self._db_put, bind, key, kind, model, prompt_version, value)
+            self._incr("db_evictions", evicted)
+        except Exception as e:
+            logger.error("AI cache store failed: %s", e, exc_info=True)
+
+    def clear(self) -> None:
+        """Drop the in-process tier and reset counters (the table tier is left intact)."""
+        self._memory.clear()
+        with self._lock:
+            for name in self._counters:
+                self._counters[name] = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            counters = dict(self._counters)
+        lookups = counters["memory_hits"] + counters["db_hits"] + counters["misses"]
+        hits = counters["memory_hits"] + counters["db_hits"]
+        return {
+            "enabled": self.enabled,
+            **counters,
+            "memory_entries": len(self._memory),
+            "memory_evictions": self._memory.evictions,
+            "hit_ratio": round(hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+ai_cache = AICache(
+    enabled=config.AI_CACHE_ENABLED,
+    ttl_seconds=config.AI_CACHE_TTL_SECONDS,
+    max_entries=config.AI_CACHE_MAX_ENTRIES,
+    db_max_entries=config.AI_CACHE_DB_MAX_ENTRIES,
+)
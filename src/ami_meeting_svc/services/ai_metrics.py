@@ -0,0 +1,268 @@
+from __future__ import annotations
+
+import bisect
+import json
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Sequence, Tuple
+
+import openai
+
+from ami_meeting_svc import config
+from ami_meeting_svc.services.circuit_breaker import CircuitOpenError
+from ami_meeting_svc.services.rate_limiter import RateLimitWaitExceeded
+
+logger = logging.getLogger(__name__)
+# One JSON line per AI call; route this logger to the log shipper to get structured records
+call_logger = logging.getLogger("ami_meeting_svc.ai_calls")
+
+LATENCY_BUCKETS = (0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0, 120.0)
+TOKEN_BUCKETS = (250, 500, 1000, 2000, 4000, 8000, 16000, 32000, 64000, 128000)
+RETRY_BUCKETS = (0, 1, 2, 3, 4)
+COST_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0)
+
+OUTCOME_SUCCESS = "success"
+OUTCOME_CANCELLED = "cancelled"
+
+
+def classify_outcome(error: BaseException) -> str:
+    """Map the exception that ended an AI call to a low-cardinality outcome label."""
+    if isinstance(error, CircuitOpenError):
+        return "circuit_open"
+    if isinstance(error, (openai.RateLimitError, RateLimitWaitExceeded)):
+        return "rate_limited"
+    if isinstance(error, openai.APITimeoutError):
+        return "timeout"
+    if isinstance(error, openai.APIConnectionError):
+        return "connection_error"
+    if isinstance(error, openai.InternalServerError):
+        return "server_error"
+    if isinstance(error, openai.APIStatusError):
+        return "client_error"
+    if isinstance(error, Exception):
+        return "error"
+    # CancelledError, or GeneratorExit when a stream consumer stops early
+    return OUTCOME_CANCELLED
+
+
+def estimate_cost(model: str, prompt_tokens: int, completion_tokens: int, cached_tokens: int) -> float | None:
+    """Estimated USD cost of a call from config.OPENAI_MODEL_PRICES, or None for unpriced models."""
+    prices = config.OPENAI_MODEL_PRICES.get(model) if isinstance(config.OPENAI_MODEL_PRICES, dict) else None
+    if not isinstance(prices, dict):
+        return None
+    try:
+        prompt_price = float(prices["prompt"])
+        completion_price = float(prices["completion"])
+        cached_price = float(prices.get("cached_prompt", prompt_price))
+    except (KeyError, TypeError, ValueError):
+        logger.warning("Ignoring invalid price entry for %s: %s", model, prices)
+        return None
+    cached = min(cached_tokens, prompt_tokens)
+    # Prices are per million tokens
+    return ((prompt_tokens - cached) * prompt_price + cached * cached_price + completion_tokens * completion_price) / 1e6
+
+
+@dataclass
+class AICall:
+    """One logical AI call: every attempt, backoff sleep and rate limit wait it took."""
+
+    model: str
+    kind: str
+    attempts: int = 0
+    outcome: str = OUTCOME_SUCCESS
+    duration: float = 0.0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    cached_tokens: int = 0
+    usage_reported: bool = False
+
+    @property
+    def retries(self) -> int:
+        return max(0, self.attempts - 1)
+
+    def add_usage(self, usage: Any) -> None:
+        if usage is None:
+            return
+        for name in ("prompt_tokens", "completion_tokens"):
+            value = getattr(usage, name, None)
+            if isinstance(value, int):
+                setattr(self, name, getattr(self, name) + value)
+                self.usage_reported = True
+        cached = getattr(getattr(usage, "prompt_tokens_details", None), "cached_tokens", None)
+        if isinstance(cached, int):
+            self.cached_tokens += cached
+
+    def cost(self) -> float | None:
+        if not self.usage_reported:
+            return None
+        return estimate_cost(self.model, self.prompt_tokens, self.completion_tokens, self.cached_tokens)
+
+    def as_record(self) -> Dict[str, Any]:
+        cost = self.cost()
+        return {
+            "event": "ai_call",
+            "model": self.model,
+            "kind": self.kind,
+            "outcome": self.outcome,
+            "duration_ms": round(self.duration * 1000, 1),
+            "attempts": self.attempts,
+            "retries": self.retries,
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "cached_tokens": self.cached_tokens,
+            "cost_usd": round(cost, 6) if cost is not None else None,
+        }
+
+
+class Histogram:
+    """Fixed-bucket histogram with Prometheus semantics (upper-inclusive buckets plus +Inf)."""
+
+    def __init__(self, buckets: Sequence[float]) -> None:
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> List[Tuple[str, int]]:
+        """Return (le, cumulative count) pairs ending with +Inf."""
+        result: List[Tuple[str, int]] = []
+        running = 0
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            running += count
+            result.append(("+Inf" if bound == float("inf") else _format_value(bound), running))
+        return result
+
+
+class _Series:
+    def __init__(self) -> None:
+        self.calls = 0
+        self.duration = Histogram(LATENCY_BUCKETS)
+        self.retries = Histogram(RETRY_BUCKETS)
+        self.tokens = Histogram(TOKEN_BUCKETS)
+        self.cost = Histogram(COST_BUCKETS)
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.cached_tokens = 0
+
+
+def _format_value(value: float) -> str:
+    return repr(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels: str) -> str:
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + "}"
+
+
+class AIMetrics:
+    """In-process aggregation of AI calls per (model, outcome), exported as Prometheus text."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._series: Dict[Tuple[str, str], _Series] = {}
+
+    @contextmanager
+    def track(self, model: str, kind: str) -> Iterator[AICall]:
+        """Time the enclosed AI call and record it with the outcome of the block."""
+        call = AICall(model=model, kind=kind)
+        started = time.monotonic()
+        try:
+            yield call
+        except BaseException as e:
+            call.outcome = classify_outcome(e)
+            raise
+        finally:
+            call.duration = time.monotonic() - started
+            self.record(call)
+
+    def record(self, call: AICall) -> None:
+        cost = call.cost()
+        with self._lock:
+            series = self._series.setdefault((call.model, call.outcome), _Series())
+            series.calls += 1
+            series.duration.observe(call.duration)
+            series.retries.observe(call.retries)
+            if call.usage_reported:
+                series.tokens.observe(call.prompt_tokens + call.completion_tokens)
+                series.prompt_tokens += call.prompt_tokens
+                series.completion_tokens += call.completion_tokens
+                series.cached_tokens += call.cached_tokens
+            if cost is not None:
+                series.cost.observe(cost)
+        if config.AI_CALL_LOG_ENABLED:
+            call_logger.info(json.dumps(call.as_record(), sort_keys=True))
+
+    def snapshot(self) -> Dict[Tuple[str, str], Dict[str, Any]]:
+        """Return per (model, outcome) totals, mainly for tests and ad-hoc inspection."""
+        with self._lock:
+            return {
+                key: {
+                    "calls": series.calls,
+                    "retries": int(series.retries.sum),
+                    "duration_seconds": series.duration.sum,
+                    "prompt_tokens": series.prompt_tokens,
+                    "completion_tokens": series.completion_tokens,
+                    "cached_tokens": series.cached_tokens,
+                    "cost_usd": series.cost.sum,
+                }
+                for key, series in self._series.items()
+            }
+
+    def render_prometheus(self) -> str:
+        """Render every series in the Prometheus text exposition format (0.0.4)."""
+        lines: List[str] = []
+        with self._lock:
+            items = sorted(self._series.items())
+
+            def histogram(name: str, help_text: str, attr: str) -> None:
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} histogram")
+                for (model, outcome), series in items:
+                    hist: Histogram = getattr(series, attr)
+                    if hist.count == 0:
+                        continue
+                    for le, count in hist.cumulative():
+                        lines.append(f"{name}_bucket{_labels(model=model, outcome=outcome, le=le)} {count}")
+                    lines.append(f"{name}_sum{_labels(model=model, outcome=outcome)} {_format_value(hist.sum)}")
+                    lines.append(f"{name}_count{_labels(model=model, outcome=outcome)} {hist.count}")
+
+            lines.append("# HELP ami_ai_calls_total AI completion calls by model and outcome.")
+            lines.append("# TYPE ami_ai_calls_total counter")
+            for (model, outcome), series in items:
+                lines.append(f"ami_ai_calls_total{_labels(model=model, outcome=outcome)} {series.calls}")
+
+            lines.append("# HELP ami_ai_tokens_total Tokens reported by AI calls, by kind (cached is a subset of prompt).")
+            lines.append("# TYPE ami_ai_tokens_total counter")
+            for (model, outcome), series in items:
+                for kind in ("prompt", "completion", "cached"):
+                    value = getattr(series, f"{kind}_tokens")
+                    lines.append(f"ami_ai_tokens_total{_labels(model=model, outcome=outcome, kind=kind)} {value}")
+
+            histogram(
+                "ami_ai_call_duration_seconds",
+                "Wall time of an AI call including retries, backoff and rate limit waits.",
+                "duration",
+            )
+            histogram("ami_ai_call_retries", "Retries tenacity made within one AI call.", "retries")
+            histogram("ami_ai_call_tokens", "Prompt plus completion tokens of one AI call.", "tokens")
+            histogram("ami_ai_call_cost_usd", "Estimated cost of one AI call in USD (priced models only).", "cost")
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        with self._lock:
+            self._series.clear()
+
+
+# Process-wide AI call metrics, exported at GET /monitoring/metrics
+ai_metrics = AIMetrics()
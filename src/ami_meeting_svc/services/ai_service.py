@@ -2,21 +2,150 @@ from __future__ import annotations
 
 import json
 import logging
-from typing import Dict, List, Union
+import time
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, List, Union
 
+import httpx
 import openai
-from openai import OpenAI
-from tenacity import (retry, retry_if_exception_type, stop_after_attempt,
+from openai import AsyncOpenAI
+from tenacity import (RetryCallState, retry, retry_if_exception_type,
                       wait_exponential)
 
 from ami_meeting_svc import config
+from ami_meeting_svc.services.ai_metrics import AICall, ai_metrics
+from ami_meeting_svc.services.chunking import estimate_tokens
+from ami_meeting_svc.services.circuit_breaker import openai_breaker
+from ami_meeting_svc.services.rate_limiter import RateLimitWaitExceeded, openai_rate_limiter
 
 logger = logging.getLogger(__name__)
 
+# Application-lifetime client; opened and closed by the FastAPI lifespan.
+_shared_client: AsyncOpenAI | None = None
+
+MAX_ATTEMPTS = 5
+
+# Upstream failures that count against the circuit breaker (client errors such as
+# 400/401 say nothing about the provider's health)
+_UPSTREAM_FAILURES = (
+    openai.RateLimitError,
+    openai.APIConnectionError,
+    openai.APITimeoutError,
+    openai.InternalServerError,
+)
+
+
+def _stop_retrying(retry_state: RetryCallState) -> bool:
+    """Stop after MAX_ATTEMPTS, or when the next backoff would overrun the call's deadline."""
+    if retry_state.attempt_number >= MAX_ATTEMPTS:
+        return True
+    deadline = retry_state.kwargs.get("deadline")
+    if deadline is None:
+        return False
+    # Leave room for the next attempt to do more than time out immediately
+    return time.monotonic() + retry_state.upcoming_sleep + 1.0 >= deadline
+
+
+@dataclass
+class TokenUsage:
+    """Running total of the token usage reported by chat completion responses."""
+
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    total_tokens: int = 0
+    # Prompt tokens served from the provider's prompt cache (billed at a discount)
+    cached_tokens: int = 0
+    calls: int = 0
+
+    def add(self, usage: Any) -> None:
+        self.calls += 1
+        for name in ("prompt_tokens", "completion_tokens", "total_tokens"):
+            value = getattr(usage, name, None)
+            if isinstance(value, int):
+                setattr(self, name, getattr(self, name) + value)
+        cached = getattr(getattr(usage, "prompt_tokens_details", None), "cached_tokens", None)
+        if isinstance(cached, int):
+            self.cached_tokens += cached
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "total_tokens": self.total_tokens,
+            "cached_tokens": self.cached_tokens,
+            "calls": self.calls,
+            "cached_ratio": round(self.cached_tokens / self.prompt_tokens, 4) if self.prompt_tokens else 0.0,
+        }
+
+
+# Process-wide usage of every completion, for monitoring
+usage_totals = TokenUsage()
+
+
+def create_client(api_key: str | None = None) -> AsyncOpenAI:
+    """Build an AsyncOpenAI client backed by a pooled keep-alive httpx client."""
+    api_key_to_use = api_key or config.OPENAI_API_KEY
+    if not api_key_to_use:
+        raise RuntimeError("OPENAI API key is not configured")
+
+    http_client = httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=config.OPENAI_MAX_CONNECTIONS,
+            max_keepalive_connections=config.OPENAI_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=config.OPENAI_KEEPALIVE_EXPIRY,
+        ),
+        timeout=httpx.Timeout(config.OPENAI_TIMEOUT),
+    )
+    # Retries are owned by tenacity in OpenAIService; disable the SDK's own
+    # so a single call cannot fan out into attempts x SDK retries.
+    return AsyncOpenAI(
+        api_key=api_key_to_use, base_url=config.OPENAI_BASE_URL, http_client=http_client, max_retries=0
+    )
+
+
+async def init_client() -> AsyncOpenAI | None:
+    """Open the shared client at startup. Returns None when no API key is configured."""
+    global _shared_client
+    if _shared_client is None:
+        if not config.OPENAI_API_KEY:
+            logger.warning("OPENAI_API_KEY is not set; AI endpoints will be unavailable")
+            return None
+        _shared_client = create_client()
+    return _shared_client
+
+
+async def close_client() -> None:
+    """Close the shared client and release its pooled connections."""
+    global _shared_client
+    client, _shared_client = _shared_client, None
+    if client is not None:
+        await client.close()
+
+
+def get_client() -> AsyncOpenAI:
+    """Return the shared client, creating it on first use outside the app lifespan."""
+    global _shared_client
+    if _shared_client is None:
+        _shared_client = create_client()
+    return _shared_client
+
+
+def _build_messages(prompt: str, system_message: str | None) -> List[Dict[str, str]]:
+    messages: List[Dict[str, str]] = []
+    if system_message is not None:
+        messages.append({"role": "system", "content": system_message})
+    messages.append({"role": "user", "content": prompt})
+    return messages
+
+
+def _estimate_call_tokens(messages: List[Dict[str, str]]) -> int:
+    return estimate_tokens("".join(m["content"] for m in messages)) + config.OPENAI_COMPLETION_TOKEN_ESTIMATE
+
 
 class OpenAIService:
     """Wrapper around OpenAI client with retry and JSON mode support.
 
+    Instances are cheap: by default they reuse the shared application client.
     Constructor is test-friendly: accepts an explicit client, api_key, model_name.
     """
 
@@ -24,20 +153,16 @@ class OpenAIService:
         self,
         api_key: str | None = None,
         model_name: str | None = None,
-        client: OpenAI | None = None,
+        client: AsyncOpenAI | None = None,
     ) -> None:
         try:
             self._model_name = model_name or config.OPENAI_MODEL_NAME
             if client is not None:
                 self._client = client
-                return
-
-            api_key_to_use = api_key or config.OPENAI_API_KEY
-            if not api_key_to_use:
-                raise RuntimeError("OPENAI API key is not configured")
-
-            # Initialize OpenAI client
-            self._client = OpenAI(api_key=api_key_to_use)
+            elif api_key is not None:
+                self._client = create_client(api_key)
+            else:
+                self._client = get_client()
         except Exception as e:
             logger.error(e, exc_info=True)
             raise
@@ -47,43 +172,94 @@ class OpenAIService:
             openai.RateLimitError,
             openai.APIConnectionError,
             openai.APITimeoutError,
+            RateLimitWaitExceeded,
         )),
         wait=wait_exponential(min=1, max=60),
-        stop=stop_after_attempt(5),
+        stop=_stop_retrying,
         reraise=True,
     )
-    def _create_chat_completion(self, messages: List[Dict[str, str]], json_mode: bool) -> object:
+    async def _create_chat_completion(
+        self,
+        messages: List[Dict[str, str]],
+        json_mode: bool,
+        deadline: float | None = None,
+        call: AICall | None = None,
+    ) -> object:
         """Call the OpenAI chat completion endpoint with retries.
 
-        Tenacity handles retry on transient network and rate limit errors.
+        Every attempt first waits for the shared requests/tokens-per-minute budget,
+        so bursts queue here instead of turning into 429s, but never past the
+        `deadline` (time.monotonic() value). Tenacity retries transient network and
+        rate limit errors, including a budget that would not refill in time, until
+        MAX_ATTEMPTS or the deadline; its backoff sleeps are awaited, so they do not
+        block the event loop. Attempts are counted on `call`. The circuit breaker is
+        checked by the caller, once per logical call rather than per attempt.
         """
+        if call is not None:
+            call.attempts += 1
+        estimated = _estimate_call_tokens(messages)
         try:
-            client = self._client.with_options(timeout=60)
+            await openai_rate_limiter.acquire(estimated, deadline=deadline)
+            timeout = config.OPENAI_TIMEOUT
+            if deadline is not None:
+                timeout = max(1.0, min(timeout, deadline - time.monotonic()))
+            client = self._client.with_options(timeout=timeout)
             kwargs = {"model": self._model_name, "messages": messages}
             if json_mode:
                 kwargs["response_format"] = {"type": "json_object"}
 
-            response = client.chat.completions.create(**kwargs)
-            return response
+            response = await client.chat.completions.create(**kwargs)
+        except openai.RateLimitError as e:
+            logger.error(e, exc_info=True)
+            # Our budget was too optimistic: make every worker sharing it back off
+            await openai_rate_limiter.exhaust()
+            raise
         except Exception as e:
             logger.error(e, exc_info=True)
             raise
 
-    def get_completion(
-        self, prompt: str, system_message: str | None = None, json_mode: bool = False
+        actual = getattr(getattr(response, "usage", None), "total_tokens", None)
+        if isinstance(actual, int):
+            await openai_rate_limiter.settle(estimated, actual)
+        return response
+
+    async def get_completion(
+        self,
+        prompt: str,
+        system_message: str | None = None,
+        json_mode: bool = False,
+        usage: TokenUsage | None = None,
     ) -> Union[str, Dict]:
         """Public method to get a completion from the OpenAI chat API.
 
         If json_mode is True, will request and parse a JSON object.
         Returns either the raw string content or a parsed dictionary.
+        When `usage` is given, the response's token usage is added to it.
         """
         try:
-            messages: List[Dict[str, str]] = []
-            if system_message is not None:
-                messages.append({"role": "system", "content": system_message})
-            messages.append({"role": "user", "content": prompt})
-
-            response = self._create_chat_completion(messages, json_mode=json_mode)
+            messages = _build_messages(prompt, system_message)
+            deadline = time.monotonic() + config.OPENAI_REQUEST_DEADLINE
+            with ai_metrics.track(self._model_name, "completion") as call:
+                # One verdict per logical call: a call that exhausts its retries is a
+                # single failure, so one caller cannot open the circuit on its own
+                openai_breaker.before_call()
+                try:
+                    response = await self._create_chat_completion(
+                        messages, json_mode=json_mode, deadline=deadline, call=call
+                    )
+                except _UPSTREAM_FAILURES:
+                    openai_breaker.record_failure()
+                    raise
+                except BaseException:
+                    # Client errors and cancellation say nothing about the provider's health
+                    openai_breaker.release_probe()
+                    raise
+                openai_breaker.record_success()
+                response_usage = getattr(response, "usage", None)
+                call.add_usage(response_usage)
+            usage_totals.add(response_usage)
+            if usage is not None:
+                usage.add(response_usage)
 
             # Extract content: response.choices[0].message.content
             try:
@@ -105,3 +281,68 @@ class OpenAIService:
         except Exception as e:
             logger.error(e, exc_info=True)
             raise
+
+    async def stream_completion(
+        self,
+        prompt: str,
+        system_message: str | None = None,
+        json_mode: bool = False,
+        usage: TokenUsage | None = None,
+    ) -> AsyncIterator[str]:
+        """Yield the completion's content deltas as the model generates them.
+
+        Guarded by the same circuit breaker and rate limiter as get_completion, but
+        never retried: once tokens have been sent to the caller a retry would
+        duplicate them.
+        """
+        messages = _build_messages(prompt, system_message)
+        deadline = time.monotonic() + config.OPENAI_REQUEST_DEADLINE
+        with ai_metrics.track(self._model_name, "stream") as call:
+            openai_breaker.before_call()
+            call.attempts += 1
+            estimated = _estimate_call_tokens(messages)
+            try:
+                await openai_rate_limiter.acquire(estimated, deadline=deadline)
+                client = self._client.with_options(timeout=config.OPENAI_TIMEOUT)
+                kwargs: Dict[str, Any] = {
+                    "model": self._model_name,
+                    "messages": messages,
+                    "stream": True,
+                    "stream_options": {"include_usage": True},
+                }
+                if json_mode:
+                    kwargs["response_format"] = {"type": "json_object"}
+
+                stream = await client.chat.completions.create(**kwargs)
+                try:
+                    async for chunk in stream:
+                        # With include_usage the final chunk carries usage and no choices
+                        chunk_usage = getattr(chunk, "usage", None)
+                        if chunk_usage is not None:
+                            call.add_usage(chunk_usage)
+                            usage_totals.add(chunk_usage)
+                            if usage is not None:
+                                usage.add(chunk_usage)
+                            actual = getattr(chunk_usage, "total_tokens", None)
+                            if isinstance(actual, int):
+                                await openai_rate_limiter.settle(estimated, actual)
+                        if chunk.choices:
+                            delta = chunk.choices[0].delta.content
+                            if delta:
+                                yield delta
+                finally:
+                    await stream.close()
+            except _UPSTREAM_FAILURES as e:
+                logger.error(e, exc_info=True)
+                openai_breaker.record_failure()
+                raise
+            except Exception as e:
+                logger.error(e, exc_info=True)
+                openai_breaker.release_probe()
+                raise
+            except BaseException:
+                # Cancelled or the consumer stopped early: no verdict on the provider's health
+                openai_breaker.release_probe()
+                raise
+            openai_breaker.record_success()
+
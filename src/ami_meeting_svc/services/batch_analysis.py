@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple
+
+from fastapi import HTTPException
+from sqlalchemy import String, cast, or_, select, update
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from ami_meeting_svc.models import Meeting
+from ami_meeting_svc.services.ai_service import OpenAIService
+from ami_meeting_svc.services.meeting_ai import (
+    ANALYSIS_PROMPT_VERSION,
+    AIServiceFactory,
+    compute_analysis,
+    notes_coverage,
+    with_analysis_meta,
+)
+from ami_meeting_svc.services.model_routing import TASK_ANALYSIS, choose_model
+
+logger = logging.getLogger(__name__)
+
+BatchEvent = Dict[str, Any]
+
+
+class RateLimiter:
+    """Spread acquisitions evenly so at most `per_minute` start in any minute (0 = unlimited)."""
+
+    def __init__(self, per_minute: float) -> None:
+        self._interval = 60.0 / per_minute if per_minute > 0 else 0.0
+        self._next_at = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        if self._interval <= 0:
+            return
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            delay = self._next_at - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._next_at = max(loop.time(), self._next_at) + self._interval
+
+
+def select_meetings(
+    bind: Engine,
+    owner_id: Optional[int] = None,
+    meeting_ids: Optional[List[int]] = None,
+    only_unanalyzed: bool = False,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+    limit: Optional[int] = None,
+) -> List[Tuple[int, str]]:
+    """Return (id, notes) for the meetings matching the filter, oldest first.
+
+    `owner_id=None` selects across all owners (CLI use only).
+    """
+    stmt = select(Meeting.id, Meeting.notes).order_by(Meeting.id)
+    if owner_id is not None:
+        stmt = stmt.where(Meeting.owner_id == owner_id)
+    if meeting_ids is not None:
+        stmt = stmt.where(Meeting.id.in_(meeting_ids))
+    if only_unanalyzed:
+        # An explicit None is stored as JSON 'null' rather than SQL NULL
+        stmt = stmt.where(
+            or_(Meeting.analysis_result.is_(None), cast(Meeting.analysis_result, String) == "null")
+        )
+    if date_from is not None:
+        stmt = stmt.where(Meeting.date >= date_from)
+    if date_to is not None:
+        stmt = stmt.where(Meeting.date < date_to)
+    if limit is not None:
+        stmt = stmt.limit(limit)
+    with Session(bind=bind) as db:
+        return [(row.id, row.notes) for row in db.execute(stmt)]
+
+
+def save_analyses(bind: Engine, results: Dict[int, Tuple[dict, dict]]) -> None:
+    """Persist several (analysis_result, analysis meta) pairs in one transaction (bulk UPDATE by primary key)."""
+    if not results:
+        return
+    with Session(bind=bind) as db:
+        current_meta = dict(
+            db.execute(select(Meeting.id, Meeting.analysis_meta).where(Meeting.id.in_(list(results)))).all()
+        )
+        db.execute(
+            update(Meeting),
+            [
+                {
+                    "id": meeting_id,
+                    "analysis_result": result,
+                    "analysis_meta": with_analysis_meta(current_meta.get(meeting_id), analysis=meta),
+                }
+                for meeting_id, (result, meta) in results.items()
+            ],
+        )
+        db.commit()
+
+
+async def run_batch_analysis(
+    bind: Engine,
+    meetings: List[Tuple[int, str]],
+    ai_service_factory: AIServiceFactory = OpenAIService,
+    concurrency: int = 1,
+    rate_per_minute: float = 0,
+    commit_size: int = 1,
+    not_found: Sequence[int] = (),
+) -> AsyncIterator[BatchEvent]:
+    """Analyze `meetings` concurrently, yielding one progress event per meeting.
+
+    At most `concurrency` meetings are analyzed at a time and at most
+    `rate_per_minute` are started per minute. Results are committed every
+    `commit_size` successes; a "committed" event follows each commit.
+    Meetings whose analysis fails are reported and skipped, never retried here.
+    Requested ids in `not_found` are reported right after "started" and counted
+    as failed, so the totals cover every id the caller asked for.
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    limiter = RateLimiter(rate_per_minute)
+    commit_size = max(1, commit_size)
+    pending: Dict[int, Tuple[dict, dict]] = {}
+    total = len(meetings) + len(not_found)
+    succeeded = 0
+    failed = len(not_found)
+
+    async def analyze(meeting_id: int, notes: str) -> BatchEvent:
+        async with semaphore:
+            await limiter.acquire()
+            try:
+                if not (notes or "").strip():
+                    raise HTTPException(status_code=400, detail="Meeting notes are empty")
+                choice = choose_model(TASK_ANALYSIS, notes)
+                result = await compute_analysis(bind, notes, ai_service_factory, choice)
+                return {
+                    "event": "result",
+                    "meeting_id": meeting_id,
+                    "status": "succeeded",
+                    "model": choice.model,
+                    "analysis_result": result,
+                    "analysis_meta": dict(
+                        choice.as_meta(ANALYSIS_PROMPT_VERSION), **notes_coverage(notes), mode="full"
+                    ),
+                }
+            except HTTPException as e:
+                return {"event": "result", "meeting_id": meeting_id, "status": "failed", "error": str(e.detail)}
+            except Exception as e:
+                logger.error(e, exc_info=True)
+                return {"event": "result", "meeting_id": meeting_id, "status": "failed", "error": "Unexpected error"}
+
+    async def flush() -> BatchEvent:
+        nonlocal succeeded, failed
+        batch = dict(pending)
+        pending.clear()
+        try:
+            await run_in_threadpool(save_analyses, bind, batch)
+        except Exception as e:
+            logger.error(e, exc_info=True)
+            succeeded -= len(batch)
+            failed += len(batch)
+            return {"event": "commit_failed", "meeting_ids": sorted(batch), "error": "Database error"}
+        return {"event": "committed", "meeting_ids": sorted(batch)}
+
+    yield {"event": "started", "total": total}
+    for meeting_id in not_found:
+        yield {"event": "result", "meeting_id": meeting_id, "status": "not_found"}
+    tasks = [asyncio.ensure_future(analyze(meeting_id, notes)) for meeting_id, notes in meetings]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            event = await next_done
+            if event["status"] == "succeeded":
+                succeeded += 1
+                pending[event["meeting_id"]] = (event.pop("analysis_result"), event.pop("analysis_meta"))
+            else:
+                failed += 1
+            yield event
+            if len(pending) >= commit_size:
+                yield await flush()
+        if pending:
+            yield await flush()
+        yield {"event": "finished", "total": total, "succeeded": succeeded, "failed": failed}
+    finally:
+        # The consumer went away (client disconnect, Ctrl-C): stop outstanding work
+        # but keep the results already computed
+        for task in tasks:
+            task.cancel()
+        # Let cancelled analyses unwind before the event loop can drop them
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if pending:
+            try:
+                await run_in_threadpool(save_analyses, bind, dict(pending))
+            except Exception as e:
+                logger.error(e, exc_info=True)
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import math
+import re
+from typing import List, Tuple
+
+# Rough size heuristic (~4 characters per token for English text). It only has to
+# be good enough to keep chunks comfortably inside the model's context window.
+CHARS_PER_TOKEN = 4
+
+# "Alice: ...", "[10:02] Bob Smith: ...", "SPEAKER 2: ..." at the start of a line
+_SPEAKER_TURN = re.compile(r"^\s*(\[[^\]]{1,20}\]\s*)?[A-Z][\w .'\-]{0,40}:\s", re.MULTILINE)
+_PARAGRAPH_BREAK = re.compile(r"\n\s*\n")
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+
+def estimate_tokens(text: str) -> int:
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def _split_blocks(notes: str) -> List[Tuple[str, str]]:
+    """Split notes into paragraphs, then paragraphs into speaker turns.
+
+    Each block carries the separator that joined it to the previous one, so
+    chunks keep the original paragraph/line layout.
+    """
+    blocks: List[Tuple[str, str]] = []
+    for paragraph in _PARAGRAPH_BREAK.split(notes):
+        starts = [m.start() for m in _SPEAKER_TURN.finditer(paragraph)]
+        if not starts or starts[0] != 0:
+            starts.insert(0, 0)
+        separator = "\n\n"
+        for begin, end in zip(starts, starts[1:] + [len(paragraph)]):
+            block = paragraph[begin:end].strip()
+            if block:
+                blocks.append((block, separator))
+                separator = "\n"
+    return blocks
+
+
+def _split_oversized(block: str, max_chars: int) -> List[str]:
+    """Break a single block larger than the budget on lines, sentences, then hard cuts."""
+    pieces: List[str] = []
+    for unit in re.split(r"\n|" + _SENTENCE_END.pattern, block):
+        unit = unit.strip()
+        while len(unit) > max_chars:
+            pieces.append(unit[:max_chars])
+            unit = unit[max_chars:]
+        if unit:
+            pieces.append(unit)
+    return pieces
+
+
+def split_notes(notes: str, token_budget: int) -> List[str]:
+    """Pack notes into chunks of at most `token_budget` estimated tokens.
+
+    Chunks break on paragraph and speaker-turn boundaries whenever possible so
+    each chunk stays readable on its own.
+    """
+    max_chars = max(1, token_budget * CHARS_PER_TOKEN)
+    chunks: List[str] = []
+    current = ""
+
+    for block, separator in _split_blocks(notes):
+        if len(block) <= max_chars:
+            units = [(block, separator)]
+        else:
+            units = [(piece, "\n") for piece in _split_oversized(block, max_chars)]
+        for unit, sep in units:
+            if current and len(current) + len(sep) + len(unit) > max_chars:
+                chunks.append(current)
+                current = ""
+            current = f"{current}{sep}{unit}" if current else unit
+
+    if current:
+        chunks.append(current)
+    return chunks
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict
+
+from ami_meeting_svc import config
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a dependency whose circuit is open."""
+
+    def __init__(self, name: str, retry_after: float) -> None:
+        super().__init__(f"{name} circuit is open; retry after {retry_after:.1f}s")
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker with half-open probing.
+
+    After `failure_threshold` consecutive failures the circuit opens and calls
+    fail fast for `recovery_seconds`. Then a single probe call is let through
+    (half-open): success closes the circuit, failure re-opens it.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int,
+        recovery_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.name = name
+        self._failure_threshold = max(1, failure_threshold)
+        self._recovery_seconds = recovery_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._counters: Dict[str, int] = {"opened": 0, "rejected": 0}
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state
+
+    def before_call(self) -> None:
+        """Raise CircuitOpenError unless a call may go out now."""
+        with self._lock:
+            if self._state == CLOSED:
+                return
+            remaining = self._opened_at + self._recovery_seconds - self._clock()
+            if self._state == OPEN and remaining <= 0:
+                self._state = HALF_OPEN
+            if self._state == HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                logger.info("%s circuit half-open: sending probe", self.name)
+                return
+            self._counters["rejected"] += 1
+            # While a probe is in flight, suggest checking back once it has had time to finish
+            raise CircuitOpenError(self.name, remaining if remaining > 0 else self._recovery_seconds)
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self._state != CLOSED:
+                logger.info("%s circuit closed", self.name)
+            self._state = CLOSED
+            self._failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._state == HALF_OPEN or self._failures >= self._failure_threshold:
+                if self._state != OPEN:
+                    self._counters["opened"] += 1
+                    logger.warning("%s circuit opened after %s consecutive failures", self.name, self._failures)
+                self._state = OPEN
+                self._opened_at = self._clock()
+            self._probe_in_flight = False
+
+    def release_probe(self) -> None:
+        """Give back a probe slot whose call ended without a verdict (e.g. a client error)."""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def reset(self) -> None:
+        with self._lock:
+            self._state = CLOSED
+            self._failures = 0
+            self._probe_in_flight = False
+            self._counters = {"opened": 0, "rejected": 0}
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "name": self.name,
+                "state": self._state,
+                "consecutive_failures": self._failures,
+                **self._counters,
+            }
+
+
+openai_breaker = CircuitBreaker(
+    "openai",
+    failure_threshold=config.OPENAI_CIRCUIT_FAILURE_THRESHOLD,
+    recovery_seconds=config.OPENAI_CIRCUIT_RECOVERY_SECONDS,
+)
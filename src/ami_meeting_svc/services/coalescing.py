@@ -0,0 +1,246 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from ami_meeting_svc import config
+from ami_meeting_svc.models import AILease
+from ami_meeting_svc.services.ai_cache import ai_cache
+
+logger = logging.getLogger(__name__)
+
+# Expired leases deleted per acquire; each acquire adds at most one row, so this keeps up
+PURGE_BATCH_SIZE = 100
+# Minimum time a published result stays on its lease row for waiting workers
+RESULT_KEEP_SECONDS = 5.0
+
+
+class SingleFlight:
+    """Coalesce concurrent calls for the same key within this process.
+
+    The first caller runs the coroutine; later callers await the same future.
+    """
+
+    def __init__(self) -> None:
+        self._inflight: Dict[Tuple[int, str], asyncio.Future] = {}
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        loop = asyncio.get_running_loop()
+        slot = (id(loop), key)
+        future = self._inflight.get(slot)
+        if future is not None:
+            # shield: a cancelled follower must not cancel the leader's call
+            return await asyncio.shield(future)
+
+        future = loop.create_future()
+        self._inflight[slot] = future
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # mark retrieved so an unobserved failure does not log a warning
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._inflight[slot]
+
+
+class DBLease:
+    """Expiring row lock in `ai_leases`, shared by every worker using the same database.
+
+    The holder extends the lease while its call runs and, on success, leaves the
+    result on the row for a few poll intervals so waiters in other workers can
+    pick it up whether or not the AI cache is enabled. Expired rows are deleted a
+    batch at a time as new leases are taken.
+
+    Lease errors fail open: if the table cannot be used the caller proceeds
+    as if it held the lease, trading duplicate work for availability.
+    """
+
+    def __init__(self, ttl_seconds: int) -> None:
+        self._ttl_seconds = ttl_seconds
+
+    def _try_acquire(self, bind: Engine, key: str, holder: str) -> bool:
+        now = datetime.utcnow()
+        expires_at = now + timedelta(seconds=self._ttl_seconds)
+        with Session(bind=bind) as db:
+            expired = (
+                select(AILease.lease_key)
+                .where(AILease.expires_at <= now, AILease.lease_key != key)
+                .limit(PURGE_BATCH_SIZE)
+                .scalar_subquery()
+            )
+            db.execute(delete(AILease).where(AILease.lease_key.in_(expired)))
+            db.commit()
+            try:
+                db.add(AILease(lease_key=key, holder=holder, expires_at=expires_at))
+                db.commit()
+                return True
+            except IntegrityError:
+                db.rollback()
+            # Take over a lease whose holder died without releasing it, or whose result has been kept long enough
+            stmt = (
+                update(AILease)
+                .where(AILease.lease_key == key, AILease.expires_at <= now)
+                .values(holder=holder, expires_at=expires_at, completed_at=None, result=None)
+            )
+            taken = db.execute(stmt).rowcount == 1
+            db.commit()
+            return taken
+
+    def _renew(self, bind: Engine, key: str, holder: str) -> bool:
+        expires_at = datetime.utcnow() + timedelta(seconds=self._ttl_seconds)
+        with Session(bind=bind) as db:
+            stmt = update(AILease).where(AILease.lease_key == key, AILease.holder == holder).values(expires_at=expires_at)
+            renewed = db.execute(stmt).rowcount == 1
+            db.commit()
+            return renewed
+
+    def _complete(self, bind: Engine, key: str, holder: str, result: Any) -> None:
+        now = datetime.utcnow()
+        # Long enough for every waiter to poll at least a few times
+        keep_seconds = max(RESULT_KEEP_SECONDS, 4 * config.AI_LEASE_POLL_INTERVAL)
+        with Session(bind=bind) as db:
+            db.execute(
+                update(AILease)
+                .where(AILease.lease_key == key, AILease.holder == holder)
+                .values(completed_at=now, result=result, expires_at=now + timedelta(seconds=keep_seconds))
+            )
+            db.commit()
+
+    def _result(self, bind: Engine, key: str) -> Optional[Any]:
+        with Session(bind=bind) as db:
+            stmt = select(AILease.result).where(
+                AILease.lease_key == key, AILease.completed_at.is_not(None), AILease.expires_at > datetime.utcnow()
+            )
+            return db.execute(stmt).scalar_one_or_none()
+
+    def _release(self, bind: Engine, key: str, holder: str) -> None:
+        with Session(bind=bind) as db:
+            db.execute(delete(AILease).where(AILease.lease_key == key, AILease.holder == holder))
+            db.commit()
+
+    async def try_acquire(self, bind: Engine, key: str) -> Optional[str]:
+        """Return a holder token if the lease was acquired, else None."""
+        holder = uuid.uuid4().hex
+        try:
+            acquired = await run_in_threadpool(self._try_acquire, bind, key, holder)
+        except Exception as e:
+            logger.error("AI lease acquire failed: %s", e, exc_info=True)
+            return holder
+        return holder if acquired else None
+
+    async def hold(self, bind: Engine, key: str, holder: str, call: Callable[[], Awaitable[Any]]) -> Any:
+        """Run `call`, extending the lease every third of its TTL until it returns.
+
+        A chunked analysis makes several deadline-bound model calls, so a fixed
+        expiry could lapse mid-run and let another worker start the same work.
+        """
+
+        async def renew() -> None:
+            while True:
+                await asyncio.sleep(self._ttl_seconds / 3)
+                try:
+                    if not await run_in_threadpool(self._renew, bind, key, holder):
+                        logger.warning("AI lease %s was lost while its call was running", key)
+                except Exception as e:
+                    logger.error("AI lease renewal failed: %s", e, exc_info=True)
+
+        renewer = asyncio.ensure_future(renew())
+        try:
+            return await call()
+        finally:
+            renewer.cancel()
+            await asyncio.gather(renewer, return_exceptions=True)
+
+    async def complete(self, bind: Engine, key: str, holder: str, result: Any) -> None:
+        """Publish `result` to waiting workers; the row then expires on its own."""
+        try:
+            await run_in_threadpool(self._complete, bind, key, holder, result)
+        except Exception as e:
+            logger.error("AI lease completion failed: %s", e, exc_info=True)
+            await self.release(bind, key, holder)
+
+    async def result(self, bind: Engine, key: str) -> Optional[Any]:
+        """Return the result a holder published under `key`, if it is still kept."""
+        try:
+            return await run_in_threadpool(self._result, bind, key)
+        except Exception as e:
+            logger.error("AI lease result lookup failed: %s", e, exc_info=True)
+            return None
+
+    async def release(self, bind: Engine, key: str, holder: str) -> None:
+        try:
+            await run_in_threadpool(self._release, bind, key, holder)
+        except Exception as e:
+            logger.error("AI lease release failed: %s", e, exc_info=True)
+
+
+single_flight = SingleFlight()
+ai_lease = DBLease(config.AI_LEASE_TTL_SECONDS)
+
+
+async def shared_ai_result(
+    bind: Engine,
+    cache_key: str,
+    kind: str,
+    model: str,
+    prompt_version: str,
+    call: Callable[[], Awaitable[Any]],
+) -> Any:
+    """Return the AI result for `cache_key`, calling the model at most once at a time.
+
+    Concurrent callers in this process share one in-flight call; callers in other
+    processes wait on the database lease and pick the result up from the lease row
+    (or the cache), so coalescing works with AI_CACHE_ENABLED=false too.
+    `call` must validate what it returns, since the result is cached and shared.
+    """
+
+    async def load() -> Any:
+        cached = await ai_cache.get(bind, cache_key)
+        if cached is not None:
+            return cached
+
+        while True:
+            holder = await ai_lease.try_acquire(bind, cache_key)
+            if holder is not None:
+                break
+            await asyncio.sleep(config.AI_LEASE_POLL_INTERVAL)
+            published = await ai_lease.result(bind, cache_key)
+            if published is not None:
+                return published
+            cached = await ai_cache.get(bind, cache_key, record=False)
+            if cached is not None:
+                return cached
+
+        completed = False
+        try:
+            # Another worker may have finished between our miss and the acquire
+            cached = await ai_cache.get(bind, cache_key, record=False)
+            if cached is not None:
+                return cached
+            result = await ai_lease.hold(bind, cache_key, holder, call)
+            await ai_cache.put(bind, cache_key, kind, model, prompt_version, result)
+            await ai_lease.complete(bind, cache_key, holder, result)
+            completed = True
+            return result
+        finally:
+            if not completed:
+                await ai_lease.release(bind, cache_key, holder)
+
+    return await single_flight.do(cache_key, load)
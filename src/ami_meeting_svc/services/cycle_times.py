@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import logging
+from datetime import date, datetime, time, timedelta
+from typing import List, Optional
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from ami_meeting_svc.models import ActionItemStatusTransition
+from ami_meeting_svc.schemas.dashboard import CycleTimeGroup, CycleTimeGroupBy, CycleTimeReport, Percentiles
+
+logger = logging.getLogger(__name__)
+
+# Lead and cycle time percentiles over `action_item_status_transitions`. An item
+# counts once it is Done: lead time runs from its first transition (creation) to
+# its last move to Done, cycle time from its first move to In Progress. The
+# per-item arithmetic runs on NumPy arrays over the whole history at once.
+
+DONE = "Done"
+IN_PROGRESS = "In Progress"
+PERCENTILES = (50, 90, 99)
+
+
+def _day_start(day: date) -> datetime:
+    return datetime.combine(day, time.min)
+
+
+def _seconds(moments: np.ndarray) -> np.ndarray:
+    """Naive UTC datetimes as float seconds since the epoch."""
+    return np.asarray(moments, dtype="datetime64[us]").astype(np.int64) / 1e6
+
+
+def _percentiles(seconds: np.ndarray) -> Percentiles:
+    p50, p90, p99 = np.round(np.percentile(seconds, PERCENTILES) / 3600.0, 2)
+    return Percentiles(p50=float(p50), p90=float(p90), p99=float(p99))
+
+
+def get_cycle_times(
+    db: Session,
+    owner_id: int,
+    group_by: CycleTimeGroupBy = "assignee",
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+) -> CycleTimeReport:
+    """Percentile lead and cycle times of `owner_id`'s completed action items, per assignee or priority.
+
+    Only items whose latest status is Done count, grouped by their assignee or
+    priority at completion; `start`/`end` (inclusive, UTC) bound the completion day.
+    """
+    transition = ActionItemStatusTransition
+    completed = select(transition.action_item_id).where(
+        transition.owner_id == owner_id, transition.to_status == DONE
+    )
+    if start is not None:
+        completed = completed.where(transition.changed_at >= _day_start(start))
+    if end is not None:
+        completed = completed.where(transition.changed_at < _day_start(end + timedelta(days=1)))
+    stmt = (
+        select(transition.action_item_id, transition.changed_at, transition.to_status, getattr(transition, group_by))
+        .where(transition.owner_id == owner_id, transition.action_item_id.in_(completed.distinct()))
+        .order_by(transition.action_item_id, transition.changed_at, transition.id)
+    )
+    try:
+        rows = db.execute(stmt).all()
+    except Exception as e:
+        logger.error(e, exc_info=True)
+        raise
+
+    report = CycleTimeReport(group_by=group_by, start=start, end=end, groups=[])
+    if not rows:
+        return report
+
+    item_ids, changed_at, statuses, keys = (np.asarray(column, dtype=object) for column in zip(*rows))
+    item_ids = item_ids.astype(np.int64)
+    seconds = _seconds(changed_at)
+
+    # Rows are ordered by item, so each item is one contiguous run
+    firsts = np.flatnonzero(np.r_[True, item_ids[1:] != item_ids[:-1]])
+    lasts = np.r_[firsts[1:], len(item_ids)] - 1
+    completed_at = seconds[lasts]
+    lead = completed_at - seconds[firsts]
+    started_at = np.minimum.reduceat(np.where(statuses == IN_PROGRESS, seconds, np.inf), firsts)
+    cycle = completed_at - started_at
+
+    done = statuses[lasts] == DONE
+    if start is not None:
+        done &= completed_at >= _seconds(_day_start(start))
+    if end is not None:
+        done &= completed_at < _seconds(_day_start(end + timedelta(days=1)))
+
+    # None (unassigned) sorts first as ""
+    group_keys = np.array(["" if key is None else key for key in keys[lasts]], dtype=object)[done]
+    lead, cycle = lead[done], cycle[done]
+    names, inverse = np.unique(group_keys, return_inverse=True)
+    groups: List[CycleTimeGroup] = []
+    for index, name in enumerate(names):
+        members = inverse == index
+        group_cycle = cycle[members & np.isfinite(cycle)]
+        groups.append(
+            CycleTimeGroup(
+                key=name or None,
+                completed_count=int(members.sum()),
+                lead_time_hours=_percentiles(lead[members]),
+                cycle_time_count=len(group_cycle),
+                cycle_time_hours=_percentiles(group_cycle) if len(group_cycle) else None,
+            )
+        )
+    report.groups = groups
+    return report
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional
+
+from ami_meeting_svc import config
+from ami_meeting_svc.schemas.dashboard import DashboardMetrics
+
+logger = logging.getLogger(__name__)
+
+# In-process cache of GET /dashboard/metrics, one entry per user. Writes to a
+# user's action items invalidate the entry when their transaction commits
+# (services/metrics_rollup.py); other worker processes only see the change once
+# their entry's short TTL runs out.
+
+
+def metrics_etag(metrics: DashboardMetrics) -> str:
+    """Strong ETag of the serialized metrics: equal bodies always get equal tags."""
+    return '"' + hashlib.sha256(metrics.model_dump_json().encode("utf8")).hexdigest()[:32] + '"'
+
+
+@dataclass(frozen=True)
+class CachedMetrics:
+    metrics: DashboardMetrics
+    etag: str
+
+
+@dataclass
+class _Entry:
+    expires_at: float
+    value: CachedMetrics
+
+
+class DashboardCache:
+    """Per-user TTL cache with one loader per user at a time.
+
+    Concurrent misses for the same user wait for the first loader instead of
+    each running the aggregation (stampede protection). A load that overlaps an
+    invalidation of its user, or a clear(), is returned to its caller but not
+    stored.
+    """
+
+    def __init__(self) -> None:
+        self._entries: Dict[int, _Entry] = {}
+        self._generations: Dict[int, int] = {}
+        # Bumped by clear(); generations are never reset, so an in-flight load cannot match again
+        self._epoch = 0
+        self._loader_locks: Dict[int, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _fresh(self, owner_id: int) -> Optional[CachedMetrics]:
+        with self._lock:
+            entry = self._entries.get(owner_id)
+            if entry is None:
+                return None
+            if entry.expires_at <= time.monotonic():
+                del self._entries[owner_id]
+                return None
+            self.hits += 1
+            return entry.value
+
+    def get(self, owner_id: int, load: Callable[[], DashboardMetrics]) -> CachedMetrics:
+        """Return the cached metrics of `owner_id`, calling `load` on a miss."""
+        ttl = config.DASHBOARD_CACHE_TTL_SECONDS
+        if ttl <= 0:
+            metrics = load()
+            return CachedMetrics(metrics, metrics_etag(metrics))
+
+        cached = self._fresh(owner_id)
+        if cached is not None:
+            return cached
+        with self._lock:
+            loader_lock = self._loader_locks.setdefault(owner_id, threading.Lock())
+        with loader_lock:
+            # Whoever held the lock before us has probably filled the entry
+            cached = self._fresh(owner_id)
+            if cached is not None:
+                return cached
+            with self._lock:
+                self.misses += 1
+                version = (self._epoch, self._generations.get(owner_id, 0))
+            metrics = load()
+            value = CachedMetrics(metrics, metrics_etag(metrics))
+            with self._lock:
+                if (self._epoch, self._generations.get(owner_id, 0)) == version:
+                    self._entries[owner_id] = _Entry(time.monotonic() + ttl, value)
+            return value
+
+    def invalidate(self, owner_id: int) -> None:
+        with self._lock:
+            self._entries.pop(owner_id, None)
+            self._generations[owner_id] = self._generations.get(owner_id, 0) + 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._epoch += 1
+            self._loader_locks.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+dashboard_cache = DashboardCache()
@@ -1,73 +1,209 @@
 from __future__ import annotations
 
 import logging
-from typing import Dict, Any, List
+from datetime import date, timedelta
+from typing import Dict, Any, List, Optional
 
-from sqlalchemy import select, func
+from sqlalchemy import case, func, select
 from sqlalchemy.orm import Session
 
-from ami_meeting_svc.models import ActionItem
-from ami_meeting_svc.schemas.dashboard import DashboardMetrics, AssigneeStats
+from ami_meeting_svc import config
+from ami_meeting_svc.models import ActionItem, ActionItemDailyMetric, ActionItemMetric, Meeting
+from ami_meeting_svc.models.action_item_metric import UNASSIGNED
+from ami_meeting_svc.schemas.dashboard import (
+    AssigneeStats,
+    DashboardMetrics,
+    DashboardTimeseries,
+    Granularity,
+    TimeseriesPoint,
+)
 
 logger = logging.getLogger(__name__)
 
+STATUSES = ("To Do", "In Progress", "Done")
+# Longest range GET /dashboard/timeseries serves, in days
+MAX_TIMESERIES_DAYS = 731
 
-def get_dashboard_metrics(db: Session) -> DashboardMetrics:
-    try:
-        # total items
-        stmt_total = select(func.count()).select_from(ActionItem)
-        total_items = int(db.execute(stmt_total).scalar_one())
-
-        # done items
-        stmt_done = select(func.count()).select_from(ActionItem).where(ActionItem.status == "Done")
-        done_count = int(db.execute(stmt_done).scalar_one())
-
-        # overdue
-        stmt_overdue = select(func.count()).select_from(ActionItem).where(ActionItem.is_overdue == True)
-        overdue_count = int(db.execute(stmt_overdue).scalar_one())
-
-        # completion rate
-        if total_items == 0:
-            completion_rate = 0.0
-        else:
-            completion_rate = round((done_count / total_items) * 100.0, 1)
-
-        # per-assignee aggregation: assignee + status
-        stmt_group = (
-            select(ActionItem.assignee, ActionItem.status, func.count().label("cnt"))
-            .group_by(ActionItem.assignee, ActionItem.status)
-        )
-        rows = db.execute(stmt_group).all()
-
-        # build mapping
-        stats_map: Dict[Any, Dict[str, int]] = {}
-        for assignee, status, cnt in rows:
-            key = assignee  # can be None
-            if key not in stats_map:
-                stats_map[key] = {"To Do": 0, "In Progress": 0, "Done": 0}
-            # normalize status keys to expected ones
-            stats_map[key][status] = int(cnt)
-
-        # build AssigneeStats list sorted deterministically by assignee string (None -> empty string)
-        assignee_stats_list: List[AssigneeStats] = []
-        for assignee_key in sorted(stats_map.keys(), key=lambda x: "" if x is None else str(x)):
-            counts = stats_map[assignee_key]
-            assignee_stats_list.append(
-                AssigneeStats(
-                    assignee=assignee_key,
-                    todo_count=counts.get("To Do", 0),
-                    in_progress_count=counts.get("In Progress", 0),
-                    done_count=counts.get("Done", 0),
-                )
+
+def _build_metrics(stats_map: Dict[Any, Dict[str, int]], total_items: int, overdue_count: int) -> DashboardMetrics:
+    done_count = sum(counts.get("Done", 0) for counts in stats_map.values())
+
+    # completion rate
+    if total_items == 0:
+        completion_rate = 0.0
+    else:
+        completion_rate = round((done_count / total_items) * 100.0, 1)
+
+    # build AssigneeStats list sorted deterministically by assignee string (None -> empty string)
+    assignee_stats_list: List[AssigneeStats] = []
+    for assignee_key in sorted(stats_map.keys(), key=lambda x: "" if x is None else str(x)):
+        counts = stats_map[assignee_key]
+        assignee_stats_list.append(
+            AssigneeStats(
+                assignee=assignee_key,
+                todo_count=counts.get("To Do", 0),
+                in_progress_count=counts.get("In Progress", 0),
+                done_count=counts.get("Done", 0),
             )
+        )
+
+    return DashboardMetrics(
+        total_items=total_items,
+        completion_rate=completion_rate,
+        overdue_count=overdue_count,
+        assignee_stats=assignee_stats_list,
+    )
+
+
+def _assignee_key(assignee: Optional[str]) -> Optional[str]:
+    return None if assignee in (None, UNASSIGNED) else assignee
 
-        return DashboardMetrics(
-            total_items=total_items,
-            completion_rate=completion_rate,
-            overdue_count=overdue_count,
-            assignee_stats=assignee_stats_list,
+
+def read_rollup_metrics(db: Session, owner_id: int) -> DashboardMetrics:
+    """Metrics from the counters in `action_item_metrics` (kept current by
+    services/metrics_rollup.py): one row per assignee and status, however many
+    action items there are."""
+    stmt = select(
+        ActionItemMetric.assignee,
+        ActionItemMetric.status,
+        ActionItemMetric.item_count,
+        ActionItemMetric.overdue_count,
+    ).where(ActionItemMetric.owner_id == owner_id, ActionItemMetric.item_count > 0)
+
+    total_items = 0
+    overdue_count = 0
+    stats_map: Dict[Any, Dict[str, int]] = {}
+    for assignee, status, item_count, item_overdue in db.execute(stmt).all():
+        total_items += item_count
+        overdue_count += item_overdue
+        counts = stats_map.setdefault(_assignee_key(assignee), dict.fromkeys(STATUSES, 0))
+        counts[status] = int(item_count)
+    return _build_metrics(stats_map, total_items, overdue_count)
+
+
+def _count_where(condition):
+    return func.coalesce(func.sum(case((condition, 1), else_=0)), 0)
+
+
+def compute_dashboard_metrics(db: Session, owner_id: int) -> DashboardMetrics:
+    """Metrics computed from `action_items` directly, in one grouped query.
+
+    Joins through `Meeting.owner_id` so only the owner's items are read, and
+    counts every status and overdue flag per assignee with conditional sums;
+    the composite indexes on meetings(owner_id, id) and
+    action_items(meeting_id, assignee, status, is_overdue) cover the scan.
+    """
+    assignee = func.coalesce(ActionItem.assignee, UNASSIGNED)
+    stmt = (
+        select(
+            assignee,
+            func.count(ActionItem.id),
+            _count_where(ActionItem.is_overdue == True),
+            *(_count_where(ActionItem.status == status) for status in STATUSES),
         )
+        .join(Meeting, Meeting.id == ActionItem.meeting_id)
+        .where(Meeting.owner_id == owner_id)
+        .group_by(assignee)
+    )
+
+    total_items = 0
+    overdue_count = 0
+    stats_map: Dict[Any, Dict[str, int]] = {}
+    for assignee_value, item_count, item_overdue, *status_counts in db.execute(stmt).all():
+        total_items += item_count
+        overdue_count += item_overdue
+        stats_map[_assignee_key(assignee_value)] = dict(zip(STATUSES, (int(c) for c in status_counts)))
+    return _build_metrics(stats_map, total_items, overdue_count)
+
+
+def get_dashboard_metrics(db: Session, owner_id: int) -> DashboardMetrics:
+    """Metrics over the action items of `owner_id`'s meetings.
+
+    Served from the rollup counters by default; DASHBOARD_METRICS_SOURCE=live
+    computes them from `action_items` instead (see compute_dashboard_metrics).
+    """
+    try:
+        if config.DASHBOARD_METRICS_SOURCE == "live":
+            return compute_dashboard_metrics(db, owner_id)
+        return read_rollup_metrics(db, owner_id)
     except Exception as e:
         logger.error(e, exc_info=True)
         # In case of DB error, raise the exception to caller to handle/log as HTTP 500
         raise
+
+
+def _completion_rate(done: int, total: int) -> float:
+    return 0.0 if total <= 0 else round((done / total) * 100.0, 1)
+
+
+def _period_start(day: date, granularity: Granularity) -> date:
+    # Weeks start on Monday (ISO 8601)
+    return day - timedelta(days=day.weekday()) if granularity == "week" else day
+
+
+def get_dashboard_timeseries(
+    db: Session, owner_id: int, start: date, end: date, granularity: Granularity = "day"
+) -> DashboardTimeseries:
+    """Per-day or per-week activity and end-of-period totals for `owner_id`, from `start` to `end` inclusive.
+
+    Reads `action_item_daily_metrics` only: one row per active day, summed up
+    to `start` for the opening totals and walked through the range.
+    """
+    try:
+        daily = ActionItemDailyMetric
+        opening = db.execute(
+            select(
+                func.coalesce(func.sum(daily.item_delta), 0),
+                func.coalesce(func.sum(daily.done_delta), 0),
+                func.coalesce(func.sum(daily.overdue_delta), 0),
+            ).where(daily.owner_id == owner_id, daily.day < start)
+        ).one()
+        rows = db.execute(
+            select(
+                daily.day,
+                daily.created_count,
+                daily.completed_count,
+                daily.item_delta,
+                daily.done_delta,
+                daily.overdue_delta,
+            ).where(daily.owner_id == owner_id, daily.day >= start, daily.day <= end)
+        ).all()
+    except Exception as e:
+        logger.error(e, exc_info=True)
+        raise
+
+    by_day = {row.day: row for row in rows}
+    total, done, overdue = (int(value) for value in opening)
+    points: List[TimeseriesPoint] = []
+    day = start
+    while day <= end:
+        period_start = max(_period_start(day, granularity), start)
+        if not points or points[-1].period_start != period_start:
+            points.append(
+                TimeseriesPoint(
+                    period_start=period_start,
+                    period_end=period_start,
+                    created_count=0,
+                    completed_count=0,
+                    total_items=total,
+                    done_items=done,
+                    overdue_count=overdue,
+                    completion_rate=_completion_rate(done, total),
+                )
+            )
+        point = points[-1]
+        row = by_day.get(day)
+        if row is not None:
+            total += row.item_delta
+            done += row.done_delta
+            overdue += row.overdue_delta
+            point.created_count += row.created_count
+            point.completed_count += row.completed_count
+        point.period_end = day
+        point.total_items = total
+        point.done_items = done
+        point.overdue_count = overdue
+        point.completion_rate = _completion_rate(done, total)
+        day += timedelta(days=1)
+
+    return DashboardTimeseries(start=start, end=end, granularity=granularity, points=points)
@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import math
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Optional, Tuple
+
+from fastapi import Depends, Header, HTTPException, Request, status
+from fastapi.responses import JSONResponse, Response
+from sqlalchemy import and_, delete, or_, select, update
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from ami_meeting_svc import config
+from ami_meeting_svc.models import IdempotencyKey, User
+from ami_meeting_svc.models.base import get_db
+from ami_meeting_svc.utils.security import get_current_user
+
+logger = logging.getLogger(__name__)
+
+STATUS_IN_PROGRESS = "in_progress"
+STATUS_COMPLETED = "completed"
+
+MAX_KEY_LENGTH = 255
+# Set on responses replayed from the table rather than produced by this request
+REPLAYED_HEADER = "Idempotent-Replayed"
+# Recomputed by JSONResponse when the stored body is replayed
+_UNSTORED_HEADERS = {"content-length", "content-type"}
+# Expired keys deleted per claim; each claim adds at most one row, so this keeps up
+PURGE_BATCH_SIZE = 100
+
+RouteCall = Callable[[], Awaitable[Response]]
+
+
+def _key_hash(owner_id: int, key: str) -> str:
+    return hashlib.sha256(f"{owner_id}:{key}".encode("utf8")).hexdigest()
+
+
+def request_fingerprint(method: str, path: str, query: str, body: bytes) -> str:
+    digest = hashlib.sha256(f"{method}\n{path}\n{query}\n".encode("utf8"))
+    digest.update(body)
+    return digest.hexdigest()
+
+
+def _replay(row: IdempotencyKey) -> JSONResponse:
+    headers = dict(row.response_headers or {}, **{REPLAYED_HEADER: "true"})
+    return JSONResponse(status_code=row.response_status, content=row.response_body, headers=headers)
+
+
+class IdempotencyStore:
+    """Idempotency keys in the `idempotency_keys` table, shared by every worker.
+
+    The first request with a key claims it and runs; a successful (2xx) response
+    is stored and replayed to later requests with the same key and fingerprint.
+    Failures release the key so the client can retry with it. Expired keys are
+    deleted a batch at a time as new keys are claimed.
+    """
+
+    def _purge_expired(self, db: Session, now: datetime) -> int:
+        expired = (
+            select(IdempotencyKey.key_hash)
+            .where(IdempotencyKey.expires_at <= now)
+            .limit(PURGE_BATCH_SIZE)
+            .scalar_subquery()
+        )
+        deleted = db.execute(delete(IdempotencyKey).where(IdempotencyKey.key_hash.in_(expired))).rowcount
+        db.commit()
+        return deleted
+
+    def _claim(
+        self, bind: Engine, key_hash: str, owner_id: int, fingerprint: str, holder: str
+    ) -> Tuple[bool, Optional[IdempotencyKey]]:
+        """Return (True, None) if this request claimed the key, else (False, existing row or None)."""
+        now = datetime.utcnow()
+        values = dict(
+            owner_id=owner_id,
+            fingerprint=fingerprint,
+            status=STATUS_IN_PROGRESS,
+            holder=holder,
+            response_status=None,
+            response_body=None,
+            response_headers=None,
+            locked_until=now + timedelta(seconds=config.IDEMPOTENCY_LOCK_SECONDS),
+            expires_at=now + timedelta(seconds=config.IDEMPOTENCY_KEY_TTL_SECONDS),
+        )
+        with Session(bind=bind) as db:
+            try:
+                self._purge_expired(db, now)
+            except Exception as e:
+                db.rollback()
+                logger.warning("Purging expired idempotency keys failed: %s", e)
+            try:
+                db.add(IdempotencyKey(key_hash=key_hash, **values))
+                db.commit()
+                return True, None
+            except IntegrityError:
+                db.rollback()
+            # Reuse an expired key, or take over the same request from a holder that died mid-flight
+            stmt = (
+                update(IdempotencyKey)
+                .where(
+                    IdempotencyKey.key_hash == key_hash,
+                    or_(
+                        IdempotencyKey.expires_at <= now,
+                        and_(
+                            IdempotencyKey.status == STATUS_IN_PROGRESS,
+                            IdempotencyKey.locked_until <= now,
+                            IdempotencyKey.fingerprint == fingerprint,
+                        ),
+                    ),
+                )
+                .values(**values)
+            )
+            taken = db.execute(stmt).rowcount == 1
+            db.commit()
+            if taken:
+                return True, None
+            row = db.execute(select(IdempotencyKey).where(IdempotencyKey.key_hash == key_hash)).scalar_one_or_none()
+            if row is not None:
+                db.expunge(row)
+            return False, row
+
+    def _complete(self, bind: Engine, key_hash: str, holder: str, response: Response) -> None:
+        headers = {name: value for name, value in response.headers.items() if name not in _UNSTORED_HEADERS}
+        with Session(bind=bind) as db:
+            stmt = (
+                update(IdempotencyKey)
+                .where(IdempotencyKey.key_hash == key_hash, IdempotencyKey.holder == holder)
+                .values(
+                    status=STATUS_COMPLETED,
+                    response_status=response.status_code,
+                    response_body=json.loads(response.body),
+                    response_headers=headers,
+                    expires_at=datetime.utcnow() + timedelta(seconds=config.IDEMPOTENCY_KEY_TTL_SECONDS),
+                )
+            )
+            db.execute(stmt)
+            db.commit()
+
+    def _release(self, bind: Engine, key_hash: str, holder: str) -> None:
+        with Session(bind=bind) as db:
+            db.execute(delete(IdempotencyKey).where(IdempotencyKey.key_hash == key_hash, IdempotencyKey.holder == holder))
+            db.commit()
+
+    async def run(self, bind: Engine, owner_id: int, key: str, fingerprint: str, call: RouteCall) -> Response:
+        """Run `call` at most once per (owner, key); concurrent duplicates wait for its response."""
+        key_hash = _key_hash(owner_id, key)
+        holder = uuid.uuid4().hex
+        give_up_at = time.monotonic() + config.IDEMPOTENCY_WAIT_SECONDS
+        while True:
+            claimed, row = await run_in_threadpool(self._claim, bind, key_hash, owner_id, fingerprint, holder)
+            if claimed:
+                break
+            # row is None when the key was released between our insert and the read: claim again
+            if row is not None:
+                if row.fingerprint != fingerprint:
+                    raise HTTPException(
+                        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                        detail="Idempotency-Key was already used for a different request",
+                    )
+                if row.status == STATUS_COMPLETED:
+                    return _replay(row)
+            if time.monotonic() >= give_up_at:
+                retry_after = max(1, math.ceil(config.IDEMPOTENCY_POLL_INTERVAL))
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail="A request with this Idempotency-Key is still in progress",
+                    headers={"Retry-After": str(retry_after)},
+                )
+            await asyncio.sleep(config.IDEMPOTENCY_POLL_INTERVAL)
+
+        try:
+            response = await call()
+        except BaseException:
+            await self._release_quietly(bind, key_hash, holder)
+            raise
+
+        if not 200 <= response.status_code < 300:
+            await self._release_quietly(bind, key_hash, holder)
+            return response
+        try:
+            await run_in_threadpool(self._complete, bind, key_hash, holder, response)
+        except Exception as e:
+            # The work is done; a retry after the lock expires may repeat it, which beats failing now
+            logger.error("Storing idempotent response failed: %s", e, exc_info=True)
+        return response
+
+    async def _release_quietly(self, bind: Engine, key_hash: str, holder: str) -> None:
+        try:
+            await run_in_threadpool(self._release, bind, key_hash, holder)
+        except Exception as e:
+            logger.error("Releasing idempotency key failed: %s", e, exc_info=True)
+
+
+idempotency_store = IdempotencyStore()
+
+
+class IdempotentRequest:
+    """Handle given to routes that honour the Idempotency-Key header."""
+
+    def __init__(self, bind: Engine, owner_id: int, key: Optional[str], fingerprint: str) -> None:
+        self.bind = bind
+        self.owner_id = owner_id
+        self.key = key
+        self.fingerprint = fingerprint
+
+    async def run(self, call: RouteCall) -> Response:
+        """Run the route body, or replay its stored response for a repeated key."""
+        if self.key is None:
+            return await call()
+        return await idempotency_store.run(self.bind, self.owner_id, self.key, self.fingerprint, call)
+
+
+async def idempotency(
+    request: Request,
+    idempotency_key: Optional[str] = Header(None),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+) -> IdempotentRequest:
+    """FastAPI dependency reading the optional Idempotency-Key header of the current user's request."""
+    if idempotency_key is None:
+        return IdempotentRequest(db.get_bind(), current_user.id, None, "")
+    idempotency_key = idempotency_key.strip()
+    if not idempotency_key or len(idempotency_key) > MAX_KEY_LENGTH:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Idempotency-Key must be 1 to {MAX_KEY_LENGTH} characters",
+        )
+    fingerprint = request_fingerprint(request.method, request.url.path, request.url.query, await request.body())
+    return IdempotentRequest(db.get_bind(), current_user.id, idempotency_key, fingerprint)
@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from fastapi import HTTPException
+from sqlalchemy import select, update
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from ami_meeting_svc import config
+from ami_meeting_svc.models import Job, Meeting
+from ami_meeting_svc.models.base import engine
+from ami_meeting_svc.schemas.meeting import AnalyzeAndExtractResponse, MeetingResponse
+from ami_meeting_svc.services.ai_service import OpenAIService
+from ami_meeting_svc.services.meeting_ai import (
+    analyze_and_extract_meeting,
+    analyze_meeting_notes,
+    extract_meeting_actions,
+)
+
+logger = logging.getLogger(__name__)
+
+JOB_KIND_ANALYZE = "analyze"
+JOB_KIND_EXTRACT_ACTIONS = "extract_actions"
+JOB_KIND_ANALYZE_AND_EXTRACT = "analyze_and_extract"
+
+JobHandler = Callable[[Session, Meeting], Awaitable[Any]]
+
+
+async def _run_analyze(db: Session, meeting: Meeting) -> Dict[str, Any]:
+    meeting = await analyze_meeting_notes(db, meeting, OpenAIService)
+    return MeetingResponse.model_validate(meeting).model_dump(mode="json")
+
+
+async def _run_extract_actions(db: Session, meeting: Meeting) -> List[Dict[str, Any]]:
+    outcome = await extract_meeting_actions(db, meeting, OpenAIService)
+    return [item.model_dump(mode="json") for item in outcome.action_items]
+
+
+async def _run_analyze_and_extract(db: Session, meeting: Meeting) -> Dict[str, Any]:
+    outcome = await analyze_and_extract_meeting(db, meeting, OpenAIService)
+    return AnalyzeAndExtractResponse.model_validate(outcome).model_dump(mode="json")
+
+
+# Job results are stored in the same shape the synchronous endpoint would return.
+JOB_HANDLERS: Dict[str, JobHandler] = {
+    JOB_KIND_ANALYZE: _run_analyze,
+    JOB_KIND_EXTRACT_ACTIONS: _run_extract_actions,
+    JOB_KIND_ANALYZE_AND_EXTRACT: _run_analyze_and_extract,
+}
+
+
+def enqueue_job(db: Session, kind: str, meeting_id: int, owner_id: int) -> Job:
+    """Persist a queued job. The caller submits its id to the queue once committed."""
+    if kind not in JOB_HANDLERS:
+        raise ValueError(f"Unknown job kind: {kind}")
+    job = Job(kind=kind, meeting_id=meeting_id, owner_id=owner_id, status="queued")
+    db.add(job)
+    db.commit()
+    db.refresh(job)
+    return job
+
+
+def _claim_job(db: Session, job_id: int) -> bool:
+    # Compare-and-set so a job is only ever run once, even if submitted twice
+    stmt = (
+        update(Job)
+        .where(Job.id == job_id, Job.status == "queued")
+        .values(status="running", started_at=datetime.utcnow(), attempts=Job.attempts + 1)
+    )
+    res = db.execute(stmt)
+    db.commit()
+    return res.rowcount == 1
+
+
+def _finish_job(db: Session, job_id: int, status: str, result: Any, error: Optional[str]) -> None:
+    # Discard whatever state a failed handler left in the session before recording the outcome
+    db.rollback()
+    stmt = (
+        update(Job)
+        .where(Job.id == job_id)
+        .values(status=status, result=result, error=error, finished_at=datetime.utcnow())
+    )
+    db.execute(stmt)
+    db.commit()
+
+
+def mark_job_failed(db: Session, job_id: int, error: str) -> None:
+    """Record a job as failed without running it (e.g. it could not be handed to the queue)."""
+    _finish_job(db, job_id, "failed", None, error)
+
+
+def _recover_stale_jobs(bind: Engine) -> None:
+    # Only jobs running past the cutoff: a younger one may belong to another live process
+    now = datetime.utcnow()
+    stale = (Job.status == "running", Job.started_at < now - timedelta(seconds=config.JOB_STALE_SECONDS))
+    with Session(bind=bind) as db:
+        failed = db.execute(
+            update(Job)
+            .where(*stale, Job.attempts >= config.JOB_MAX_ATTEMPTS)
+            .values(status="failed", error="Job was interrupted", finished_at=now)
+        ).rowcount
+        requeued = db.execute(update(Job).where(*stale).values(status="queued", started_at=None)).rowcount
+        db.commit()
+    if failed or requeued:
+        logger.warning("Recovered interrupted jobs: %s queued again, %s failed", requeued, failed)
+
+
+def _queued_job_ids(bind: Engine) -> List[int]:
+    with Session(bind=bind) as db:
+        stmt = select(Job.id).where(Job.status == "queued").order_by(Job.id)
+        return list(db.execute(stmt).scalars().all())
+
+
+class JobQueue:
+    """In-process worker pool for background AI jobs.
+
+    Jobs are persisted in the `jobs` table; the asyncio queue only carries ids,
+    so jobs still queued when the process stops are picked up again on start,
+    along with jobs a crash left running (see _recover_stale_jobs).
+    """
+
+    def __init__(self, concurrency: int) -> None:
+        self._concurrency = max(1, concurrency)
+        self._queue: asyncio.Queue | None = None
+        self._workers: List[asyncio.Task] = []
+
+    @property
+    def running(self) -> bool:
+        return self._queue is not None
+
+    async def start(self, bind: Engine | None = None) -> None:
+        if self.running:
+            return
+        self._queue = asyncio.Queue()
+        self._workers = [asyncio.create_task(self._worker()) for _ in range(self._concurrency)]
+
+        bind = bind or engine
+        try:
+            await run_in_threadpool(_recover_stale_jobs, bind)
+            for job_id in await run_in_threadpool(_queued_job_ids, bind):
+                self.submit(job_id, bind)
+        except Exception as e:
+            logger.error("Failed to recover queued jobs: %s", e, exc_info=True)
+
+    async def stop(self) -> None:
+        workers, self._workers = self._workers, []
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        self._queue = None
+
+    def submit(self, job_id: int, bind: Engine) -> None:
+        """Schedule a committed job; `bind` is the engine the job row lives in."""
+        if self._queue is None:
+            raise RuntimeError("Job queue is not running")
+        self._queue.put_nowait((job_id, bind))
+
+    async def _worker(self) -> None:
+        queue = self._queue
+        while True:
+            job_id, bind = await queue.get()
+            try:
+                await self.process(job_id, bind)
+            except Exception as e:
+                logger.error("Job %s crashed: %s", job_id, e, exc_info=True)
+            finally:
+                queue.task_done()
+
+    async def join(self) -> None:
+        """Wait until every submitted job has been processed."""
+        if self._queue is not None:
+            await self._queue.join()
+
+    async def process(self, job_id: int, bind: Engine) -> None:
+        db = Session(bind=bind)
+        try:
+            if not await run_in_threadpool(_claim_job, db, job_id):
+                return
+
+            job = await run_in_threadpool(db.get, Job, job_id)
+            result: Any = None
+            error: Optional[str] = None
+            try:
+                handler = JOB_HANDLERS[job.kind]
+                meeting = await run_in_threadpool(db.get, Meeting, job.meeting_id)
+                if meeting is None or meeting.owner_id != job.owner_id:
+                    raise HTTPException(status_code=404, detail="Meeting not found")
+                result = await handler(db, meeting)
+                job_status = "succeeded"
+            except HTTPException as e:
+                job_status, error = "failed", str(e.detail)
+            except Exception as e:
+                logger.error(e, exc_info=True)
+                job_status, error = "failed", "Unexpected error"
+
+            await run_in_threadpool(_finish_job, db, job_id, job_status, result, error)
+        finally:
+            db.close()
+
+
+job_queue = JobQueue(config.JOB_WORKER_CONCURRENCY)
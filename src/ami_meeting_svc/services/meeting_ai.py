@@ -0,0 +1,697 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import hashlib
+import json
+import logging
+import math
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncIterator, Callable, List, Tuple
+
+from fastapi import HTTPException, status
+from sqlalchemy import insert, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from ami_meeting_svc import config
+from ami_meeting_svc.models import ActionItem, Meeting
+from ami_meeting_svc.schemas.action_item import ActionItemResponse, ExtractedActionItem, RejectedActionItem
+from ami_meeting_svc.services import prompts
+from ami_meeting_svc.services.action_item_parsing import (
+    ParsedActionItems,
+    apply_repairs,
+    parse_action_items,
+    raw_action_items,
+    salvaged_payload,
+)
+from ami_meeting_svc.services.ai_cache import ai_cache, make_cache_key
+from ami_meeting_svc.services.ai_service import OpenAIService, TokenUsage
+from ami_meeting_svc.services.circuit_breaker import CircuitOpenError
+from ami_meeting_svc.services.chunking import estimate_tokens, split_notes
+from ami_meeting_svc.services.coalescing import shared_ai_result
+from ami_meeting_svc.services.metrics_rollup import record_inserted
+from ami_meeting_svc.services.model_routing import (
+    TASK_ANALYSIS,
+    TASK_COMBINED,
+    TASK_EXTRACTION,
+    ModelChoice,
+    choose_model,
+)
+from ami_meeting_svc.services.rate_limiter import RateLimitWaitExceeded
+
+logger = logging.getLogger(__name__)
+
+# Shared by the HTTP routes and the background job worker. Errors are raised as
+# HTTPException so routes can propagate them unchanged and jobs can record the detail.
+
+# Called with `model_name=` set to the routed model (see services/model_routing.py)
+AIServiceFactory = Callable[..., OpenAIService]
+
+# (system_message, user_message), see services/prompts.py
+Prompt = Tuple[str, str]
+
+# Part of the AI cache keys; bumped in services/prompts.py with the templates
+ANALYSIS_PROMPT_VERSION = f"{prompts.ANALYSIS.version}+{prompts.SUMMARY_MERGE.version}"
+EXTRACTION_PROMPT_VERSION = f"{prompts.EXTRACTION.version}+{prompts.EXTRACTION_REPAIR.version}"
+COMBINED_PROMPT_VERSION = (
+    f"{prompts.COMBINED.version}+{prompts.SUMMARY_MERGE.version}+{prompts.EXTRACTION_REPAIR.version}"
+)
+INCREMENTAL_ANALYSIS_PROMPT_VERSION = prompts.INCREMENTAL_ANALYSIS.version
+
+ANALYSIS_KEYS = ("summary", "key_discussion_points", "decisions")
+
+
+def commit_and_refresh(db: Session, *objs) -> None:
+    db.add_all(objs)
+    db.commit()
+    for obj in objs:
+        db.refresh(obj)
+
+
+def insert_action_items(db: Session, items: List[ActionItem]) -> List[ActionItemResponse]:
+    """INSERT `items` and return them as responses without re-reading each row. Does not commit.
+
+    Uses one multi-row INSERT ... RETURNING on backends that support it;
+    elsewhere the rows are flushed and their generated columns loaded with a
+    single SELECT. Responses are in id order, which is insertion order.
+    """
+    if not items:
+        return []
+    if db.get_bind().dialect.insert_executemany_returning:
+        values = [
+            {
+                "meeting_id": item.meeting_id,
+                "description": item.description,
+                "assignee": item.assignee,
+                "priority": item.priority,
+                "deadline": item.deadline,
+            }
+            for item in items
+        ]
+        # Without sort_by_parameter_order: requesting it makes SQLite fall back to
+        # one INSERT per row, and the ids already give the order
+        rows = db.scalars(insert(ActionItem).returning(ActionItem), values).all()
+        # No flush ran, so the dashboard counters are not updated by the flush hook
+        record_inserted(db, rows)
+    else:
+        db.add_all(items)
+        db.flush()
+        stmt = (
+            select(ActionItem)
+            .where(ActionItem.id.in_([item.id for item in items]))
+            .execution_options(populate_existing=True)
+        )
+        rows = db.scalars(stmt).all()
+    rows = sorted(rows, key=lambda row: row.id)
+    return [ActionItemResponse.model_validate(row) for row in rows]
+
+
+def save_action_items(db: Session, items: List[ActionItem], *refresh: object) -> List[ActionItemResponse]:
+    """Commit the session's pending changes together with `items`, then refresh `refresh`."""
+    try:
+        responses = insert_action_items(db, items)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    for obj in refresh:
+        db.refresh(obj)
+    return responses
+
+
+def require_notes(meeting: Meeting) -> str:
+    notes = meeting.notes or ""
+    if not notes.strip():
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Meeting notes are empty")
+    return notes
+
+
+def _part_header(part: Tuple[int, int] | None) -> str:
+    if part is None:
+        return ""
+    index, total = part
+    return (
+        f"These notes are part {index} of {total} of a longer meeting. "
+        "Only report what appears in this part.\n"
+    )
+
+
+def build_analysis_prompt(notes: str, part: Tuple[int, int] | None = None) -> Prompt:
+    return prompts.ANALYSIS.render(part_header=_part_header(part), notes=notes)
+
+
+def build_incremental_analysis_prompt(previous_analysis: dict, appended_notes: str) -> Prompt:
+    return prompts.INCREMENTAL_ANALYSIS.render(
+        previous_analysis=json.dumps(previous_analysis, ensure_ascii=False), notes=appended_notes
+    )
+
+
+def build_summary_merge_prompt(summaries: List[str]) -> Prompt:
+    numbered = "\n".join(f"{idx}. {summary}" for idx, summary in enumerate(summaries, start=1))
+    return prompts.SUMMARY_MERGE.render(summaries=numbered)
+
+
+def build_extraction_prompt(
+    notes: str, analysis_result: dict | None, current_date: str, part: Tuple[int, int] | None = None
+) -> Prompt:
+    analysis_section = ""
+    if analysis_result:
+        try:
+            analysis_section = f"Existing analysis result:\n{json.dumps(analysis_result)}\n"
+        except Exception:
+            analysis_section = f"Existing analysis result:\n{analysis_result}\n"
+
+    return prompts.EXTRACTION.render(
+        current_date=current_date, analysis_section=analysis_section, part_header=_part_header(part), notes=notes
+    )
+
+
+def build_combined_prompt(notes: str, current_date: str, part: Tuple[int, int] | None = None) -> Prompt:
+    return prompts.COMBINED.render(current_date=current_date, part_header=_part_header(part), notes=notes)
+
+
+def _ai_error(e: Exception) -> HTTPException:
+    """Map a failed AI call to the HTTPException the routes and jobs report."""
+    if isinstance(e, HTTPException):
+        return e
+    if isinstance(e, (CircuitOpenError, RateLimitWaitExceeded)):
+        # Shed load immediately instead of queueing calls that are bound to fail
+        return HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="AI service temporarily unavailable",
+            headers={"Retry-After": str(max(1, math.ceil(e.retry_after)))},
+        )
+    logger.error(e, exc_info=True)
+    return HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="AI service error")
+
+
+async def _request_json(ai_service_factory: AIServiceFactory, prompt: Prompt, usage: TokenUsage | None = None) -> object:
+    system_message, user_message = prompt
+    try:
+        ai_service = ai_service_factory()
+        if usage is not None:
+            return await ai_service.get_completion(
+                prompt=user_message, system_message=system_message, json_mode=True, usage=usage
+            )
+        return await ai_service.get_completion(prompt=user_message, system_message=system_message, json_mode=True)
+    except Exception as e:
+        raise _ai_error(e)
+
+
+def split_for_analysis(notes: str) -> List[str]:
+    """Return the notes as one chunk, or several when they exceed the chunk token budget."""
+    budget = config.ANALYSIS_CHUNK_TOKEN_BUDGET
+    if budget <= 0 or estimate_tokens(notes) <= budget:
+        return [notes]
+    return split_notes(notes, budget)
+
+
+async def _map_prompts(
+    ai_service_factory: AIServiceFactory, chunk_prompts: List[Prompt], usage: TokenUsage | None = None
+) -> List[dict]:
+    """Run one JSON completion per prompt with at most ANALYSIS_CHUNK_CONCURRENCY in flight."""
+    semaphore = asyncio.Semaphore(max(1, config.ANALYSIS_CHUNK_CONCURRENCY))
+
+    async def run(prompt: Prompt) -> dict:
+        async with semaphore:
+            result = await _request_json(ai_service_factory, prompt, usage)
+        if not isinstance(result, dict):
+            logger.error("AI returned non-dict chunk result: %s", type(result))
+            raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Invalid AI response format")
+        return result
+
+    tasks = [asyncio.ensure_future(run(prompt)) for prompt in chunk_prompts]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+
+
+def _merge_unique(values: List[Any]) -> List[Any]:
+    """Concatenate chunk lists, dropping repeats (case/whitespace-insensitive for strings)."""
+    merged: List[Any] = []
+    seen = set()
+    for value in values:
+        key = " ".join(value.split()).casefold() if isinstance(value, str) else json.dumps(value, sort_keys=True, default=str)
+        if key not in seen:
+            seen.add(key)
+            merged.append(value)
+    return merged
+
+
+def _list_field(partials: List[dict], key: str) -> List[Any]:
+    values: List[Any] = []
+    for partial in partials:
+        field = partial.get(key)
+        if isinstance(field, list):
+            values.extend(field)
+        elif field:
+            values.append(field)
+    return values
+
+
+def _dedupe_action_items(items: List[Any]) -> List[Any]:
+    deduped: List[Any] = []
+    seen = set()
+    for item in items:
+        # The same task is often restated in several parts; keep its first mention
+        desc = item.get("description") if isinstance(item, dict) else None
+        key = " ".join(str(desc).split()).casefold() if desc else None
+        if key is not None and key in seen:
+            continue
+        if key is not None:
+            seen.add(key)
+        deduped.append(item)
+    return deduped
+
+
+async def _reduce_analysis(
+    ai_service_factory: AIServiceFactory, partials: List[dict], usage: TokenUsage | None = None
+) -> dict:
+    """Merge per-chunk analyses: de-duplicate the lists and condense the summaries with one call."""
+    summaries = [str(p["summary"]).strip() for p in partials if p.get("summary")]
+    summary = " ".join(summaries)
+    if len(summaries) > 1:
+        merged = await _request_json(ai_service_factory, build_summary_merge_prompt(summaries), usage)
+        if isinstance(merged, dict) and merged.get("summary"):
+            summary = merged["summary"]
+
+    return {
+        "summary": summary,
+        "key_discussion_points": _merge_unique(_list_field(partials, "key_discussion_points")),
+        "decisions": _merge_unique(_list_field(partials, "decisions")),
+    }
+
+
+async def _analyze_notes(ai_service_factory: AIServiceFactory, notes: str) -> dict:
+    chunks = split_for_analysis(notes)
+    total = len(chunks)
+    if total == 1:
+        result = await _request_json(ai_service_factory, build_analysis_prompt(notes))
+        if not isinstance(result, dict):
+            logger.error("AI returned non-dict result: %s", type(result))
+            raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Invalid AI response format")
+        return result
+
+    # Map: analyze chunks concurrently; reduce: merge lists and condense the summaries
+    chunk_prompts = [build_analysis_prompt(chunk, part=(idx, total)) for idx, chunk in enumerate(chunks, start=1)]
+    partials = await _map_prompts(ai_service_factory, chunk_prompts)
+    return await _reduce_analysis(ai_service_factory, partials)
+
+
+async def _extract_notes(
+    ai_service_factory: AIServiceFactory, notes: str, analysis_result: dict | None, current_date: str
+) -> object:
+    chunks = split_for_analysis(notes)
+    total = len(chunks)
+    if total == 1:
+        return await _request_json(ai_service_factory, build_extraction_prompt(notes, analysis_result, current_date))
+
+    chunk_prompts = [
+        build_extraction_prompt(chunk, analysis_result, current_date, part=(idx, total))
+        for idx, chunk in enumerate(chunks, start=1)
+    ]
+    partials = await _map_prompts(ai_service_factory, chunk_prompts)
+    return {"action_items": _dedupe_action_items(_list_field(partials, "action_items"))}
+
+
+async def _analyze_and_extract_notes(
+    ai_service_factory: AIServiceFactory, notes: str, current_date: str, usage: TokenUsage
+) -> dict:
+    chunks = split_for_analysis(notes)
+    total = len(chunks)
+    if total == 1:
+        result = await _request_json(ai_service_factory, build_combined_prompt(notes, current_date), usage)
+        if not isinstance(result, dict):
+            logger.error("AI returned non-dict result: %s", type(result))
+            raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Invalid AI response format")
+        return result
+
+    chunk_prompts = [
+        build_combined_prompt(chunk, current_date, part=(idx, total)) for idx, chunk in enumerate(chunks, start=1)
+    ]
+    partials = await _map_prompts(ai_service_factory, chunk_prompts, usage)
+    result = await _reduce_analysis(ai_service_factory, partials, usage)
+    result["action_items"] = _dedupe_action_items(_list_field(partials, "action_items"))
+    return result
+
+
+def build_repair_prompt(rejected: List[RejectedActionItem], current_date: str) -> Prompt:
+    items = [{"item": rejection.item, "errors": rejection.errors} for rejection in rejected]
+    return prompts.EXTRACTION_REPAIR.render(
+        current_date=current_date, items=json.dumps(items, ensure_ascii=False, indent=2, default=str)
+    )
+
+
+async def salvage_action_items(
+    ai_service_factory: AIServiceFactory, result: object, current_date: str, usage: TokenUsage | None = None
+) -> dict:
+    """Keep the valid action items of an AI payload and repair the rejected ones with one targeted call.
+
+    Returns the payload with only valid, normalized items and the remaining
+    rejections (see services/action_item_parsing.py), ready to be cached.
+    """
+    parsed = parse_action_items(result)
+    if parsed.rejected and config.EXTRACTION_REPAIR_ENABLED:
+        try:
+            # Only the invalid items are sent, not the notes: a fraction of a full extraction
+            repaired = await _request_json(
+                ai_service_factory, build_repair_prompt(parsed.rejected, current_date), usage
+            )
+            parsed = apply_repairs(parsed, raw_action_items(repaired))
+        except HTTPException as e:
+            # The valid items are still worth keeping; the rest stays rejected
+            logger.warning("Action item repair failed: %s", e.detail)
+    if parsed.rejected:
+        logger.warning(
+            "Rejected %s AI action items: %s",
+            len(parsed.rejected),
+            [rejection.errors for rejection in parsed.rejected],
+        )
+    return salvaged_payload(result, parsed)
+
+
+def build_action_items(meeting_id: int, items: List[ExtractedActionItem]) -> List[ActionItem]:
+    """Turn validated AI action items into unsaved ActionItem rows."""
+    default_deadline = datetime.now(timezone.utc) + timedelta(days=7)
+    return [
+        ActionItem(
+            meeting_id=meeting_id,
+            description=item.description,
+            assignee=item.assignee,
+            priority=item.priority,
+            deadline=item.deadline if item.deadline is not None else default_deadline,
+        )
+        for item in items
+    ]
+
+
+def _routed(ai_service_factory: AIServiceFactory, choice: ModelChoice) -> AIServiceFactory:
+    return functools.partial(ai_service_factory, model_name=choice.model)
+
+
+def with_analysis_meta(current: dict | None, **entries: dict) -> dict:
+    """Return meetings.analysis_meta with the given task entries replaced.
+
+    Always a new dict, so assigning it marks the JSON column as changed.
+    """
+    meta = dict(current) if isinstance(current, dict) else {}
+    meta.update(entries)
+    return meta
+
+
+def _analysis_cache_key(notes: str, model: str) -> str:
+    return make_cache_key("analysis", ANALYSIS_PROMPT_VERSION, model, notes)
+
+
+async def compute_analysis(
+    bind: Engine,
+    notes: str,
+    ai_service_factory: AIServiceFactory = OpenAIService,
+    choice: ModelChoice | None = None,
+) -> dict:
+    """Return the analysis for `notes` without persisting it (cached and coalesced).
+
+    `choice` defaults to the model routed for the analysis of these notes.
+    """
+    choice = choice or choose_model(TASK_ANALYSIS, notes)
+    cache_key = _analysis_cache_key(notes, choice.model)
+
+    async def call() -> dict:
+        return await _analyze_notes(_routed(ai_service_factory, choice), notes)
+
+    # Concurrent analyses of the same notes share one upstream call, so they
+    # also all persist the same result
+    return await shared_ai_result(bind, cache_key, "analysis", choice.model, ANALYSIS_PROMPT_VERSION, call)
+
+
+def notes_coverage(notes: str) -> dict:
+    """Return the analysis_meta fields recording which notes an analysis covers."""
+    return {"covered_chars": len(notes), "covered_sha256": hashlib.sha256(notes.encode("utf-8")).hexdigest()}
+
+
+def appended_notes(meeting: Meeting, notes: str, choice: ModelChoice) -> str | None:
+    """Return the notes appended since the stored analysis, or None when it must be redone in full.
+
+    The stored analysis is only extended when it was produced by the same model
+    and prompts from a prefix of the current notes; any other edit, or a model
+    or prompt change, needs a full analysis.
+    """
+    entry = meeting.analysis_meta.get("analysis") if isinstance(meeting.analysis_meta, dict) else None
+    if not isinstance(meeting.analysis_result, dict) or not isinstance(entry, dict):
+        return None
+    if entry.get("model") != choice.model:
+        return None
+    if entry.get("prompt_version") not in (ANALYSIS_PROMPT_VERSION, COMBINED_PROMPT_VERSION):
+        return None
+    covered = entry.get("covered_chars")
+    if not isinstance(covered, int) or covered > len(notes):
+        return None
+    if notes_coverage(notes[:covered])["covered_sha256"] != entry.get("covered_sha256"):
+        return None
+    return notes[covered:]
+
+
+async def compute_incremental_analysis(
+    bind: Engine,
+    previous: dict,
+    appended: str,
+    ai_service_factory: AIServiceFactory,
+    choice: ModelChoice,
+) -> dict:
+    """Extend `previous` with the `appended` notes in one call (cached and coalesced)."""
+    cache_key = make_cache_key(
+        "analysis-incremental", INCREMENTAL_ANALYSIS_PROMPT_VERSION, choice.model, appended,
+        {"previous_analysis": previous},
+    )
+
+    async def call() -> dict:
+        prompt = build_incremental_analysis_prompt(previous, appended)
+        result = await _request_json(_routed(ai_service_factory, choice), prompt)
+        if not isinstance(result, dict):
+            logger.error("AI returned non-dict result: %s", type(result))
+            raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Invalid AI response format")
+        # Keys the model left out carry over from the previous analysis
+        return dict(previous, **result)
+
+    return await shared_ai_result(
+        bind, cache_key, "analysis-incremental", choice.model, INCREMENTAL_ANALYSIS_PROMPT_VERSION, call
+    )
+
+
+async def analyze_meeting_notes(
+    db: Session, meeting: Meeting, ai_service_factory: AIServiceFactory = OpenAIService
+) -> Meeting:
+    """Run AI analysis on the meeting notes and persist it to meeting.analysis_result.
+
+    When notes were only appended since the stored analysis, just the new part
+    is sent along with the previous result; short appends are merged in one call.
+    """
+    notes = require_notes(meeting)
+    choice = choose_model(TASK_ANALYSIS, notes)
+    appended = appended_notes(meeting, notes, choice)
+
+    meta = dict(choice.as_meta(ANALYSIS_PROMPT_VERSION), **notes_coverage(notes))
+    # Unchanged notes take the full path, which the AI cache answers. A long
+    # append is as expensive as a fresh map-reduce analysis and merges worse.
+    if appended and appended.strip() and len(split_for_analysis(appended)) == 1:
+        result = await compute_incremental_analysis(
+            db.get_bind(), meeting.analysis_result, appended, ai_service_factory, choice
+        )
+        meta.update(mode="incremental", appended_chars=len(appended))
+    else:
+        result = await compute_analysis(db.get_bind(), notes, ai_service_factory, choice)
+        meta.update(mode="full")
+
+    try:
+        meeting.analysis_result = result
+        meeting.analysis_meta = with_analysis_meta(meeting.analysis_meta, analysis=meta)
+        await run_in_threadpool(commit_and_refresh, db, meeting)
+        return meeting
+    except Exception as e:
+        logger.error(e, exc_info=True)
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error")
+
+
+def _save_analysis(bind: Engine, meeting_id: int, result: dict, meta: dict) -> Meeting:
+    with Session(bind=bind) as db:
+        meeting = db.get(Meeting, meeting_id)
+        if meeting is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Meeting not found")
+        meeting.analysis_result = result
+        meeting.analysis_meta = with_analysis_meta(meeting.analysis_meta, analysis=meta)
+        commit_and_refresh(db, meeting)
+        return meeting
+
+
+async def stream_meeting_analysis(
+    bind: Engine, meeting_id: int, notes: str, ai_service_factory: AIServiceFactory = OpenAIService
+) -> AsyncIterator[Tuple[str, Any]]:
+    """Analyze the notes, yielding ("delta", text) as the model writes and finally ("result", Meeting).
+
+    Shares the cache with analyze_meeting_notes. Long notes that need the
+    map-reduce path cannot be streamed token by token; they yield a single
+    ("progress", info) event and then the result. Errors are raised as HTTPException.
+    """
+    choice = choose_model(TASK_ANALYSIS, notes)
+    cache_key = _analysis_cache_key(notes, choice.model)
+    result = await ai_cache.get(bind, cache_key)
+
+    if result is None:
+        chunks = split_for_analysis(notes)
+        if len(chunks) > 1:
+            yield "progress", {"parts": len(chunks)}
+            result = await compute_analysis(bind, notes, ai_service_factory, choice)
+        else:
+            parts: List[str] = []
+            try:
+                system_message, user_message = build_analysis_prompt(notes)
+                ai_service = ai_service_factory(model_name=choice.model)
+                deltas = ai_service.stream_completion(prompt=user_message, system_message=system_message, json_mode=True)
+                async for delta in deltas:
+                    parts.append(delta)
+                    yield "delta", delta
+            except Exception as e:
+                raise _ai_error(e)
+
+            try:
+                result = json.loads("".join(parts))
+            except ValueError:
+                result = None
+            if not isinstance(result, dict):
+                logger.error("AI streamed an invalid analysis: %s", "".join(parts)[:200])
+                raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Invalid AI response format")
+            await ai_cache.put(bind, cache_key, "analysis", choice.model, ANALYSIS_PROMPT_VERSION, result)
+
+    try:
+        meta = dict(choice.as_meta(ANALYSIS_PROMPT_VERSION), **notes_coverage(notes), mode="full")
+        meeting = await run_in_threadpool(_save_analysis, bind, meeting_id, result, meta)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(e, exc_info=True)
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error")
+    yield "result", meeting
+
+
+@dataclass
+class ExtractActionsResult:
+    action_items: List[ActionItemResponse]
+    # AI items that failed validation even after the repair call; not persisted
+    rejected_action_items: List[RejectedActionItem]
+
+
+def _extraction_meta(choice: ModelChoice, prompt_version: str, parsed: ParsedActionItems) -> dict:
+    rejected = [rejection.model_dump(mode="json") for rejection in parsed.rejected]
+    return dict(choice.as_meta(prompt_version), rejected_action_items=rejected)
+
+
+async def extract_meeting_actions(
+    db: Session, meeting: Meeting, ai_service_factory: AIServiceFactory = OpenAIService
+) -> ExtractActionsResult:
+    """Extract action items from the meeting notes with the AI and persist the valid ones."""
+    notes = require_notes(meeting)
+    # Day granularity keeps relative deadlines meaningful while letting repeat runs hit the cache
+    current_date = datetime.now(timezone.utc).date().isoformat()
+    bind = db.get_bind()
+    choice = choose_model(TASK_EXTRACTION, notes)
+    cache_key = make_cache_key(
+        "extraction", EXTRACTION_PROMPT_VERSION, choice.model, notes,
+        {"current_date": current_date, "analysis_result": meeting.analysis_result},
+    )
+
+    async def call() -> object:
+        routed = _routed(ai_service_factory, choice)
+        result = await _extract_notes(routed, notes, meeting.analysis_result, current_date)
+        # Validated (and repaired) before the result is cached and shared
+        return await salvage_action_items(routed, result, current_date)
+
+    result = await shared_ai_result(bind, cache_key, "extraction", choice.model, EXTRACTION_PROMPT_VERSION, call)
+    parsed = parse_action_items(result)
+    created_items = build_action_items(meeting.id, parsed.items)
+
+    try:
+        meeting.analysis_meta = with_analysis_meta(
+            meeting.analysis_meta, extraction=_extraction_meta(choice, EXTRACTION_PROMPT_VERSION, parsed)
+        )
+        saved_items = await run_in_threadpool(save_action_items, db, created_items)
+    except Exception as e:
+        logger.error(e, exc_info=True)
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error")
+    return ExtractActionsResult(action_items=saved_items, rejected_action_items=parsed.rejected)
+
+
+@dataclass
+class AnalyzeAndExtractResult:
+    meeting: Meeting
+    action_items: List[ActionItemResponse]
+    usage: TokenUsage
+    cached: bool
+    rejected_action_items: List[RejectedActionItem] = field(default_factory=list)
+
+
+def _combined_analysis(result: dict) -> dict:
+    return {key: result[key] for key in ANALYSIS_KEYS if key in result}
+
+
+def validate_combined_result(result: object) -> None:
+    """Raise unless a combined AI payload is a dict carrying at least one analysis key."""
+    if not isinstance(result, dict):
+        logger.error("AI returned non-dict result: %s", type(result))
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Invalid AI response format")
+    if not _combined_analysis(result):
+        logger.error("AI returned combined result without analysis keys: %s", result)
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Invalid AI response format")
+
+
+async def analyze_and_extract_meeting(
+    db: Session, meeting: Meeting, ai_service_factory: AIServiceFactory = OpenAIService
+) -> AnalyzeAndExtractResult:
+    """Analyze the notes and extract action items with a single completion per chunk.
+
+    The analysis and the new action items are committed in one transaction.
+    `usage` covers the completions made by this request; it is zero when the
+    result came from the cache or from an identical concurrent request.
+    """
+    notes = require_notes(meeting)
+    current_date = datetime.now(timezone.utc).date().isoformat()
+    bind = db.get_bind()
+    choice = choose_model(TASK_COMBINED, notes)
+    cache_key = make_cache_key("combined", COMBINED_PROMPT_VERSION, choice.model, notes, {"current_date": current_date})
+    usage = TokenUsage()
+
+    async def call() -> dict:
+        routed = _routed(ai_service_factory, choice)
+        result = await _analyze_and_extract_notes(routed, notes, current_date, usage)
+        validate_combined_result(result)  # before the result is cached and shared
+        return await salvage_action_items(routed, result, current_date, usage)
+
+    result = await shared_ai_result(bind, cache_key, "combined", choice.model, COMBINED_PROMPT_VERSION, call)
+    analysis = _combined_analysis(result)
+    parsed = parse_action_items(result)
+    created_items = build_action_items(meeting.id, parsed.items)
+
+    try:
+        meeting.analysis_result = analysis
+        meta = choice.as_meta(COMBINED_PROMPT_VERSION)
+        meeting.analysis_meta = with_analysis_meta(
+            meeting.analysis_meta,
+            analysis=dict(meta, **notes_coverage(notes), mode="full"),
+            extraction=_extraction_meta(choice, COMBINED_PROMPT_VERSION, parsed),
+        )
+        saved_items = await run_in_threadpool(save_action_items, db, created_items, meeting)
+    except Exception as e:
+        logger.error(e, exc_info=True)
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error")
+    return AnalyzeAndExtractResult(
+        meeting=meeting,
+        action_items=saved_items,
+        usage=usage,
+        cached=usage.calls == 0,
+        rejected_action_items=parsed.rejected,
+    )
@@ -0,0 +1,326 @@
+from __future__ import annotations
+
+import logging
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import case, delete, event, func, insert, inspect, literal, select, union_all, update
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from ami_meeting_svc.models import (
+    ActionItem,
+    ActionItemDailyMetric,
+    ActionItemMetric,
+    ActionItemStatusTransition,
+    Meeting,
+)
+from ami_meeting_svc.models.action_item_metric import UNASSIGNED
+from ami_meeting_svc.services.dashboard_cache import dashboard_cache
+
+logger = logging.getLogger(__name__)
+
+# Keeps `action_item_metrics` (current counts) and `action_item_daily_metrics`
+# (per-day activity) in step with `action_items`, and appends every status change
+# to `action_item_status_transitions`. Every ORM flush that inserts, changes or
+# deletes action items writes the matching rows in the same transaction; bulk
+# inserts that bypass the flush call record_inserted(). Once that transaction
+# commits, the cached dashboards of the owners it touched are invalidated.
+
+# (owner_id, assignee, status) -> [item delta, overdue delta]
+MetricKey = Tuple[int, str, str]
+Deltas = Dict[MetricKey, List[int]]
+# (owner_id, UTC day) -> {daily column: delta}
+DailyKey = Tuple[int, date]
+DailyDeltas = Dict[DailyKey, Dict[str, int]]
+
+DONE = "Done"
+_DAILY_COLUMNS = ("created_count", "completed_count", "item_delta", "done_delta", "overdue_delta")
+
+_COUNTED_ATTRIBUTES = ("meeting_id", "assignee", "status", "is_overdue")
+
+# session.info key: owners whose counters the open transaction changed
+_CHANGED_OWNERS = "metrics_rollup_changed_owners"
+
+
+@dataclass(frozen=True)
+class _Counted:
+    """The fields of one action item that decide which counters include it."""
+
+    meeting_id: int
+    assignee: str
+    status: str
+    overdue: bool
+
+
+# (item, before, after) per changed item; None before an insert and after a delete
+Changes = List[Tuple[ActionItem, Optional[_Counted], Optional[_Counted]]]
+
+
+def _counted(item: ActionItem) -> _Counted:
+    return _Counted(item.meeting_id, item.assignee or UNASSIGNED, item.status, bool(item.is_overdue))
+
+
+def _counted_before_flush(item: ActionItem) -> _Counted:
+    state = inspect(item)
+    values = {}
+    for name in _COUNTED_ATTRIBUTES:
+        history = state.attrs[name].history
+        values[name] = history.deleted[0] if history.deleted else getattr(item, name)
+    return _Counted(
+        values["meeting_id"], values["assignee"] or UNASSIGNED, values["status"], bool(values["is_overdue"])
+    )
+
+
+def _owners(conn: Connection, changes: Changes) -> Dict[int, int]:
+    meeting_ids = {c.meeting_id for _, *pair in changes for c in pair if c is not None}
+    if not meeting_ids:
+        return {}
+    return dict(conn.execute(select(Meeting.id, Meeting.owner_id).where(Meeting.id.in_(meeting_ids))).all())
+
+
+def _deltas(owners: Dict[int, int], changes: Changes) -> Deltas:
+    deltas: Deltas = defaultdict(lambda: [0, 0])
+    for _, before, after in changes:
+        for counted, sign in ((before, -1), (after, 1)):
+            if counted is None or counted.meeting_id not in owners:
+                continue
+            delta = deltas[(owners[counted.meeting_id], counted.assignee, counted.status)]
+            delta[0] += sign
+            delta[1] += sign if counted.overdue else 0
+    return deltas
+
+
+def _daily_deltas(owners: Dict[int, int], changes: Changes, day: date) -> DailyDeltas:
+    deltas: DailyDeltas = defaultdict(lambda: dict.fromkeys(_DAILY_COLUMNS, 0))
+    for _, before, after in changes:
+        for counted, sign in ((before, -1), (after, 1)):
+            if counted is None or counted.meeting_id not in owners:
+                continue
+            delta = deltas[(owners[counted.meeting_id], day)]
+            delta["item_delta"] += sign
+            delta["done_delta"] += sign if counted.status == DONE else 0
+            delta["overdue_delta"] += sign if counted.overdue else 0
+        if after is None or after.meeting_id not in owners:
+            continue
+        delta = deltas[(owners[after.meeting_id], day)]
+        if before is None:
+            delta["created_count"] += 1
+        if after.status == DONE and (before is None or before.status != DONE):
+            delta["completed_count"] += 1
+    return deltas
+
+
+def _transitions(owners: Dict[int, int], changes: Changes, changed_at: datetime) -> List[Dict[str, object]]:
+    rows = []
+    for item, before, after in changes:
+        if after is None or after.meeting_id not in owners:
+            continue
+        if before is not None and before.status == after.status:
+            continue
+        rows.append(
+            {
+                "action_item_id": item.id,
+                "owner_id": owners[after.meeting_id],
+                "assignee": after.assignee or None,
+                "priority": item.priority,
+                "from_status": None if before is None else before.status,
+                "to_status": after.status,
+                "changed_at": changed_at,
+            }
+        )
+    return rows
+
+
+def _add_to_row(conn: Connection, model, key: Dict[str, object], increments: Dict[str, int]) -> None:
+    """Add `increments` to the `model` row with primary key `key`, creating the row if missing."""
+
+    def increment() -> bool:
+        stmt = (
+            update(model)
+            .where(*(getattr(model, name) == value for name, value in key.items()))
+            .values({name: getattr(model, name) + amount for name, amount in increments.items()})
+        )
+        return conn.execute(stmt).rowcount == 1
+
+    if increment():
+        return
+    try:
+        with conn.begin_nested():
+            conn.execute(insert(model).values(**key, **increments))
+    except IntegrityError:
+        # Another transaction created the row since our UPDATE
+        increment()
+
+
+def apply_deltas(conn: Connection, deltas: Deltas) -> None:
+    """Add `deltas` to the counters within the caller's transaction."""
+    # A fixed order keeps concurrent writers from locking the same rows in opposite orders
+    for (owner_id, assignee, status), (items, overdue) in sorted(deltas.items()):
+        if items == 0 and overdue == 0:
+            continue
+        _add_to_row(
+            conn,
+            ActionItemMetric,
+            {"owner_id": owner_id, "assignee": assignee, "status": status},
+            {"item_count": items, "overdue_count": overdue},
+        )
+
+
+def apply_daily_deltas(conn: Connection, deltas: DailyDeltas) -> None:
+    """Add `deltas` to the daily rows within the caller's transaction."""
+    for (owner_id, day), increments in sorted(deltas.items()):
+        if any(increments.values()):
+            _add_to_row(conn, ActionItemDailyMetric, {"owner_id": owner_id, "day": day}, increments)
+
+
+def _apply(session: Session, changes: Changes) -> None:
+    conn = session.connection()
+    owners = _owners(conn, changes)
+    if not owners:
+        return
+    now = datetime.utcnow()
+    apply_deltas(conn, _deltas(owners, changes))
+    apply_daily_deltas(conn, _daily_deltas(owners, changes, now.date()))
+    transitions = _transitions(owners, changes, now)
+    if transitions:
+        conn.execute(insert(ActionItemStatusTransition), transitions)
+    session.info.setdefault(_CHANGED_OWNERS, set()).update(owners.values())
+
+
+def record_inserted(db: Session, items: Iterable[ActionItem]) -> None:
+    """Count action items inserted without a flush (e.g. INSERT ... RETURNING)."""
+    _apply(db, [(item, None, _counted(item)) for item in items])
+
+
+@event.listens_for(Session, "after_flush")
+def _after_flush(session: Session, flush_context) -> None:
+    # new/dirty/deleted and attribute history still describe the flush that just ran
+    changes: Changes = []
+    for obj in session.new:
+        if isinstance(obj, ActionItem):
+            changes.append((obj, None, _counted(obj)))
+    for obj in session.dirty:
+        if isinstance(obj, ActionItem) and session.is_modified(obj, include_collections=False):
+            changes.append((obj, _counted_before_flush(obj), _counted(obj)))
+    for obj in session.deleted:
+        if isinstance(obj, ActionItem):
+            changes.append((obj, _counted_before_flush(obj), None))
+    if changes:
+        _apply(session, changes)
+
+
+@event.listens_for(Session, "after_commit")
+def _after_commit(session: Session) -> None:
+    for owner_id in session.info.pop(_CHANGED_OWNERS, ()):
+        dashboard_cache.invalidate(owner_id)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _after_rollback(session: Session, previous_transaction) -> None:
+    # Nothing changed after all; a later commit on this session starts afresh
+    if previous_transaction.parent is None:
+        session.info.pop(_CHANGED_OWNERS, None)
+
+
+def _keep_previous_value(target, value, oldvalue, initiator) -> None:
+    pass
+
+
+# active_history loads the previous value even when it was expired, so the
+# counter an item leaves can always be decremented
+for _name in _COUNTED_ATTRIBUTES:
+    event.listen(getattr(ActionItem, _name), "set", _keep_previous_value, active_history=True)
+
+
+def _replace_rows(db: Session, delete_stmt, insert_stmt) -> int:
+    try:
+        db.execute(delete_stmt)
+        written = db.execute(insert_stmt).rowcount
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    return written
+
+
+def rebuild_metrics(db: Session, owner_id: int | None = None) -> int:
+    """Recompute the counters from `action_items`, for one owner or all, and commit.
+
+    For backfills and repairs; writes running concurrently can be miscounted, so
+    run it while action items are not being written. Returns the rows written.
+    """
+    delete_stmt = delete(ActionItemMetric)
+    source = (
+        select(
+            Meeting.owner_id,
+            func.coalesce(ActionItem.assignee, UNASSIGNED),
+            ActionItem.status,
+            func.count(),
+            func.sum(case((ActionItem.is_overdue == True, 1), else_=0)),
+        )
+        .join(Meeting, Meeting.id == ActionItem.meeting_id)
+        .group_by(Meeting.owner_id, func.coalesce(ActionItem.assignee, UNASSIGNED), ActionItem.status)
+    )
+    if owner_id is not None:
+        delete_stmt = delete_stmt.where(ActionItemMetric.owner_id == owner_id)
+        source = source.where(Meeting.owner_id == owner_id)
+
+    columns = ["owner_id", "assignee", "status", "item_count", "overdue_count"]
+    written = _replace_rows(db, delete_stmt, insert(ActionItemMetric).from_select(columns, source))
+    if owner_id is None:
+        dashboard_cache.clear()
+    else:
+        dashboard_cache.invalidate(owner_id)
+    logger.info("Rebuilt %s action item metric rows (owner_id=%s)", written, owner_id)
+    return written
+
+
+def _history_events(day_column, where=None, created: int = 0, completed: int = 0, overdue: int = 0):
+    stmt = select(
+        Meeting.owner_id.label("owner_id"),
+        func.date(day_column).label("day"),
+        literal(created).label("created"),
+        literal(completed).label("completed"),
+        literal(overdue).label("overdue"),
+    ).join(Meeting, Meeting.id == ActionItem.meeting_id)
+    return stmt if where is None else stmt.where(where)
+
+
+def rebuild_daily_metrics(db: Session, owner_id: int | None = None) -> int:
+    """Reconstruct the daily rows from `action_items`, for one owner or all, and commit.
+
+    Items only keep their current state, so the history is approximate: each
+    item counts as created on its `created_at` day, and items that are Done or
+    overdue now count as completed / becoming overdue on their `updated_at`
+    day. Deleted items and reverted changes are not recoverable. Returns the
+    rows written.
+    """
+    events = [
+        _history_events(ActionItem.created_at, created=1),
+        _history_events(ActionItem.updated_at, ActionItem.status == DONE, completed=1),
+        _history_events(ActionItem.updated_at, ActionItem.is_overdue == True, overdue=1),
+    ]
+    delete_stmt = delete(ActionItemDailyMetric)
+    if owner_id is not None:
+        delete_stmt = delete_stmt.where(ActionItemDailyMetric.owner_id == owner_id)
+        events = [stmt.where(Meeting.owner_id == owner_id) for stmt in events]
+
+    history = union_all(*events).subquery()
+    source = select(
+        history.c.owner_id,
+        history.c.day,
+        func.sum(history.c.created),
+        func.sum(history.c.completed),
+        func.sum(history.c.created),
+        func.sum(history.c.completed),
+        func.sum(history.c.overdue),
+    ).group_by(history.c.owner_id, history.c.day)
+
+    columns = ["owner_id", "day", *_DAILY_COLUMNS]
+    written = _replace_rows(db, delete_stmt, insert(ActionItemDailyMetric).from_select(columns, source))
+    logger.info("Rebuilt %s daily action item metric rows (owner_id=%s)", written, owner_id)
+    return written
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from typing import Any, List
+
+from ami_meeting_svc import config
+from ami_meeting_svc.services.chunking import estimate_tokens
+
+logger = logging.getLogger(__name__)
+
+# Picks the model for an AI task from the estimated size of the notes, so short
+# meetings can go to a fast, cheap model and long transcripts to a larger-context
+# one. The table comes from config.OPENAI_MODEL_ROUTES, e.g.
+#
+#   {"analysis": [{"max_tokens": 4000, "model": "gpt-4o-mini"}, {"model": "gpt-4o"}],
+#    "default": [{"model": "gpt-4o-mini"}]}
+#
+# The model is chosen once per request from the whole notes; every chunk of a
+# map-reduce run uses the same model.
+
+TASK_ANALYSIS = "analysis"
+TASK_EXTRACTION = "extraction"
+TASK_COMBINED = "combined"
+
+
+@dataclass(frozen=True)
+class ModelChoice:
+    task: str
+    model: str
+    estimated_tokens: int
+
+    def as_meta(self, prompt_version: str) -> dict:
+        """Return the record stored in meetings.analysis_meta for a result produced by this choice."""
+        return {
+            "task": self.task,
+            "model": self.model,
+            "prompt_version": prompt_version,
+            "estimated_tokens": self.estimated_tokens,
+        }
+
+
+def _routes_for(task: str) -> List[Any]:
+    table = config.OPENAI_MODEL_ROUTES
+    if not isinstance(table, dict):
+        return []
+    routes = table.get(task)
+    if routes is None:
+        routes = table.get("default")
+    return routes if isinstance(routes, list) else []
+
+
+def choose_model(task: str, notes: str) -> ModelChoice:
+    """Return the model routed for `task` given the notes it will be run on."""
+    estimated = estimate_tokens(notes)
+    for route in _routes_for(task):
+        max_tokens = route.get("max_tokens") if isinstance(route, dict) else None
+        if not isinstance(route, dict) or not route.get("model") or not isinstance(max_tokens, (int, float, type(None))):
+            logger.warning("Ignoring invalid model route for %s: %s", task, route)
+            continue
+        if max_tokens is None or estimated <= max_tokens:
+            return ModelChoice(task=task, model=str(route["model"]), estimated_tokens=estimated)
+    return ModelChoice(task=task, model=config.OPENAI_MODEL_NAME, estimated_tokens=estimated)
@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import sqlite3
+import threading
+import time
+from typing import Awaitable, Callable, Dict, Optional
+
+from starlette.concurrency import run_in_threadpool
+
+from ami_meeting_svc import config
+
+logger = logging.getLogger(__name__)
+
+REQUESTS = "requests"
+TOKENS = "tokens"
+
+# Never sleep longer than this between checks, so a limiter shared with other
+# processes notices capacity they returned (usage corrections) promptly.
+_MAX_WAIT_SECONDS = 5.0
+
+
+class RateLimitWaitExceeded(Exception):
+    """Raised instead of waiting for budget past the caller's deadline."""
+
+    def __init__(self, retry_after: float) -> None:
+        super().__init__(f"rate limit budget exhausted; retry after {retry_after:.1f}s")
+        self.retry_after = retry_after
+
+
+class TokenBucketLimiter:
+    """Requests-per-minute and tokens-per-minute budget for upstream AI calls.
+
+    Both budgets are token buckets holding at most one minute of allowance and
+    refilling continuously. The bucket levels live in a small SQLite database,
+    so every worker process pointing at the same file shares one budget
+    (`db_path=":memory:"` keeps it per process). A limit of 0 disables that
+    bucket. Store errors are logged and the call proceeds unthrottled.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: float,
+        tokens_per_minute: float,
+        db_path: str = ":memory:",
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ) -> None:
+        self._limits: Dict[str, float] = {REQUESTS: requests_per_minute, TOKENS: tokens_per_minute}
+        self._db_path = db_path
+        self._clock = clock
+        self._sleep = sleep
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self.waits = 0
+        self.wait_seconds = 0.0
+
+    @property
+    def enabled(self) -> bool:
+        return any(limit > 0 for limit in self._limits.values())
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            # Autocommit mode: transactions are opened explicitly with BEGIN IMMEDIATE
+            conn = sqlite3.connect(self._db_path, timeout=30, isolation_level=None, check_same_thread=False)
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS rate_limit_buckets "
+                "(name TEXT PRIMARY KEY, level REAL NOT NULL, updated_at REAL NOT NULL)"
+            )
+            self._conn = conn
+        return self._conn
+
+    def _update(self, amounts: Dict[str, float], force: bool) -> float:
+        """Refill, then take `amounts` if every bucket covers them (or if `force`).
+
+        Returns 0 when taken, otherwise the seconds until they would be covered.
+        """
+        with self._lock:
+            conn = self._connection()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                now = self._clock()
+                levels: Dict[str, float] = {}
+                wait = 0.0
+                for name, amount in amounts.items():
+                    limit = self._limits[name]
+                    if limit <= 0:
+                        continue
+                    row = conn.execute(
+                        "SELECT level, updated_at FROM rate_limit_buckets WHERE name = ?", (name,)
+                    ).fetchone()
+                    level, updated_at = row if row is not None else (limit, now)
+                    rate = limit / 60.0
+                    level = min(limit, level + max(0.0, now - updated_at) * rate)
+                    levels[name] = level
+                    # A request larger than the whole bucket waits for a full bucket instead of forever
+                    needed = min(amount, limit)
+                    if level < needed:
+                        wait = max(wait, (needed - level) / rate)
+
+                taken = force or wait == 0.0
+                for name, level in levels.items():
+                    if taken:
+                        level -= amounts[name]
+                    conn.execute(
+                        "INSERT OR REPLACE INTO rate_limit_buckets (name, level, updated_at) VALUES (?, ?, ?)",
+                        (name, level, now),
+                    )
+                conn.execute("COMMIT")
+                return 0.0 if taken else wait
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+
+    async def acquire(self, estimated_tokens: int, deadline: float | None = None) -> None:
+        """Wait until one request and `estimated_tokens` tokens fit in the budget, then take them.
+
+        With a `deadline` (time.monotonic() value), raise RateLimitWaitExceeded as
+        soon as the budget would not cover the call before it, instead of queueing
+        past the point where the caller has given up.
+        """
+        if not self.enabled:
+            return
+        amounts = {REQUESTS: 1.0, TOKENS: float(estimated_tokens)}
+        while True:
+            try:
+                wait = await run_in_threadpool(self._update, amounts, False)
+            except Exception as e:
+                logger.error("Rate limiter store failed: %s", e, exc_info=True)
+                return
+            if wait <= 0:
+                return
+            if deadline is not None and time.monotonic() + wait > deadline:
+                raise RateLimitWaitExceeded(wait)
+            wait = min(wait, _MAX_WAIT_SECONDS)
+            self.waits += 1
+            self.wait_seconds += wait
+            await self._sleep(wait)
+
+    async def settle(self, estimated_tokens: int, actual_tokens: int) -> None:
+        """Correct the token bucket once the response reports the real usage."""
+        delta = actual_tokens - estimated_tokens
+        if self._limits[TOKENS] <= 0 or delta == 0:
+            return
+        try:
+            # Positive delta takes more (possibly into debt), negative returns the surplus
+            await run_in_threadpool(self._update, {TOKENS: float(delta)}, True)
+        except Exception as e:
+            logger.error("Rate limiter store failed: %s", e, exc_info=True)
+
+    async def exhaust(self) -> None:
+        """Empty the buckets after the provider rejected a call, so every worker backs off."""
+        if not self.enabled:
+            return
+        try:
+            await run_in_threadpool(self._drain)
+        except Exception as e:
+            logger.error("Rate limiter store failed: %s", e, exc_info=True)
+
+    def _drain(self) -> None:
+        with self._lock:
+            conn = self._connection()
+            now = self._clock()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                for name, limit in self._limits.items():
+                    if limit > 0:
+                        conn.execute(
+                            "INSERT OR REPLACE INTO rate_limit_buckets (name, level, updated_at) VALUES (?, 0, ?)",
+                            (name, now),
+                        )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+openai_rate_limiter = TokenBucketLimiter(
+    requests_per_minute=config.OPENAI_RPM_LIMIT,
+    tokens_per_minute=config.OPENAI_TPM_LIMIT,
+    db_path=config.OPENAI_RATE_LIMIT_DB,
+)
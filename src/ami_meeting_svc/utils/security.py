@@ -59,7 +59,7 @@ def create_access_token(data: Dict[str, Any], expires_delta: timedelta | None =
         raise
 
 
-async def get_current_user(request: Request, db: Session = Depends(get_db)) -> User:
+def get_current_user(request: Request, db: Session = Depends(get_db)) -> User:
     try:
         token = request.cookies.get("access_token")
         if not token:
@@ -39,4 +39,42 @@ def client(session_local):
     with TestClient(app) as c:
         yield c
     app.dependency_overrides[get_db] = get_db
-# DO NOT MODIFY SECTION END
\ No newline at end of file
+# DO NOT MODIFY SECTION END
+
+@pytest.fixture(autouse=True)
+def reset_ai_cache():
+    # The in-process AI cache outlives a single test's database
+    from ami_meeting_svc.services.ai_cache import ai_cache
+
+    ai_cache.clear()
+    yield
+    ai_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_openai_circuit():
+    # The circuit breaker is process-wide; a failing test must not open it for the next one
+    from ami_meeting_svc.services.circuit_breaker import openai_breaker
+
+    openai_breaker.reset()
+    yield
+    openai_breaker.reset()
+
+
+@pytest.fixture(autouse=True)
+def reset_ai_metrics():
+    from ami_meeting_svc.services.ai_metrics import ai_metrics
+
+    ai_metrics.reset()
+    yield
+    ai_metrics.reset()
+
+
+@pytest.fixture(autouse=True)
+def reset_dashboard_cache():
+    # User ids repeat across tests' databases; a cached dashboard must not carry over
+    from ami_meeting_svc.services.dashboard_cache import dashboard_cache
+
+    dashboard_cache.clear()
+    yield
+    dashboard_cache.clear()
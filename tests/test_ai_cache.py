@@ -0,0 +1,92 @@
+import asyncio
+from datetime import datetime
+from unittest.mock import AsyncMock, patch
+
+from ami_meeting_svc.models import AICacheEntry, Meeting, User
+from ami_meeting_svc.services.ai_cache import AICache, make_cache_key
+from ami_meeting_svc.services.ai_cache import ai_cache
+from ami_meeting_svc.utils.security import get_password_hash
+
+
+def create_user(db_session, username: str = "alice", email: str = "alice@example.com", password: str = "secret") -> User:
+    user = User(username=username, email=email, password_hash=get_password_hash(password))
+    db_session.add(user)
+    db_session.commit()
+    db_session.refresh(user)
+    return user
+
+
+def create_meeting(db_session, owner_id: int, notes: str = "x" * 60) -> Meeting:
+    meeting = Meeting(owner_id=owner_id, title="Team Sync", date=datetime.utcnow(), attendees=["a"], notes=notes)
+    db_session.add(meeting)
+    db_session.commit()
+    db_session.refresh(meeting)
+    return meeting
+
+
+def login_and_set_cookie(client, username: str, password: str = "secret"):
+    resp = client.post("/auth/login", json={"username": username, "password": password})
+    assert resp.status_code == 200
+    client.cookies.set("access_token", resp.json()["access_token"])
+
+
+def test_cache_key_covers_all_inputs():
+    base = make_cache_key("analysis", "v1", "gpt", "notes", {"a": 1})
+    assert base == make_cache_key("analysis", "v1", "gpt", "notes", {"a": 1})
+    assert base != make_cache_key("analysis", "v2", "gpt", "notes", {"a": 1})
+    assert base != make_cache_key("analysis", "v1", "gpt-4", "notes", {"a": 1})
+    assert base != make_cache_key("analysis", "v1", "gpt", "notes!", {"a": 1})
+    assert base != make_cache_key("analysis", "v1", "gpt", "notes", {"a": 2})
+
+
+def test_memory_tier_evicts_least_recently_used(session_local):
+    bind = session_local.kw["bind"]
+    cache = AICache(enabled=True, ttl_seconds=60, max_entries=2, db_max_entries=100)
+
+    async def scenario():
+        await cache.put(bind, "k1", "analysis", "m", "v1", {"n": 1})
+        await cache.put(bind, "k2", "analysis", "m", "v1", {"n": 2})
+        assert await cache.get(bind, "k1") == {"n": 1}
+        await cache.put(bind, "k3", "analysis", "m", "v1", {"n": 3})
+
+    asyncio.run(scenario())
+    stats = cache.stats()
+    assert stats["memory_entries"] == 2
+    assert stats["memory_evictions"] == 1
+    assert stats["memory_hits"] == 1
+
+
+def test_db_tier_survives_memory_loss_and_enforces_size(session_local, db_session):
+    bind = session_local.kw["bind"]
+    cache = AICache(enabled=True, ttl_seconds=60, max_entries=10, db_max_entries=2)
+
+    async def scenario():
+        for n in range(3):
+            await cache.put(bind, f"k{n}", "analysis", "m", "v1", {"n": n})
+        cache.clear()
+        return await cache.get(bind, "k2")
+
+    assert asyncio.run(scenario()) == {"n": 2}
+    assert cache.stats()["db_hits"] == 1
+    assert db_session.query(AICacheEntry).count() == 2
+
+
+def test_repeat_analysis_is_served_from_cache(client, db_session):
+    user = create_user(db_session)
+    meeting = create_meeting(db_session, user.id)
+    login_and_set_cookie(client, "alice")
+
+    mocked_result = {"summary": "s", "key_discussion_points": [], "decisions": []}
+    with patch("ami_meeting_svc.routers.meetings.OpenAIService") as MockAI:
+        MockAI.return_value.get_completion = AsyncMock(return_value=mocked_result)
+        for _ in range(3):
+            resp = client.post(f"/meetings/{meeting.id}/analyze")
+            assert resp.status_code == 200
+            assert resp.json()["analysis_result"] == mocked_result
+
+        assert MockAI.return_value.get_completion.await_count == 1
+
+    stats = client.get("/monitoring/ai-cache").json()
+    assert stats["misses"] == 1
+    assert stats["memory_hits"] == 2
+    assert ai_cache.stats()["stores"] == 1
@@ -0,0 +1,105 @@
+import asyncio
+import json
+import logging
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import openai
+import pytest
+
+from ami_meeting_svc import config
+from ami_meeting_svc.services.ai_metrics import AICall, AIMetrics, Histogram, ai_metrics, estimate_cost
+from ami_meeting_svc.services.ai_service import OpenAIService
+from ami_meeting_svc.services.circuit_breaker import CircuitOpenError, openai_breaker
+
+
+def _make_mock_client(side_effect):
+    mock_client = MagicMock()
+    mock_client.with_options.return_value = mock_client
+    mock_client.chat.completions.create = AsyncMock(side_effect=side_effect)
+    return mock_client
+
+
+def _response(content: str, prompt_tokens: int, completion_tokens: int, cached_tokens: int = 0):
+    response = MagicMock()
+    response.choices[0].message.content = content
+    response.usage = SimpleNamespace(
+        prompt_tokens=prompt_tokens,
+        completion_tokens=completion_tokens,
+        total_tokens=prompt_tokens + completion_tokens,
+        prompt_tokens_details=SimpleNamespace(cached_tokens=cached_tokens),
+    )
+    return response
+
+
+def test_histogram_buckets_are_cumulative():
+    hist = Histogram((1, 5))
+    for value in (0.5, 1, 3, 10):
+        hist.observe(value)
+    assert hist.cumulative() == [("1", 2), ("5", 3), ("+Inf", 4)]
+    assert hist.sum == 14.5
+
+
+def test_cost_uses_cached_prompt_price(monkeypatch):
+    monkeypatch.setattr(
+        config, "OPENAI_MODEL_PRICES", {"m": {"prompt": 2.0, "cached_prompt": 1.0, "completion": 8.0}}
+    )
+    assert estimate_cost("m", 1_000_000, 500_000, 400_000) == pytest.approx(1.2 + 0.4 + 4.0)
+    assert estimate_cost("unpriced", 100, 100, 0) is None
+
+
+def test_completion_records_retries_tokens_and_cost(monkeypatch, caplog):
+    monkeypatch.setattr(config, "OPENAI_MODEL_PRICES", {"test-model": {"prompt": 1.0, "completion": 2.0}})
+    timeout = openai.APITimeoutError.__new__(openai.APITimeoutError)
+    client = _make_mock_client([timeout, _response("ok", 1000, 200, cached_tokens=600)])
+    svc = OpenAIService(client=client, model_name="test-model")
+
+    with caplog.at_level(logging.INFO, logger="ami_meeting_svc.ai_calls"):
+        assert asyncio.run(svc.get_completion("hi")) == "ok"
+
+    stats = ai_metrics.snapshot()[("test-model", "success")]
+    assert stats["calls"] == 1
+    assert stats["retries"] == 1
+    assert stats["prompt_tokens"] == 1000 and stats["cached_tokens"] == 600
+    assert stats["cost_usd"] == pytest.approx((1000 * 1.0 + 200 * 2.0) / 1e6)
+
+    record = json.loads(caplog.records[-1].getMessage())
+    assert record["event"] == "ai_call"
+    assert record["attempts"] == 2 and record["outcome"] == "success"
+    assert record["duration_ms"] > 0
+
+
+def test_failed_and_rejected_calls_are_labelled():
+    bad_request = openai.BadRequestError.__new__(openai.BadRequestError)
+    svc = OpenAIService(client=_make_mock_client([bad_request]), model_name="test-model")
+    with pytest.raises(openai.BadRequestError):
+        asyncio.run(svc.get_completion("hi"))
+
+    for _ in range(config.OPENAI_CIRCUIT_FAILURE_THRESHOLD):
+        openai_breaker.record_failure()
+    with pytest.raises(CircuitOpenError):
+        asyncio.run(svc.get_completion("hi"))
+
+    snapshot = ai_metrics.snapshot()
+    assert snapshot[("test-model", "client_error")]["calls"] == 1
+    assert snapshot[("test-model", "circuit_open")]["calls"] == 1
+    assert snapshot[("test-model", "circuit_open")]["prompt_tokens"] == 0
+
+
+def test_prometheus_export(client):
+    metrics = AIMetrics()
+    call = AICall(model='odd"model', kind="completion", attempts=3, duration=1.5)
+    call.add_usage(SimpleNamespace(prompt_tokens=300, completion_tokens=50))
+    metrics.record(call)
+
+    text = metrics.render_prometheus()
+    assert 'ami_ai_calls_total{model="odd\\"model",outcome="success"} 1' in text
+    assert 'ami_ai_call_duration_seconds_bucket{model="odd\\"model",outcome="success",le="2.5"} 1' in text
+    assert 'ami_ai_call_retries_sum{model="odd\\"model",outcome="success"} 2' in text
+    assert 'ami_ai_tokens_total{model="odd\\"model",outcome="success",kind="prompt"} 300' in text
+    assert "# TYPE ami_ai_call_tokens histogram" in text
+
+    resp = client.get("/monitoring/metrics")
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/plain")
+    assert "# TYPE ami_ai_calls_total counter" in resp.text
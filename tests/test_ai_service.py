@@ -1,8 +1,11 @@
+import asyncio
 import json
 import pytest
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import openai
+from ami_meeting_svc import config
+from ami_meeting_svc.services import ai_service
 from ami_meeting_svc.services.ai_service import OpenAIService
 
 
@@ -16,40 +19,44 @@ def _make_mock_response(content: str):
     return resp
 
 
-def test_text_response_success():
+def _make_mock_client():
     mock_client = MagicMock()
     mock_client.with_options.return_value = mock_client
+    mock_client.chat.completions.create = AsyncMock()
+    return mock_client
+
+
+def test_text_response_success():
+    mock_client = _make_mock_client()
     mock_client.chat.completions.create.return_value = _make_mock_response("hello world")
 
     svc = OpenAIService(client=mock_client)
-    out = svc.get_completion("hi")
+    out = asyncio.run(svc.get_completion("hi"))
 
     assert out == "hello world"
     mock_client.with_options.assert_called_once()
-    mock_client.chat.completions.create.assert_called_once()
+    mock_client.chat.completions.create.assert_awaited_once()
     # ensure response_format not passed for plain text
     _, kwargs = mock_client.chat.completions.create.call_args
     assert "response_format" not in kwargs
 
 
 def test_json_response_success():
-    mock_client = MagicMock()
-    mock_client.with_options.return_value = mock_client
+    mock_client = _make_mock_client()
     mock_client.chat.completions.create.return_value = _make_mock_response('{"a": 1}')
 
     svc = OpenAIService(client=mock_client)
-    out = svc.get_completion("give json", json_mode=True)
+    out = asyncio.run(svc.get_completion("give json", json_mode=True))
 
     assert isinstance(out, dict)
     assert out["a"] == 1
-    mock_client.chat.completions.create.assert_called_once()
+    mock_client.chat.completions.create.assert_awaited_once()
     _, kwargs = mock_client.chat.completions.create.call_args
     assert kwargs.get("response_format") == {"type": "json_object"}
 
 
 def test_retry_succeeds_after_transient_errors():
-    mock_client = MagicMock()
-    mock_client.with_options.return_value = mock_client
+    mock_client = _make_mock_client()
 
     success = _make_mock_response("recovered")
     # create transient RateLimitError instances
@@ -59,21 +66,46 @@ def test_retry_succeeds_after_transient_errors():
     mock_client.chat.completions.create.side_effect = [err1, err2, success]
 
     svc = OpenAIService(client=mock_client)
-    out = svc.get_completion("please retry")
+    out = asyncio.run(svc.get_completion("please retry"))
 
     assert out == "recovered"
     assert mock_client.chat.completions.create.call_count == 3
 
 
 def test_failure_after_max_retries():
-    mock_client = MagicMock()
-    mock_client.with_options.return_value = mock_client
+    mock_client = _make_mock_client()
 
     err = openai.RateLimitError.__new__(openai.RateLimitError)
     mock_client.chat.completions.create.side_effect = [err, err, err, err, err]
 
     svc = OpenAIService(client=mock_client)
     with pytest.raises(openai.RateLimitError):
-        svc.get_completion("never works")
+        asyncio.run(svc.get_completion("never works"))
 
     assert mock_client.chat.completions.create.call_count == 5
+
+
+def test_shared_client_is_reused(monkeypatch):
+    monkeypatch.setattr(config, "OPENAI_API_KEY", "sk-test")
+
+    async def scenario():
+        client = await ai_service.init_client()
+        try:
+            assert client is not None
+            assert OpenAIService()._client is client
+            assert OpenAIService()._client is client
+            # the SDK's own retries are disabled; tenacity owns retry policy
+            assert client.max_retries == 0
+        finally:
+            await ai_service.close_client()
+        assert ai_service._shared_client is None
+
+    asyncio.run(scenario())
+
+
+def test_init_client_without_api_key(monkeypatch):
+    monkeypatch.setattr(config, "OPENAI_API_KEY", None)
+
+    assert asyncio.run(ai_service.init_client()) is None
+    with pytest.raises(RuntimeError):
+        OpenAIService()
@@ -0,0 +1,160 @@
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from sqlalchemy import select
+
+from ami_meeting_svc.models import ActionItem, Meeting, User
+from ami_meeting_svc.utils.security import get_password_hash
+
+
+def create_user(db_session, username: str = "alice", email: str = "alice@example.com", password: str = "secret") -> User:
+    user = User(username=username, email=email, password_hash=get_password_hash(password))
+    db_session.add(user)
+    db_session.commit()
+    db_session.refresh(user)
+    return user
+
+
+def create_meeting(db_session, owner_id: int, notes: str = "Alice: we agreed to ship on Friday. Bob: I will send the recap.") -> Meeting:
+    meeting = Meeting(owner_id=owner_id, title="Team Sync", date=datetime.utcnow(), attendees=["alice", "bob"], notes=notes)
+    db_session.add(meeting)
+    db_session.commit()
+    db_session.refresh(meeting)
+    return meeting
+
+
+def login_and_set_cookie(client, username: str, password: str = "secret"):
+    resp = client.post("/auth/login", json={"username": username, "password": password})
+    assert resp.status_code == 200
+    client.cookies.set("access_token", resp.json()["access_token"])
+
+
+COMBINED_RESULT = {
+    "summary": "Release planning",
+    "key_discussion_points": ["Friday release"],
+    "decisions": ["Ship on Friday"],
+    "action_items": [
+        {"description": "Send recap", "assignee": "bob", "priority": "High", "deadline": None},
+        {"description": "Tag release", "assignee": None, "priority": "low", "deadline": "2026-01-20T00:00:00Z"},
+    ],
+}
+
+
+def fake_completion_factory(result, calls):
+    async def fake_completion(prompt, system_message=None, json_mode=False, usage=None):
+        calls.append((system_message, prompt))
+        if usage is not None:
+            usage.add(
+                SimpleNamespace(
+                    prompt_tokens=120,
+                    completion_tokens=30,
+                    total_tokens=150,
+                    prompt_tokens_details=SimpleNamespace(cached_tokens=100),
+                )
+            )
+        return result
+
+    return fake_completion
+
+
+def test_analyze_and_extract_single_call_persists_both(client, db_session):
+    user = create_user(db_session)
+    meeting = create_meeting(db_session, user.id)
+    login_and_set_cookie(client, "alice")
+
+    calls = []
+    with patch("ami_meeting_svc.routers.meetings.OpenAIService") as MockAI:
+        MockAI.return_value.get_completion = fake_completion_factory(COMBINED_RESULT, calls)
+        resp = client.post(f"/meetings/{meeting.id}/analyze-and-extract")
+
+    assert resp.status_code == 200
+    data = resp.json()
+    assert len(calls) == 1
+    system_message, user_message = calls[0]
+    # Instructions and schema live in the stable system prefix; the notes come last in the user message
+    assert "action_items" in system_message and "key_discussion_points" in system_message
+    assert user_message.endswith(meeting.notes)
+    assert data["meeting"]["analysis_result"] == {
+        "summary": "Release planning",
+        "key_discussion_points": ["Friday release"],
+        "decisions": ["Ship on Friday"],
+    }
+    assert [item["description"] for item in data["action_items"]] == ["Send recap", "Tag release"]
+    assert data["action_items"][1]["priority"] == "Low"
+    assert data["usage"] == {
+        "prompt_tokens": 120, "completion_tokens": 30, "total_tokens": 150, "cached_tokens": 100, "calls": 1
+    }
+    assert data["cached"] is False
+
+    db_session.expire_all()
+    assert db_session.get(Meeting, meeting.id).analysis_result["summary"] == "Release planning"
+    rows = db_session.execute(select(ActionItem).where(ActionItem.meeting_id == meeting.id)).scalars().all()
+    assert len(rows) == 2
+
+
+def test_analyze_and_extract_repeat_is_served_from_cache(client, db_session):
+    user = create_user(db_session)
+    meeting = create_meeting(db_session, user.id)
+    login_and_set_cookie(client, "alice")
+
+    calls = []
+    with patch("ami_meeting_svc.routers.meetings.OpenAIService") as MockAI:
+        MockAI.return_value.get_completion = fake_completion_factory(COMBINED_RESULT, calls)
+        client.post(f"/meetings/{meeting.id}/analyze-and-extract")
+        resp = client.post(f"/meetings/{meeting.id}/analyze-and-extract")
+
+    assert resp.status_code == 200
+    assert len(calls) == 1
+    assert resp.json()["cached"] is True
+    assert resp.json()["usage"]["total_tokens"] == 0
+
+
+def test_analyze_and_extract_reports_unrepairable_items(client, db_session):
+    user = create_user(db_session)
+    meeting = create_meeting(db_session, user.id)
+    login_and_set_cookie(client, "alice")
+
+    bad = dict(COMBINED_RESULT, action_items=[COMBINED_RESULT["action_items"][0], {"description": "No priority"}])
+    calls = []
+    with patch("ami_meeting_svc.routers.meetings.OpenAIService") as MockAI:
+        # The repair call gets the same unusable reply back
+        MockAI.return_value.get_completion = fake_completion_factory(bad, calls)
+        resp = client.post(f"/meetings/{meeting.id}/analyze-and-extract")
+
+    assert resp.status_code == 200
+    data = resp.json()
+    assert [item["description"] for item in data["action_items"]] == ["Send recap"]
+    assert data["rejected_action_items"] == [
+        {"index": 1, "item": {"description": "No priority"}, "errors": ["priority: Field required"]}
+    ]
+    assert len(calls) == 2
+    assert data["usage"]["calls"] == 2
+    assert data["meeting"]["analysis_result"]["summary"] == "Release planning"
+
+
+def test_analyze_and_extract_invalid_payload_persists_nothing(client, db_session):
+    user = create_user(db_session)
+    meeting = create_meeting(db_session, user.id)
+    login_and_set_cookie(client, "alice")
+
+    bad = dict(COMBINED_RESULT, action_items="Send recap")
+    with patch("ami_meeting_svc.routers.meetings.OpenAIService") as MockAI:
+        MockAI.return_value.get_completion = fake_completion_factory(bad, [])
+        resp = client.post(f"/meetings/{meeting.id}/analyze-and-extract")
+
+    assert resp.status_code == 500
+    assert resp.json()["detail"] == "Invalid AI response format"
+    db_session.expire_all()
+    assert db_session.get(Meeting, meeting.id).analysis_result is None
+    assert db_session.execute(select(ActionItem)).scalars().all() == []
+
+
+def test_analyze_and_extract_requires_ownership(client, db_session):
+    owner = create_user(db_session)
+    meeting = create_meeting(db_session, owner.id)
+    create_user(db_session, username="bob", email="bob@example.com")
+    login_and_set_cookie(client, "bob")
+
+    resp = client.post(f"/meetings/{meeting.id}/analyze-and-extract")
+    assert resp.status_code == 404
@@ -0,0 +1,153 @@
+import asyncio
+import json
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from ami_meeting_svc.models import Meeting, User
+from ami_meeting_svc.services.ai_service import OpenAIService, TokenUsage
+from ami_meeting_svc.utils.security import get_password_hash
+
+
+def create_user(db_session, username: str = "alice", email: str = "alice@example.com", password: str = "secret") -> User:
+    user = User(username=username, email=email, password_hash=get_password_hash(password))
+    db_session.add(user)
+    db_session.commit()
+    db_session.refresh(user)
+    return user
+
+
+def create_meeting(db_session, owner_id: int, notes: str = "Alice: we ship Friday. Bob: agreed.") -> Meeting:
+    meeting = Meeting(owner_id=owner_id, title="Sync", date=datetime.utcnow(), attendees=["a"], notes=notes)
+    db_session.add(meeting)
+    db_session.commit()
+    db_session.refresh(meeting)
+    return meeting
+
+
+def login_and_set_cookie(client, username: str, password: str = "secret"):
+    resp = client.post("/auth/login", json={"username": username, "password": password})
+    assert resp.status_code == 200
+    client.cookies.set("access_token", resp.json()["access_token"])
+
+
+def parse_sse(text: str):
+    events = []
+    for block in text.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+def fake_stream(pieces, calls=None):
+    async def stream_completion(prompt, system_message=None, json_mode=False, usage=None):
+        if calls is not None:
+            calls.append(prompt)
+        for piece in pieces:
+            yield piece
+
+    return stream_completion
+
+
+ANALYSIS = {"summary": "Ship Friday", "key_discussion_points": ["release"], "decisions": ["ship"]}
+
+
+def test_stream_sends_deltas_then_persisted_result(client, db_session):
+    user = create_user(db_session)
+    meeting = create_meeting(db_session, user.id)
+    login_and_set_cookie(client, "alice")
+
+    text = json.dumps(ANALYSIS)
+    pieces = [text[i:i + 7] for i in range(0, len(text), 7)]
+    calls = []
+    with patch("ami_meeting_svc.routers.meetings.OpenAIService") as MockAI:
+        MockAI.return_value.stream_completion = fake_stream(pieces, calls)
+        resp = client.post(f"/meetings/{meeting.id}/analyze/stream")
+        again = client.post(f"/meetings/{meeting.id}/analyze/stream")
+
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/event-stream")
+    events = parse_sse(resp.text)
+    assert [e for e, _ in events] == ["delta"] * len(pieces) + ["result"]
+    assert "".join(d["text"] for e, d in events if e == "delta") == text
+    assert events[-1][1]["analysis_result"] == ANALYSIS
+
+    db_session.expire_all()
+    assert db_session.get(Meeting, meeting.id).analysis_result == ANALYSIS
+
+    # The second request is answered from the cache without streaming from the model
+    assert len(calls) == 1
+    assert [e for e, _ in parse_sse(again.text)] == ["result"]
+
+
+def test_stream_reports_invalid_output_in_band(client, db_session):
+    user = create_user(db_session)
+    meeting = create_meeting(db_session, user.id)
+    login_and_set_cookie(client, "alice")
+
+    with patch("ami_meeting_svc.routers.meetings.OpenAIService") as MockAI:
+        MockAI.return_value.stream_completion = fake_stream(['{"summary": "cut o'])
+        resp = client.post(f"/meetings/{meeting.id}/analyze/stream")
+
+    events = parse_sse(resp.text)
+    assert events[-1][0] == "error"
+    assert events[-1][1]["status_code"] == 500
+    assert events[-1][1]["detail"] == "Invalid AI response format"
+    db_session.expire_all()
+    assert db_session.get(Meeting, meeting.id).analysis_result is None
+
+
+def test_stream_checks_ownership_before_streaming(client, db_session):
+    owner = create_user(db_session)
+    meeting = create_meeting(db_session, owner.id)
+    create_user(db_session, username="bob", email="bob@example.com")
+    login_and_set_cookie(client, "bob")
+
+    resp = client.post(f"/meetings/{meeting.id}/analyze/stream")
+    assert resp.status_code == 404
+
+
+def test_service_stream_completion_yields_deltas_and_usage():
+    def chunk(content=None, usage=None):
+        choices = [SimpleNamespace(delta=SimpleNamespace(content=content))] if usage is None else []
+        return SimpleNamespace(choices=choices, usage=usage)
+
+    class FakeStream:
+        def __init__(self, chunks):
+            self._chunks = iter(chunks)
+            self.closed = False
+
+        def __aiter__(self):
+            return self
+
+        async def __anext__(self):
+            try:
+                return next(self._chunks)
+            except StopIteration:
+                raise StopAsyncIteration
+
+        async def close(self):
+            self.closed = True
+
+    stream = FakeStream([
+        chunk("{\"a\""),
+        chunk(None),
+        chunk(": 1}"),
+        chunk(usage=SimpleNamespace(prompt_tokens=10, completion_tokens=4, total_tokens=14)),
+    ])
+    mock_client = MagicMock()
+    mock_client.with_options.return_value = mock_client
+    mock_client.chat.completions.create = AsyncMock(return_value=stream)
+
+    svc = OpenAIService(client=mock_client)
+    usage = TokenUsage()
+
+    async def collect():
+        return [delta async for delta in svc.stream_completion("hi", json_mode=True, usage=usage)]
+
+    assert asyncio.run(collect()) == ['{"a"', ": 1}"]
+    assert usage.total_tokens == 14
+    assert stream.closed
+    _, kwargs = mock_client.chat.completions.create.call_args
+    assert kwargs["stream"] is True
+    assert kwargs["response_format"] == {"type": "json_object"}
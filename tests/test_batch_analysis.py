@@ -0,0 +1,180 @@
+import asyncio
+import json
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from ami_meeting_svc import batch, config
+from ami_meeting_svc.models import Meeting, User
+from ami_meeting_svc.models.base import Base
+from ami_meeting_svc.services.batch_analysis import run_batch_analysis, select_meetings
+from ami_meeting_svc.utils.security import get_password_hash
+
+
+def create_user(db_session, username: str = "alice", email: str = "alice@example.com", password: str = "secret") -> User:
+    user = User(username=username, email=email, password_hash=get_password_hash(password))
+    db_session.add(user)
+    db_session.commit()
+    db_session.refresh(user)
+    return user
+
+
+def create_meeting(db_session, owner_id: int, notes: str, analysis_result: dict | None = None) -> Meeting:
+    meeting = Meeting(
+        owner_id=owner_id, title="Sync", date=datetime.utcnow(), attendees=["a"], notes=notes, analysis_result=analysis_result
+    )
+    db_session.add(meeting)
+    db_session.commit()
+    db_session.refresh(meeting)
+    return meeting
+
+
+def login_and_set_cookie(client, username: str, password: str = "secret"):
+    resp = client.post("/auth/login", json={"username": username, "password": password})
+    assert resp.status_code == 200
+    client.cookies.set("access_token", resp.json()["access_token"])
+
+
+def file_engine(tmp_path):
+    # A file database gives each concurrent task its own connection, as in production
+    engine = create_engine(f"sqlite:///{tmp_path / 'batch.db'}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    return engine
+
+
+async def summarize(prompt, system_message=None, json_mode=False):
+    if "boom" in prompt:
+        raise RuntimeError("upstream failure")
+    return {"summary": prompt.rsplit("\n", 1)[-1], "key_discussion_points": [], "decisions": []}
+
+
+def test_batch_endpoint_streams_progress_and_persists(client, db_session, monkeypatch):
+    monkeypatch.setattr(config, "BATCH_CONCURRENCY", 1)
+    monkeypatch.setattr(config, "BATCH_COMMIT_SIZE", 2)
+    alice = create_user(db_session)
+    bob = create_user(db_session, username="bob", email="bob@example.com")
+    ok1 = create_meeting(db_session, alice.id, "notes one")
+    ok2 = create_meeting(db_session, alice.id, "notes two")
+    broken = create_meeting(db_session, alice.id, "boom")
+    foreign = create_meeting(db_session, bob.id, "not yours")
+    login_and_set_cookie(client, "alice")
+
+    with patch("ami_meeting_svc.routers.meetings.OpenAIService") as MockAI:
+        MockAI.return_value.get_completion = summarize
+        resp = client.post(
+            "/meetings/batch-analyze", json={"meeting_ids": [ok1.id, ok2.id, broken.id, foreign.id]}
+        )
+
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("application/x-ndjson")
+    events = [json.loads(line) for line in resp.text.splitlines()]
+    results = {e["meeting_id"]: e for e in events if e["event"] == "result"}
+    assert results[foreign.id]["status"] == "not_found"
+    assert results[ok1.id]["status"] == "succeeded"
+    assert results[broken.id] == {"event": "result", "meeting_id": broken.id, "status": "failed", "error": "AI service error"}
+    # Meetings finish in completion order, so only check which ones were committed, not how they were grouped
+    committed = [meeting_id for e in events if e["event"] == "committed" for meeting_id in e["meeting_ids"]]
+    assert sorted(committed) == [ok1.id, ok2.id]
+    assert not [e for e in events if e["event"] == "commit_failed"]
+    assert events[:2] == [
+        {"event": "started", "total": 4},
+        {"event": "result", "meeting_id": foreign.id, "status": "not_found"},
+    ]
+    assert events[-1] == {"event": "finished", "total": 4, "succeeded": 2, "failed": 2}
+
+    db_session.expire_all()
+    assert db_session.get(Meeting, ok2.id).analysis_result["summary"] == "notes two"
+    assert db_session.get(Meeting, broken.id).analysis_result is None
+    assert db_session.get(Meeting, foreign.id).analysis_result is None
+
+
+def test_batch_filter_only_unanalyzed(tmp_path):
+    engine = file_engine(tmp_path)
+    with Session(engine) as db:
+        owner_id = create_user(db).id
+        done_id = create_meeting(db, owner_id, "old", analysis_result={"summary": "old"}).id
+        todo_id = create_meeting(db, owner_id, "new").id
+        create_meeting(db, create_user(db, username="bob", email="bob@example.com").id, "other owner")
+
+    assert select_meetings(engine, owner_id=owner_id, only_unanalyzed=True) == [(todo_id, "new")]
+    assert [m[0] for m in select_meetings(engine, owner_id=owner_id)] == [done_id, todo_id]
+
+
+def test_batch_respects_concurrency_cap(tmp_path):
+    engine = file_engine(tmp_path)
+    with Session(engine) as db:
+        owner_id = create_user(db).id
+        meetings = [(create_meeting(db, owner_id, f"notes {i}").id, f"notes {i}") for i in range(12)]
+
+    active = peak = 0
+
+    async def slow_summary(prompt, system_message=None, json_mode=False):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return {"summary": "s"}
+
+    async def scenario():
+        service = MagicMock()
+        service.get_completion = slow_summary
+        return [e async for e in run_batch_analysis(engine, meetings, lambda **_: service, concurrency=3, commit_size=5)]
+
+    events = asyncio.run(scenario())
+
+    assert peak == 3
+    assert sum(len(e["meeting_ids"]) for e in events if e["event"] == "committed") == 12
+    assert len([e for e in events if e["event"] == "committed"]) == 3
+    with Session(engine) as db:
+        assert all(db.get(Meeting, meeting_id).analysis_result == {"summary": "s"} for meeting_id, _ in meetings)
+
+
+
+def test_batch_stopped_early_unwinds_tasks_and_keeps_results(tmp_path):
+    engine = file_engine(tmp_path)
+    with Session(engine) as db:
+        owner_id = create_user(db).id
+        meetings = [(create_meeting(db, owner_id, f"notes {i}").id, f"notes {i}") for i in range(3)]
+
+    async def slow_summary(prompt, system_message=None, json_mode=False):
+        if not prompt.endswith("notes 0"):
+            await asyncio.sleep(10)
+        return {"summary": "s"}
+
+    async def scenario():
+        service = MagicMock()
+        service.get_completion = slow_summary
+        events = run_batch_analysis(engine, meetings, lambda **_: service, concurrency=3, commit_size=5)
+        async for event in events:
+            if event["event"] == "result":
+                break
+        # The consumer went away, e.g. the client disconnected
+        await events.aclose()
+        return [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+
+    assert asyncio.run(scenario()) == []
+    with Session(engine) as db:
+        assert db.get(Meeting, meetings[0][0]).analysis_result == {"summary": "s"}
+        assert db.get(Meeting, meetings[1][0]).analysis_result is None
+
+
+def test_batch_cli_prints_events(tmp_path, monkeypatch, capsys):
+    engine = file_engine(tmp_path)
+    with Session(engine) as db:
+        meeting_id = create_meeting(db, create_user(db).id, "cli notes").id
+
+    monkeypatch.setattr(batch, "engine", engine)
+    monkeypatch.setattr(config, "OPENAI_API_KEY", "test-key")
+    with patch("ami_meeting_svc.batch.OpenAIService") as MockAI:
+        MockAI.return_value.get_completion = AsyncMock(return_value={"summary": "from cli"})
+        exit_code = batch.main([str(meeting_id), "--concurrency", "2"])
+
+    assert exit_code == 0
+    events = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert events[0] == {"event": "started", "total": 1}
+    assert events[-1]["succeeded"] == 1
+    with Session(engine) as db:
+        assert db.get(Meeting, meeting_id).analysis_result == {"summary": "from cli"}
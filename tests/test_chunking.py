@@ -0,0 +1,92 @@
+import asyncio
+from datetime import datetime
+from unittest.mock import patch
+
+from ami_meeting_svc import config
+from ami_meeting_svc.models import Meeting, User
+from ami_meeting_svc.services.chunking import estimate_tokens, split_notes
+from ami_meeting_svc.utils.security import get_password_hash
+
+
+def create_user(db_session, username: str = "alice", email: str = "alice@example.com", password: str = "secret") -> User:
+    user = User(username=username, email=email, password_hash=get_password_hash(password))
+    db_session.add(user)
+    db_session.commit()
+    db_session.refresh(user)
+    return user
+
+
+def login_and_set_cookie(client, username: str, password: str = "secret"):
+    resp = client.post("/auth/login", json={"username": username, "password": password})
+    assert resp.status_code == 200
+    client.cookies.set("access_token", resp.json()["access_token"])
+
+
+def transcript(turns: int) -> str:
+    speakers = ["Alice", "Bob", "Carol"]
+    return "\n".join(
+        f"{speakers[i % 3]}: item {i} was discussed at some length by the team today." for i in range(turns)
+    )
+
+
+def test_short_notes_stay_in_one_chunk():
+    notes = "Alice: hello.\nBob: hi."
+    assert split_notes(notes, token_budget=1000) == [notes]
+
+
+def test_chunks_respect_budget_and_speaker_boundaries():
+    notes = transcript(30)
+    chunks = split_notes(notes, token_budget=60)
+
+    assert len(chunks) > 1
+    assert all(estimate_tokens(chunk) <= 60 for chunk in chunks)
+    for chunk in chunks:
+        # every chunk starts at the beginning of a speaker turn
+        assert chunk.split(":", 1)[0] in {"Alice", "Bob", "Carol"}
+    assert sum(chunk.count("item ") for chunk in chunks) == 30
+
+
+def test_oversized_paragraph_is_split():
+    sentence = "This sentence keeps going without any speaker change. "
+    chunks = split_notes(sentence * 40, token_budget=30)
+    assert len(chunks) > 1
+    assert all(estimate_tokens(chunk) <= 30 for chunk in chunks)
+
+
+def test_long_notes_are_analyzed_map_reduce(client, db_session, monkeypatch):
+    monkeypatch.setattr(config, "ANALYSIS_CHUNK_TOKEN_BUDGET", 100)
+    monkeypatch.setattr(config, "ANALYSIS_CHUNK_CONCURRENCY", 2)
+
+    user = create_user(db_session)
+    meeting = Meeting(owner_id=user.id, title="All hands", date=datetime.utcnow(), attendees=["a"], notes=transcript(40))
+    db_session.add(meeting)
+    db_session.commit()
+    login_and_set_cookie(client, "alice")
+
+    active = 0
+    peak = 0
+    prompts = []
+
+    async def fake_completion(prompt, system_message=None, json_mode=False):
+        nonlocal active, peak
+        prompts.append(prompt)
+        if prompt.startswith("The following are summaries"):
+            return {"summary": "merged summary"}
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return {"summary": "part", "key_discussion_points": ["Budget", "budget ", "Hiring"], "decisions": ["Ship it"]}
+
+    with patch("ami_meeting_svc.routers.meetings.OpenAIService") as MockAI:
+        MockAI.return_value.get_completion = fake_completion
+        resp = client.post(f"/meetings/{meeting.id}/analyze")
+
+    assert resp.status_code == 200
+    result = resp.json()["analysis_result"]
+    assert result == {"summary": "merged summary", "key_discussion_points": ["Budget", "Hiring"], "decisions": ["Ship it"]}
+
+    chunk_prompts = [p for p in prompts if "part " in p and " of " in p and "Meeting notes" in p]
+    assert len(chunk_prompts) > 2
+    assert len(prompts) == len(chunk_prompts) + 1
+    assert peak == 2
@@ -0,0 +1,135 @@
+import asyncio
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import openai
+import pytest
+
+from ami_meeting_svc.models import Meeting, User
+from ami_meeting_svc.services.ai_service import OpenAIService, _stop_retrying
+from ami_meeting_svc.services.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitOpenError, openai_breaker
+from ami_meeting_svc.utils.security import get_password_hash
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_opens_after_threshold_and_fails_fast():
+    clock = FakeClock()
+    breaker = CircuitBreaker("test", failure_threshold=3, recovery_seconds=30, clock=clock)
+
+    for _ in range(3):
+        breaker.before_call()
+        breaker.record_failure()
+
+    assert breaker.state == OPEN
+    clock.now = 10
+    with pytest.raises(CircuitOpenError) as exc:
+        breaker.before_call()
+    assert exc.value.retry_after == pytest.approx(20)
+    assert breaker.stats()["rejected"] == 1
+
+
+def test_success_resets_consecutive_failures():
+    breaker = CircuitBreaker("test", failure_threshold=2, recovery_seconds=30, clock=FakeClock())
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == CLOSED
+
+
+def test_half_open_allows_a_single_probe():
+    clock = FakeClock()
+    breaker = CircuitBreaker("test", failure_threshold=1, recovery_seconds=30, clock=clock)
+    breaker.record_failure()
+
+    clock.now = 31
+    breaker.before_call()  # the probe
+    assert breaker.state == HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    # A failed probe re-opens for a full recovery window
+    breaker.record_failure()
+    assert breaker.state == OPEN
+    clock.now = 50
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    clock.now = 62
+    breaker.before_call()
+    breaker.record_success()
+    assert breaker.state == CLOSED
+    breaker.before_call()
+
+
+def test_open_circuit_skips_upstream_call():
+    for _ in range(5):
+        openai_breaker.record_failure()
+
+    mock_client = MagicMock()
+    mock_client.with_options.return_value = mock_client
+    mock_client.chat.completions.create = AsyncMock()
+    svc = OpenAIService(client=mock_client)
+
+    with pytest.raises(CircuitOpenError):
+        asyncio.run(svc.get_completion("hello"))
+    mock_client.chat.completions.create.assert_not_awaited()
+
+
+
+def test_retried_call_counts_as_one_failure(monkeypatch):
+    monkeypatch.setattr(OpenAIService._create_chat_completion.retry, "sleep", AsyncMock())
+    error = openai.APIConnectionError(request=MagicMock())
+    mock_client = MagicMock()
+    mock_client.with_options.return_value = mock_client
+    mock_client.chat.completions.create = AsyncMock(side_effect=error)
+    svc = OpenAIService(client=mock_client)
+
+    with pytest.raises(openai.APIConnectionError):
+        asyncio.run(svc.get_completion("hello"))
+
+    assert mock_client.chat.completions.create.await_count == 5
+    assert openai_breaker.stats()["consecutive_failures"] == 1
+    assert openai_breaker.state == CLOSED
+
+
+def test_retries_stop_at_the_deadline():
+    state = MagicMock()
+    state.attempt_number = 2
+    state.upcoming_sleep = 8.0
+    state.kwargs = {"deadline": 0.0}
+    assert _stop_retrying(state) is True
+
+    state.kwargs = {"deadline": float("inf")}
+    assert _stop_retrying(state) is False
+
+    state.attempt_number = 5
+    assert _stop_retrying(state) is True
+
+
+def test_analyze_returns_503_with_retry_after_while_open(client, db_session):
+    user = User(username="alice", email="alice@example.com", password_hash=get_password_hash("secret"))
+    db_session.add(user)
+    db_session.commit()
+    meeting = Meeting(owner_id=user.id, title="Sync", date=datetime.utcnow(), attendees=["a"], notes="Some notes")
+    db_session.add(meeting)
+    db_session.commit()
+    resp = client.post("/auth/login", json={"username": "alice", "password": "secret"})
+    client.cookies.set("access_token", resp.json()["access_token"])
+
+    with patch("ami_meeting_svc.routers.meetings.OpenAIService") as MockAI:
+        MockAI.return_value.get_completion = AsyncMock(side_effect=CircuitOpenError("openai", 12.3))
+        resp = client.post(f"/meetings/{meeting.id}/analyze")
+
+    assert resp.status_code == 503
+    assert resp.headers["retry-after"] == "13"
+    assert resp.json()["detail"] == "AI service temporarily unavailable"
+
+    stats = client.get("/monitoring/openai-circuit").json()
+    assert stats["state"] == CLOSED
@@ -0,0 +1,135 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+from ami_meeting_svc.models import AILease
+from ami_meeting_svc.services.coalescing import DBLease, SingleFlight, shared_ai_result
+
+
+def test_single_flight_shares_one_call():
+    flight = SingleFlight()
+    calls = 0
+
+    async def slow():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return {"summary": "shared"}
+
+    async def scenario():
+        return await asyncio.gather(*(flight.do("k", slow) for _ in range(5)))
+
+    results = asyncio.run(scenario())
+    assert calls == 1
+    assert all(r == {"summary": "shared"} for r in results)
+
+
+def test_single_flight_propagates_errors_to_all_callers():
+    flight = SingleFlight()
+
+    async def boom():
+        await asyncio.sleep(0.01)
+        raise ValueError("upstream failed")
+
+    async def scenario():
+        return await asyncio.gather(*(flight.do("k", boom) for _ in range(3)), return_exceptions=True)
+
+    results = asyncio.run(scenario())
+    assert all(isinstance(r, ValueError) for r in results)
+
+
+def test_db_lease_is_exclusive_until_released(session_local):
+    bind = session_local.kw["bind"]
+    lease = DBLease(ttl_seconds=60)
+
+    async def scenario():
+        first = await lease.try_acquire(bind, "key")
+        second = await lease.try_acquire(bind, "key")
+        await lease.release(bind, "key", first)
+        third = await lease.try_acquire(bind, "key")
+        return first, second, third
+
+    first, second, third = asyncio.run(scenario())
+    assert first is not None
+    assert second is None
+    assert third is not None
+
+
+def test_db_lease_expired_holder_is_taken_over(session_local, db_session):
+    bind = session_local.kw["bind"]
+    db_session.add(AILease(lease_key="key", holder="dead-worker", expires_at=datetime.utcnow() - timedelta(seconds=1)))
+    db_session.commit()
+
+    assert asyncio.run(DBLease(ttl_seconds=60).try_acquire(bind, "key")) is not None
+
+
+def test_shared_ai_result_waits_for_other_worker(session_local, db_session, monkeypatch):
+    """A lease held by another process makes callers wait and reuse its cached result."""
+    from ami_meeting_svc import config
+    from ami_meeting_svc.services.ai_cache import ai_cache
+
+    monkeypatch.setattr(config, "AI_LEASE_POLL_INTERVAL", 0.01)
+    bind = session_local.kw["bind"]
+    db_session.add(AILease(lease_key="key", holder="other-worker", expires_at=datetime.utcnow() + timedelta(seconds=60)))
+    db_session.commit()
+
+    async def call():
+        pytest.fail("the model must not be called while another worker holds the lease")
+
+    async def other_worker_finishes():
+        await asyncio.sleep(0.05)
+        await ai_cache.put(bind, "key", "analysis", "m", "v1", {"summary": "from other worker"})
+
+    async def scenario():
+        result, _ = await asyncio.gather(
+            shared_ai_result(bind, "key", "analysis", "m", "v1", call), other_worker_finishes()
+        )
+        return result
+
+    assert asyncio.run(scenario()) == {"summary": "from other worker"}
+
+
+def test_shared_ai_result_reads_other_worker_result_without_cache(session_local, db_session, monkeypatch):
+    """With the AI cache off, waiters take the result the holder left on the lease row."""
+    from ami_meeting_svc import config
+    from ami_meeting_svc.services.ai_cache import ai_cache
+    from ami_meeting_svc.services.coalescing import ai_lease
+
+    monkeypatch.setattr(config, "AI_LEASE_POLL_INTERVAL", 0.01)
+    monkeypatch.setattr(ai_cache, "enabled", False)
+    bind = session_local.kw["bind"]
+    db_session.add(AILease(lease_key="key", holder="other-worker", expires_at=datetime.utcnow() + timedelta(seconds=60)))
+    db_session.commit()
+
+    async def call():
+        pytest.fail("the model must not be called while another worker holds the lease")
+
+    async def other_worker_finishes():
+        await asyncio.sleep(0.05)
+        await ai_lease.complete(bind, "key", "other-worker", {"summary": "from other worker"})
+
+    async def scenario():
+        result, _ = await asyncio.gather(
+            shared_ai_result(bind, "key", "analysis", "m", "v1", call), other_worker_finishes()
+        )
+        return result
+
+    assert asyncio.run(scenario()) == {"summary": "from other worker"}
+
+
+def test_db_lease_is_extended_while_the_call_runs(session_local):
+    bind = session_local.kw["bind"]
+    lease = DBLease(ttl_seconds=0.06)
+
+    async def scenario():
+        holder = await lease.try_acquire(bind, "key")
+
+        async def slow_call():
+            # Outlives the initial TTL several times over
+            await asyncio.sleep(0.2)
+            return await DBLease(ttl_seconds=60).try_acquire(bind, "key")
+
+        return await lease.hold(bind, "key", holder, slow_call)
+
+    assert asyncio.run(scenario()) is None
@@ -0,0 +1,119 @@
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, patch
+
+from ami_meeting_svc.models import ActionItem, ActionItemStatusTransition, Meeting, User
+from ami_meeting_svc.utils.security import get_password_hash
+
+T0 = datetime(2026, 9, 1, 9, 0)
+
+
+def create_user(db_session, username: str = "alice", email: str = "alice@example.com") -> User:
+    user = User(username=username, email=email, password_hash=get_password_hash("secret"))
+    db_session.add(user)
+    db_session.commit()
+    db_session.refresh(user)
+    return user
+
+
+def create_meeting(db_session, owner_id: int) -> Meeting:
+    meeting = Meeting(owner_id=owner_id, title="Team Sync", date=datetime.utcnow(), attendees=["a"], notes="x" * 60)
+    db_session.add(meeting)
+    db_session.commit()
+    db_session.refresh(meeting)
+    return meeting
+
+
+def login_and_set_cookie(client, username: str, password: str = "secret"):
+    resp = client.post("/auth/login", json={"username": username, "password": password})
+    assert resp.status_code == 200
+    client.cookies.set("access_token", resp.json()["access_token"])
+
+
+def history(db_session, item_id: int):
+    rows = (
+        db_session.query(ActionItemStatusTransition)
+        .filter_by(action_item_id=item_id)
+        .order_by(ActionItemStatusTransition.id)
+    )
+    return [(r.from_status, r.to_status) for r in rows]
+
+
+def add_history(db_session, owner_id: int, item_id: int, assignee, priority, *steps):
+    """steps: (hours after T0, to_status); the first step is the creation."""
+    previous = None
+    for hours, to_status in steps:
+        db_session.add(
+            ActionItemStatusTransition(
+                action_item_id=item_id, owner_id=owner_id, assignee=assignee, priority=priority,
+                from_status=previous, to_status=to_status, changed_at=T0 + timedelta(hours=hours),
+            )
+        )
+        previous = to_status
+    db_session.commit()
+
+
+def test_status_changes_are_appended(client, db_session):
+    user = create_user(db_session)
+    meeting = create_meeting(db_session, user.id)
+    login_and_set_cookie(client, "alice")
+    item = ActionItem(meeting_id=meeting.id, description="Task", assignee="bob", priority="High")
+    db_session.add(item)
+    db_session.commit()
+
+    client.patch(f"/action-items/{item.id}", json={"status": "In Progress"})
+    client.patch(f"/action-items/{item.id}", json={"assignee": "carol"})
+    client.patch(f"/action-items/{item.id}", json={"status": "Done"})
+
+    assert history(db_session, item.id) == [(None, "To Do"), ("To Do", "In Progress"), ("In Progress", "Done")]
+    done = db_session.query(ActionItemStatusTransition).filter_by(action_item_id=item.id, to_status="Done").one()
+    assert (done.owner_id, done.assignee, done.priority) == (user.id, "carol", "High")
+
+
+def test_extracted_items_start_their_history(client, db_session):
+    user = create_user(db_session)
+    meeting = create_meeting(db_session, user.id)
+    login_and_set_cookie(client, "alice")
+
+    payload = {"action_items": [{"description": "Write the plan", "assignee": "bob", "priority": "High"}]}
+    with patch("ami_meeting_svc.routers.meetings.OpenAIService") as MockAI:
+        MockAI.return_value.get_completion = AsyncMock(return_value=payload)
+        item_id = client.post(f"/meetings/{meeting.id}/extract-actions").json()[0]["id"]
+
+    assert history(db_session, item_id) == [(None, "To Do")]
+
+
+def test_cycle_time_percentiles_per_assignee_and_priority(client, db_session):
+    user = create_user(db_session)
+    other = create_user(db_session, username="bob", email="bob@example.com")
+    login_and_set_cookie(client, "alice")
+    # alice: lead times 10h / 20h / 30h, only the first two went through In Progress (8h and 4h)
+    add_history(db_session, user.id, 1, "alice", "High", (0, "To Do"), (2, "In Progress"), (10, "Done"))
+    add_history(db_session, user.id, 2, "alice", "Low", (0, "To Do"), (16, "In Progress"), (20, "Done"))
+    add_history(db_session, user.id, 3, "alice", "High", (0, "To Do"), (30, "Done"))
+    # Unassigned, reopened and completed again: completion is the last move to Done
+    add_history(db_session, user.id, 4, None, "High", (0, "To Do"), (5, "Done"), (6, "In Progress"), (48, "Done"))
+    # Not done any more, or someone else's: ignored
+    add_history(db_session, user.id, 5, "alice", "High", (0, "To Do"), (1, "Done"), (2, "To Do"))
+    add_history(db_session, other.id, 6, "alice", "High", (0, "To Do"), (1, "Done"))
+
+    resp = client.get("/dashboard/cycle-times")
+    assert resp.status_code == 200
+    unassigned, alice = resp.json()["groups"]
+    assert unassigned["key"] is None
+    assert unassigned["lead_time_hours"] == {"p50": 48.0, "p90": 48.0, "p99": 48.0}
+    assert unassigned["cycle_time_hours"] == {"p50": 42.0, "p90": 42.0, "p99": 42.0}
+    assert alice["key"] == "alice"
+    assert alice["completed_count"] == 3
+    assert alice["lead_time_hours"] == {"p50": 20.0, "p90": 28.0, "p99": 29.8}
+    assert alice["cycle_time_count"] == 2
+    assert alice["cycle_time_hours"] == {"p50": 6.0, "p90": 7.6, "p99": 7.96}
+
+    by_priority = client.get("/dashboard/cycle-times", params={"group_by": "priority"}).json()["groups"]
+    assert [(g["key"], g["completed_count"]) for g in by_priority] == [("High", 3), ("Low", 1)]
+    assert by_priority[1]["cycle_time_hours"] == {"p50": 4.0, "p90": 4.0, "p99": 4.0}
+
+    # Completed on the first day only; item 4 was completed again later
+    first_day = client.get("/dashboard/cycle-times", params={"start": "2026-09-01", "end": "2026-09-01"}).json()
+    assert [(g["key"], g["completed_count"]) for g in first_day["groups"]] == [("alice", 1)]
+    assert client.get("/dashboard/cycle-times", params={"start": "2026-09-02", "end": "2026-09-01"}).status_code == 400
+    assert client.get("/dashboard/cycle-times", params={"group_by": "meeting"}).status_code == 422
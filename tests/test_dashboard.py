@@ -99,3 +99,43 @@ def test_dashboard_with_data(client, db_session):
     assert none_assignee["todo_count"] == 1
     assert none_assignee["in_progress_count"] == 1
     assert none_assignee["done_count"] == 0
+
+
+def test_live_metrics_match_rollup_and_stay_per_owner(client, db_session, monkeypatch):
+    from sqlalchemy import event
+
+    from ami_meeting_svc import config
+
+    owner = create_user(db_session, username="owner", email="owner@example.com")
+    other = create_user(db_session, username="other", email="other@example.com")
+    mine = create_meeting(db_session, owner.id)
+    theirs = create_meeting(db_session, other.id)
+    db_session.add_all([
+        ActionItem(meeting_id=mine.id, description="A", assignee="alice", priority="High", status="To Do", is_overdue=True),
+        ActionItem(meeting_id=mine.id, description="B", assignee="alice", priority="Low", status="Done", is_overdue=False),
+        ActionItem(meeting_id=mine.id, description="C", assignee=None, priority="Low", status="In Progress", is_overdue=False),
+        ActionItem(meeting_id=theirs.id, description="D", assignee="alice", priority="Low", status="Done", is_overdue=True),
+    ])
+    db_session.commit()
+    login_and_set_cookie(client, "owner")
+
+    rollup = client.get("/dashboard/metrics").json()
+
+    statements = []
+    engine = db_session.get_bind()
+    listener = lambda conn, cursor, statement, *args: statements.append(statement)
+    monkeypatch.setattr(config, "DASHBOARD_METRICS_SOURCE", "live")
+    monkeypatch.setattr(config, "DASHBOARD_CACHE_TTL_SECONDS", 0)
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        live = client.get("/dashboard/metrics").json()
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+
+    assert live == rollup
+    assert live["total_items"] == 3
+    assert live["overdue_count"] == 1
+    assert live["completion_rate"] == pytest.approx(33.3)
+    assert {s["assignee"]: s["done_count"] for s in live["assignee_stats"]} == {None: 0, "alice": 1}
+    # One aggregation query, besides authenticating the user
+    assert len([s for s in statements if "action_items" in s]) == 1
@@ -0,0 +1,150 @@
+import threading
+import time
+from datetime import datetime
+from unittest.mock import AsyncMock, patch
+
+from sqlalchemy import event
+
+from ami_meeting_svc.models import ActionItem, Meeting, User
+from ami_meeting_svc.schemas.dashboard import DashboardMetrics
+from ami_meeting_svc.services.dashboard_cache import DashboardCache
+from ami_meeting_svc.utils.security import get_password_hash
+
+
+def create_user(db_session, username: str = "alice", email: str = "alice@example.com") -> User:
+    user = User(username=username, email=email, password_hash=get_password_hash("secret"))
+    db_session.add(user)
+    db_session.commit()
+    db_session.refresh(user)
+    return user
+
+
+def create_meeting(db_session, owner_id: int) -> Meeting:
+    meeting = Meeting(owner_id=owner_id, title="Team Sync", date=datetime.utcnow(), attendees=["a"], notes="x" * 60)
+    db_session.add(meeting)
+    db_session.commit()
+    db_session.refresh(meeting)
+    return meeting
+
+
+def login_and_set_cookie(client, username: str, password: str = "secret"):
+    resp = client.post("/auth/login", json={"username": username, "password": password})
+    assert resp.status_code == 200
+    client.cookies.set("access_token", resp.json()["access_token"])
+
+
+def add_item(db_session, meeting_id: int, status: str = "To Do") -> ActionItem:
+    item = ActionItem(meeting_id=meeting_id, description="Task", assignee="bob", priority="Low", status=status)
+    db_session.add(item)
+    db_session.commit()
+    db_session.refresh(item)
+    return item
+
+
+def empty_metrics() -> DashboardMetrics:
+    return DashboardMetrics(total_items=0, completion_rate=0.0, overdue_count=0, assignee_stats=[])
+
+
+def test_repeated_polls_are_served_from_memory_with_etag(client, db_session):
+    user = create_user(db_session)
+    add_item(db_session, create_meeting(db_session, user.id).id)
+    login_and_set_cookie(client, "alice")
+
+    first = client.get("/dashboard/metrics")
+    etag = first.headers["etag"]
+    assert first.headers["cache-control"] == "private, no-cache"
+
+    statements = []
+    engine = db_session.get_bind()
+    listener = lambda conn, cursor, statement, *args: statements.append(statement)
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        second = client.get("/dashboard/metrics")
+        not_modified = client.get("/dashboard/metrics", headers={"If-None-Match": f"W/{etag}"})
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+
+    assert second.json() == first.json()
+    assert second.headers["etag"] == etag
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    assert not_modified.headers["etag"] == etag
+    assert not [s for s in statements if "action_item" in s]
+
+
+def test_action_item_update_invalidates_cached_metrics(client, db_session):
+    user = create_user(db_session)
+    item = add_item(db_session, create_meeting(db_session, user.id).id)
+    login_and_set_cookie(client, "alice")
+
+    before = client.get("/dashboard/metrics")
+    assert client.patch(f"/action-items/{item.id}", json={"status": "Done"}).status_code == 200
+    after = client.get("/dashboard/metrics", headers={"If-None-Match": before.headers["etag"]})
+
+    assert after.status_code == 200
+    assert after.json()["completion_rate"] == 100.0
+    assert after.headers["etag"] != before.headers["etag"]
+
+
+def test_extract_actions_invalidates_cached_metrics(client, db_session):
+    user = create_user(db_session)
+    meeting = create_meeting(db_session, user.id)
+    login_and_set_cookie(client, "alice")
+
+    assert client.get("/dashboard/metrics").json()["total_items"] == 0
+    payload = {"action_items": [{"description": "Write the plan", "assignee": "bob", "priority": "High"}]}
+    with patch("ami_meeting_svc.routers.meetings.OpenAIService") as MockAI:
+        MockAI.return_value.get_completion = AsyncMock(return_value=payload)
+        assert client.post(f"/meetings/{meeting.id}/extract-actions").status_code == 200
+
+    assert client.get("/dashboard/metrics").json()["total_items"] == 1
+
+
+def test_concurrent_misses_load_once():
+    cache = DashboardCache()
+    calls = []
+
+    def load():
+        calls.append(1)
+        time.sleep(0.05)
+        return empty_metrics()
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get(1, load))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert len({result.etag for result in results}) == 1
+
+
+def test_load_overlapping_an_invalidation_is_not_stored():
+    cache = DashboardCache()
+
+    def load():
+        cache.invalidate(1)
+        return empty_metrics()
+
+    cache.get(1, load)
+    cache.get(1, empty_metrics)
+    assert cache.misses == 2
+
+
+def test_load_overlapping_a_clear_is_not_stored():
+    cache = DashboardCache()
+    loads = []
+
+    def stale_load():
+        # e.g. rebuild_metrics() clears the cache while this load is running
+        cache.clear()
+        return empty_metrics()
+
+    def load():
+        loads.append(1)
+        return empty_metrics()
+
+    cache.get(1, stale_load)
+    cache.get(1, load)
+    assert loads == [1]
@@ -0,0 +1,138 @@
+from datetime import date, datetime
+
+from ami_meeting_svc.models import ActionItem, ActionItemDailyMetric, Meeting, User
+from ami_meeting_svc.services.metrics_rollup import rebuild_daily_metrics
+from ami_meeting_svc.utils.security import get_password_hash
+
+
+def create_user(db_session, username: str = "alice", email: str = "alice@example.com") -> User:
+    user = User(username=username, email=email, password_hash=get_password_hash("secret"))
+    db_session.add(user)
+    db_session.commit()
+    db_session.refresh(user)
+    return user
+
+
+def create_meeting(db_session, owner_id: int) -> Meeting:
+    meeting = Meeting(owner_id=owner_id, title="Team Sync", date=datetime.utcnow(), attendees=["a"], notes="x" * 60)
+    db_session.add(meeting)
+    db_session.commit()
+    db_session.refresh(meeting)
+    return meeting
+
+
+def login_and_set_cookie(client, username: str, password: str = "secret"):
+    resp = client.post("/auth/login", json={"username": username, "password": password})
+    assert resp.status_code == 200
+    client.cookies.set("access_token", resp.json()["access_token"])
+
+
+def daily_rows(db_session, owner_id: int):
+    rows = db_session.query(ActionItemDailyMetric).filter_by(owner_id=owner_id).order_by(ActionItemDailyMetric.day)
+    return [
+        (r.day, r.created_count, r.completed_count, r.item_delta, r.done_delta, r.overdue_delta) for r in rows
+    ]
+
+
+def test_writes_update_todays_rollup(client, db_session):
+    user = create_user(db_session)
+    other = create_user(db_session, username="bob", email="bob@example.com")
+    meeting = create_meeting(db_session, user.id)
+    first = ActionItem(meeting_id=meeting.id, description="A", priority="High", status="To Do")
+    second = ActionItem(meeting_id=meeting.id, description="B", priority="Low", status="To Do", is_overdue=True)
+    elsewhere = ActionItem(meeting_id=create_meeting(db_session, other.id).id, description="C", priority="Low")
+    db_session.add_all([first, second, elsewhere])
+    db_session.commit()
+    login_and_set_cookie(client, "alice")
+
+    assert client.patch(f"/action-items/{first.id}", json={"status": "Done"}).status_code == 200
+    assert client.patch(f"/action-items/{first.id}", json={"status": "In Progress"}).status_code == 200
+    assert client.patch(f"/action-items/{first.id}", json={"status": "Done"}).status_code == 200
+
+    today = datetime.utcnow().date()
+    resp = client.get("/dashboard/timeseries", params={"start": today.isoformat(), "end": today.isoformat()})
+    assert resp.status_code == 200
+    assert resp.json()["points"] == [
+        {
+            "period_start": today.isoformat(),
+            "period_end": today.isoformat(),
+            "created_count": 2,
+            "completed_count": 2,
+            "total_items": 2,
+            "done_items": 1,
+            "overdue_count": 1,
+            "completion_rate": 50.0,
+        }
+    ]
+
+    # A backfill reconstructs the same day from the items' current state, minus the reopening
+    incremental = daily_rows(db_session, user.id)
+    assert rebuild_daily_metrics(db_session, owner_id=user.id) == 1
+    assert daily_rows(db_session, user.id) == [(today, 2, 1, 2, 1, 1)]
+    assert incremental == [(today, 2, 2, 2, 1, 1)]
+
+
+def test_weekly_buckets_carry_totals_and_clip_to_range(client, db_session):
+    user = create_user(db_session)
+    login_and_set_cookie(client, "alice")
+    db_session.add_all([
+        # Before the range: only the opening totals
+        ActionItemDailyMetric(owner_id=user.id, day=date(2026, 9, 1), created_count=4, completed_count=1,
+                              item_delta=4, done_delta=1, overdue_delta=0),
+        # Wednesday of the first (partial) week
+        ActionItemDailyMetric(owner_id=user.id, day=date(2026, 9, 9), created_count=2, completed_count=0,
+                              item_delta=2, done_delta=0, overdue_delta=2),
+        # Monday and Thursday of the second week
+        ActionItemDailyMetric(owner_id=user.id, day=date(2026, 9, 14), created_count=0, completed_count=3,
+                              item_delta=0, done_delta=3, overdue_delta=-1),
+        ActionItemDailyMetric(owner_id=user.id, day=date(2026, 9, 17), created_count=1, completed_count=1,
+                              item_delta=0, done_delta=0, overdue_delta=0),
+    ])
+    db_session.commit()
+
+    resp = client.get(
+        "/dashboard/timeseries", params={"start": "2026-09-09", "end": "2026-09-22", "granularity": "week"}
+    )
+    assert resp.status_code == 200
+    points = resp.json()["points"]
+    assert [(p["period_start"], p["period_end"]) for p in points] == [
+        ("2026-09-09", "2026-09-13"),
+        ("2026-09-14", "2026-09-20"),
+        ("2026-09-21", "2026-09-22"),
+    ]
+    assert [(p["created_count"], p["completed_count"]) for p in points] == [(2, 0), (1, 4), (0, 0)]
+    assert [(p["total_items"], p["done_items"], p["overdue_count"]) for p in points] == [
+        (6, 1, 2),
+        (6, 4, 1),
+        (6, 4, 1),
+    ]
+    assert points[1]["completion_rate"] == 66.7
+
+
+def test_timeseries_rejects_bad_ranges(client, db_session):
+    create_user(db_session)
+    login_and_set_cookie(client, "alice")
+
+    assert client.get("/dashboard/timeseries", params={"start": "2026-09-10", "end": "2026-09-01"}).status_code == 400
+    assert client.get("/dashboard/timeseries", params={"start": "2020-01-01", "end": "2026-09-01"}).status_code == 400
+    assert client.get("/dashboard/timeseries", params={"granularity": "month"}).status_code == 422
+    default = client.get("/dashboard/timeseries")
+    assert default.status_code == 200
+    assert len(default.json()["points"]) == 30
+
+
+def test_rebuild_tool_keeps_daily_rollups_unless_asked(db_session, monkeypatch, capsys):
+    from ami_meeting_svc import rebuild_metrics
+
+    user = create_user(db_session)
+    exact = ActionItemDailyMetric(owner_id=user.id, day=date(2026, 9, 1), created_count=1, completed_count=1,
+                                  item_delta=1, done_delta=1, overdue_delta=0)
+    db_session.add(exact)
+    db_session.commit()
+    monkeypatch.setattr(rebuild_metrics, "engine", db_session.get_bind())
+
+    assert rebuild_metrics.main([]) == 0
+    assert daily_rows(db_session, user.id) == [(date(2026, 9, 1), 1, 1, 1, 1, 0)]
+    assert rebuild_metrics.main(["--daily"]) == 0
+    assert daily_rows(db_session, user.id) == []
+    assert '"daily_rows": 0' in capsys.readouterr().out
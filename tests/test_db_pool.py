@@ -0,0 +1,48 @@
+import pytest
+from sqlalchemy import create_engine, exc
+
+from ami_meeting_svc.models.base import MonitoredQueuePool, get_pool_stats
+
+
+def make_engine(tmp_path, **kwargs):
+    return create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        connect_args={"check_same_thread": False},
+        poolclass=MonitoredQueuePool,
+        **kwargs,
+    )
+
+
+def test_pool_stats_report_checkouts(tmp_path):
+    engine = make_engine(tmp_path, pool_size=2, max_overflow=0)
+    conn = engine.connect()
+    try:
+        stats = get_pool_stats(engine)
+        assert stats["pool_class"] == "MonitoredQueuePool"
+        assert stats["size"] == 2
+        assert stats["checked_out"] == 1
+        assert stats["waits"] == 0
+    finally:
+        conn.close()
+    assert get_pool_stats(engine)["checked_out"] == 0
+
+
+def test_pool_counts_waits_and_timeouts(tmp_path):
+    engine = make_engine(tmp_path, pool_size=1, max_overflow=0, pool_timeout=0.05)
+    conn = engine.connect()
+    try:
+        with pytest.raises(exc.TimeoutError):
+            engine.connect()
+    finally:
+        conn.close()
+
+    stats = get_pool_stats(engine)
+    assert stats["waits"] == 1
+    assert stats["timeouts"] == 1
+    assert stats["wait_seconds"] > 0
+
+
+def test_db_pool_endpoint(client):
+    resp = client.get("/monitoring/db-pool")
+    assert resp.status_code == 200
+    assert "pool_class" in resp.json()
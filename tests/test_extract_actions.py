@@ -1,9 +1,10 @@
 import pytest
 from datetime import datetime, timedelta, timezone
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
-from sqlalchemy import select
+from sqlalchemy import event, select
 
+from ami_meeting_svc import config
 from ami_meeting_svc.models import ActionItem, Meeting
 from ami_meeting_svc.models import User
 from ami_meeting_svc.utils.security import get_password_hash
@@ -56,7 +57,7 @@ def test_extract_actions_success_persists(client, db_session):
 
     with patch("ami_meeting_svc.routers.meetings.OpenAIService") as MockAI:
         instance = MockAI.return_value
-        instance.get_completion.return_value = mocked_ai_response
+        instance.get_completion = AsyncMock(return_value=mocked_ai_response)
 
         resp2 = client.post(f"/meetings/{meeting_id}/extract-actions")
         assert resp2.status_code == 200
@@ -125,3 +126,124 @@ def test_extract_actions_not_owner_returns_404(client, db_session):
 
     resp = client.post(f"/meetings/{meeting.id}/extract-actions")
     assert resp.status_code == 404
+
+
+def _many_items(count: int) -> dict:
+    return {
+        "action_items": [
+            {"description": f"Task {idx}", "assignee": "alice", "priority": "Medium", "deadline": None}
+            for idx in range(count)
+        ]
+    }
+
+
+def test_extract_actions_inserts_in_one_statement(client, db_session):
+    create_user(db_session, username="alice", email="alice@example.com", password="secret")
+    login_and_set_cookie(client, "alice", "secret")
+    meeting_id = client.post("/meetings/", json=meeting_payload()).json()["id"]
+
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if "action_items" in statement:
+            statements.append(statement.split()[0].upper())
+
+    engine = db_session.get_bind()
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        with patch("ami_meeting_svc.routers.meetings.OpenAIService") as MockAI:
+            MockAI.return_value.get_completion = AsyncMock(return_value=_many_items(30))
+            resp = client.post(f"/meetings/{meeting_id}/extract-actions")
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    assert resp.status_code == 200
+    data = resp.json()
+    assert [item["description"] for item in data] == [f"Task {idx}" for idx in range(30)]
+    assert all(item["status"] == "To Do" and item["created_at"] for item in data)
+    # One INSERT ... RETURNING and no per-item refresh
+    assert statements == ["INSERT"]
+
+
+def test_extract_actions_without_returning_support(client, db_session, monkeypatch):
+    create_user(db_session, username="alice", email="alice@example.com", password="secret")
+    login_and_set_cookie(client, "alice", "secret")
+    meeting_id = client.post("/meetings/", json=meeting_payload()).json()["id"]
+    dialect = db_session.get_bind().dialect
+    # Behave like a backend without RETURNING (e.g. MySQL)
+    monkeypatch.setattr(dialect, "insert_returning", False)
+    monkeypatch.setattr(dialect, "insert_executemany_returning", False)
+
+    with patch("ami_meeting_svc.routers.meetings.OpenAIService") as MockAI:
+        MockAI.return_value.get_completion = AsyncMock(return_value=_many_items(3))
+        resp = client.post(f"/meetings/{meeting_id}/extract-actions")
+
+    assert resp.status_code == 200
+    data = resp.json()
+    assert [item["description"] for item in data] == ["Task 0", "Task 1", "Task 2"]
+    persisted = db_session.execute(select(ActionItem).order_by(ActionItem.id)).scalars().all()
+    assert [item["id"] for item in data] == [row.id for row in persisted]
+
+
+MIXED_ITEMS = {
+    "action_items": [
+        {"description": "Send recap email", "assignee": "alice", "priority": "urgent", "deadline": None},
+        {"description": "Book the room", "assignee": "bob", "deadline": "next Friday"},
+        "Call the vendor",
+    ]
+}
+
+
+def test_extract_actions_salvages_valid_items_and_repairs_the_rest(client, db_session):
+    create_user(db_session, username="alice", email="alice@example.com", password="secret")
+    login_and_set_cookie(client, "alice", "secret")
+    meeting_id = client.post("/meetings/", json=meeting_payload()).json()["id"]
+
+    repaired = {
+        "action_items": [
+            {"description": "Book the room", "assignee": "bob", "priority": "Low", "deadline": "2026-01-23"},
+            {"description": "", "priority": "High"},
+        ]
+    }
+    with patch("ami_meeting_svc.routers.meetings.OpenAIService") as MockAI:
+        get_completion = AsyncMock(side_effect=[MIXED_ITEMS, repaired])
+        MockAI.return_value.get_completion = get_completion
+        resp = client.post(f"/meetings/{meeting_id}/extract-actions")
+
+    assert resp.status_code == 200
+    assert [(item["description"], item["priority"]) for item in resp.json()] == [
+        ("Send recap email", "High"), ("Book the room", "Low")
+    ]
+    assert resp.headers["X-Rejected-Action-Items"] == "1"
+
+    # The repair call only carries the two invalid items, not the notes
+    repair_prompt = get_completion.call_args_list[1].kwargs["prompt"]
+    assert "Meeting notes" not in repair_prompt
+    assert "next Friday" in repair_prompt and "Call the vendor" in repair_prompt
+    assert "Send recap email" not in repair_prompt
+
+    meta = db_session.get(Meeting, meeting_id).analysis_meta["extraction"]
+    assert meta["rejected_action_items"] == [
+        {"index": 2, "item": "Call the vendor", "errors": ["Input should be a valid dictionary or instance of ExtractedActionItem"]}
+    ]
+    assert len(db_session.execute(select(ActionItem)).scalars().all()) == 2
+
+
+def test_extract_actions_repair_can_be_disabled(client, db_session, monkeypatch):
+    monkeypatch.setattr(config, "EXTRACTION_REPAIR_ENABLED", False)
+    create_user(db_session, username="alice", email="alice@example.com", password="secret")
+    login_and_set_cookie(client, "alice", "secret")
+    meeting_id = client.post("/meetings/", json=meeting_payload()).json()["id"]
+
+    with patch("ami_meeting_svc.routers.meetings.OpenAIService") as MockAI:
+        get_completion = AsyncMock(return_value=MIXED_ITEMS)
+        MockAI.return_value.get_completion = get_completion
+        resp = client.post(f"/meetings/{meeting_id}/extract-actions")
+        again = client.post(f"/meetings/{meeting_id}/extract-actions")
+
+    assert resp.status_code == 200
+    assert [item["description"] for item in resp.json()] == ["Send recap email"]
+    assert resp.headers["X-Rejected-Action-Items"] == "2"
+    # The salvaged result is cached with its rejections
+    assert get_completion.await_count == 1
+    assert again.headers["X-Rejected-Action-Items"] == "2"
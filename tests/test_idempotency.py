@@ -0,0 +1,191 @@
+import asyncio
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, patch
+
+from fastapi.responses import JSONResponse
+from sqlalchemy import func, select
+
+from ami_meeting_svc import config
+from ami_meeting_svc.models import ActionItem, IdempotencyKey, Meeting, User
+from ami_meeting_svc.services import idempotency
+from ami_meeting_svc.services.idempotency import IdempotencyStore
+from ami_meeting_svc.utils.security import get_password_hash
+
+NOTES = "Alice: we agreed to ship on Friday. Bob: I will send the recap to the whole team."
+
+
+def create_user(db_session, username: str = "alice", email: str = "alice@example.com", password: str = "secret") -> User:
+    user = User(username=username, email=email, password_hash=get_password_hash(password))
+    db_session.add(user)
+    db_session.commit()
+    db_session.refresh(user)
+    return user
+
+
+def login_and_set_cookie(client, username: str, password: str = "secret"):
+    resp = client.post("/auth/login", json={"username": username, "password": password})
+    assert resp.status_code == 200
+    client.cookies.set("access_token", resp.json()["access_token"])
+
+
+def meeting_payload(title: str = "Team Sync") -> dict:
+    return {"title": title, "date": "2026-01-15T10:00:00", "attendees": ["alice", "bob"], "notes": NOTES}
+
+
+def count(db_session, model) -> int:
+    return db_session.execute(select(func.count()).select_from(model)).scalar_one()
+
+
+def test_repeated_create_meeting_is_replayed(client, db_session):
+    create_user(db_session)
+    create_user(db_session, username="bob", email="bob@example.com")
+    login_and_set_cookie(client, "alice")
+
+    headers = {"Idempotency-Key": "create-1"}
+    first = client.post("/meetings/", json=meeting_payload(), headers=headers)
+    second = client.post("/meetings/", json=meeting_payload(), headers=headers)
+
+    assert first.status_code == second.status_code == 201
+    assert second.json() == first.json()
+    assert "Idempotent-Replayed" not in first.headers
+    assert second.headers["Idempotent-Replayed"] == "true"
+    assert count(db_session, Meeting) == 1
+
+    # Keys are scoped to the user
+    login_and_set_cookie(client, "bob")
+    other = client.post("/meetings/", json=meeting_payload(), headers=headers)
+    assert other.status_code == 201 and other.json()["id"] != first.json()["id"]
+
+
+def test_key_reused_for_another_request_is_rejected(client, db_session):
+    create_user(db_session)
+    login_and_set_cookie(client, "alice")
+
+    headers = {"Idempotency-Key": "create-1"}
+    assert client.post("/meetings/", json=meeting_payload(), headers=headers).status_code == 201
+    resp = client.post("/meetings/", json=meeting_payload(title="Other"), headers=headers)
+
+    assert resp.status_code == 422
+    assert count(db_session, Meeting) == 1
+    assert client.post("/meetings/", json=meeting_payload(), headers={"Idempotency-Key": ""}).status_code == 400
+
+
+def test_repeated_extract_actions_calls_the_model_once(client, db_session):
+    create_user(db_session)
+    login_and_set_cookie(client, "alice")
+    meeting_id = client.post("/meetings/", json=meeting_payload()).json()["id"]
+
+    mocked = {"action_items": [{"description": "Send recap", "assignee": "bob", "priority": "High", "deadline": None}]}
+    headers = {"Idempotency-Key": "extract-1"}
+    with patch("ami_meeting_svc.routers.meetings.OpenAIService") as MockAI, \
+            patch("ami_meeting_svc.services.meeting_ai.ai_cache") as cache:
+        # Bypass the AI cache so only the idempotency key can prevent the second call
+        cache.get = AsyncMock(return_value=None)
+        cache.put = AsyncMock()
+        get_completion = AsyncMock(return_value=mocked)
+        MockAI.return_value.get_completion = get_completion
+        first = client.post(f"/meetings/{meeting_id}/extract-actions", headers=headers)
+        second = client.post(f"/meetings/{meeting_id}/extract-actions", headers=headers)
+
+    assert first.status_code == second.status_code == 200
+    assert second.json() == first.json()
+    assert second.headers["X-Rejected-Action-Items"] == "0"
+    assert get_completion.await_count == 1
+    assert count(db_session, ActionItem) == 1
+
+
+def test_failed_request_releases_the_key(client, db_session):
+    create_user(db_session)
+    login_and_set_cookie(client, "alice")
+    meeting_id = client.post("/meetings/", json=meeting_payload()).json()["id"]
+
+    headers = {"Idempotency-Key": "analyze-1"}
+    with patch("ami_meeting_svc.routers.meetings.OpenAIService") as MockAI:
+        MockAI.return_value.get_completion = AsyncMock(return_value=["not", "a", "dict"])
+        failed = client.post(f"/meetings/{meeting_id}/analyze", headers=headers)
+        MockAI.return_value.get_completion = AsyncMock(
+            return_value={"summary": "s", "key_discussion_points": [], "decisions": []}
+        )
+        retried = client.post(f"/meetings/{meeting_id}/analyze", headers=headers)
+
+    assert failed.status_code == 500
+    assert retried.status_code == 200
+    assert retried.json()["analysis_result"]["summary"] == "s"
+    assert "Idempotent-Replayed" not in retried.headers
+
+
+def test_concurrent_duplicates_wait_for_the_first(session_local, monkeypatch):
+    monkeypatch.setattr(config, "IDEMPOTENCY_POLL_INTERVAL", 0.01)
+
+    async def run_inline(fn, *args):
+        # The in-memory test database is one shared connection; keep its use on one thread
+        return fn(*args)
+
+    monkeypatch.setattr(idempotency, "run_in_threadpool", run_inline)
+    bind = session_local.kw["bind"]
+    store = IdempotencyStore()
+    calls = 0
+
+    async def call():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.1)
+        return JSONResponse(status_code=201, content={"id": calls})
+
+    async def scenario():
+        return await asyncio.gather(*(store.run(bind, 1, "key", "fingerprint", call) for _ in range(3)))
+
+    responses = asyncio.run(scenario())
+    assert calls == 1
+    assert [r.status_code for r in responses] == [201, 201, 201]
+    assert {r.body for r in responses} == {b'{"id":1}'}
+
+
+def test_abandoned_claim_is_taken_over(session_local, db_session):
+    bind = session_local.kw["bind"]
+    store = IdempotencyStore()
+    stale = datetime.utcnow() - timedelta(seconds=1)
+    claimed, _ = store._claim(bind, "hash", 1, "fingerprint", "dead-worker")
+    assert claimed
+    db_session.get(IdempotencyKey, "hash").locked_until = stale
+    db_session.commit()
+
+    assert store._claim(bind, "hash", 1, "other-request", "worker")[0] is False
+    assert store._claim(bind, "hash", 1, "fingerprint", "worker")[0] is True
+
+
+def test_claiming_a_key_purges_expired_ones(session_local, db_session):
+    bind = session_local.kw["bind"]
+    store = IdempotencyStore()
+    for name in ("old", "fresh"):
+        assert store._claim(bind, name, 1, "fingerprint", "worker")[0]
+    db_session.get(IdempotencyKey, "old").expires_at = datetime.utcnow() - timedelta(seconds=1)
+    db_session.commit()
+
+    assert store._claim(bind, "new", 1, "fingerprint", "worker")[0]
+    db_session.expire_all()
+    assert sorted(db_session.execute(select(IdempotencyKey.key_hash)).scalars()) == ["fresh", "new"]
+
+
+def test_released_key_retries_within_the_wait_budget(monkeypatch):
+    monkeypatch.setattr(config, "IDEMPOTENCY_WAIT_SECONDS", 0.05)
+    monkeypatch.setattr(config, "IDEMPOTENCY_POLL_INTERVAL", 0.01)
+    store = IdempotencyStore()
+    claims = []
+
+    def never_claimed(*args):
+        # The key is released every time between our insert and the read
+        claims.append(args)
+        return False, None
+
+    monkeypatch.setattr(store, "_claim", never_claimed)
+    call = AsyncMock(return_value=JSONResponse({}))
+    try:
+        asyncio.run(store.run(None, 1, "key", "fingerprint", call))
+    except idempotency.HTTPException as e:
+        assert e.status_code == 409
+    else:
+        raise AssertionError("expected 409")
+    call.assert_not_called()
+    # Polled at the configured interval rather than spinning
+    assert 2 <= len(claims) <= 10
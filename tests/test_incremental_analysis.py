@@ -0,0 +1,115 @@
+from datetime import datetime
+from unittest.mock import patch
+
+from ami_meeting_svc import config
+from ami_meeting_svc.models import Meeting, User
+from ami_meeting_svc.services import prompts
+from ami_meeting_svc.utils.security import get_password_hash
+
+FIRST_NOTES = "Alice: we reviewed the roadmap.\nBob: we agreed to ship on Friday."
+APPENDED = "\nCarol: the release notes still need a review."
+
+
+def create_user(db_session, username: str = "alice", email: str = "alice@example.com", password: str = "secret") -> User:
+    user = User(username=username, email=email, password_hash=get_password_hash(password))
+    db_session.add(user)
+    db_session.commit()
+    db_session.refresh(user)
+    return user
+
+
+def create_meeting(db_session, owner_id: int, notes: str = FIRST_NOTES) -> Meeting:
+    meeting = Meeting(owner_id=owner_id, title="Running notes", date=datetime.utcnow(), attendees=["a"], notes=notes)
+    db_session.add(meeting)
+    db_session.commit()
+    db_session.refresh(meeting)
+    return meeting
+
+
+def login_and_set_cookie(client, username: str, password: str = "secret"):
+    resp = client.post("/auth/login", json={"username": username, "password": password})
+    assert resp.status_code == 200
+    client.cookies.set("access_token", resp.json()["access_token"])
+
+
+def set_notes(db_session, meeting_id: int, notes: str) -> None:
+    meeting = db_session.get(Meeting, meeting_id)
+    meeting.notes = notes
+    db_session.commit()
+
+
+FIRST = {"summary": "Roadmap review", "key_discussion_points": ["roadmap"], "decisions": ["ship Friday"]}
+UPDATED = {"summary": "Roadmap review and release prep", "key_discussion_points": ["roadmap", "release notes"]}
+
+
+def recording_completion(results, calls):
+    async def get_completion(prompt, system_message=None, json_mode=False, usage=None):
+        calls.append((system_message, prompt))
+        return results[len(calls) - 1]
+
+    return get_completion
+
+
+def test_appended_notes_are_analyzed_incrementally(client, db_session):
+    user = create_user(db_session)
+    meeting = create_meeting(db_session, user.id)
+    login_and_set_cookie(client, "alice")
+
+    calls = []
+    with patch("ami_meeting_svc.routers.meetings.OpenAIService") as MockAI:
+        MockAI.return_value.get_completion = recording_completion([FIRST, UPDATED], calls)
+        first = client.post(f"/meetings/{meeting.id}/analyze")
+        set_notes(db_session, meeting.id, FIRST_NOTES + APPENDED)
+        second = client.post(f"/meetings/{meeting.id}/analyze")
+
+    assert first.json()["analysis_meta"]["analysis"]["mode"] == "full"
+    assert second.status_code == 200
+    system_message, user_message = calls[1]
+    assert system_message == prompts.INCREMENTAL_ANALYSIS.system
+    # Only the new notes and the previous structured result are sent
+    assert user_message.endswith(APPENDED)
+    assert FIRST_NOTES not in user_message
+    assert '"summary": "Roadmap review"' in user_message
+
+    data = second.json()
+    assert data["analysis_result"] == dict(UPDATED, decisions=["ship Friday"])
+    meta = data["analysis_meta"]["analysis"]
+    assert meta["mode"] == "incremental"
+    assert meta["appended_chars"] == len(APPENDED)
+    assert meta["covered_chars"] == len(FIRST_NOTES + APPENDED)
+
+
+def test_edited_notes_fall_back_to_full_analysis(client, db_session):
+    user = create_user(db_session)
+    meeting = create_meeting(db_session, user.id)
+    login_and_set_cookie(client, "alice")
+
+    calls = []
+    edited = FIRST_NOTES.replace("Friday", "Monday") + APPENDED
+    with patch("ami_meeting_svc.routers.meetings.OpenAIService") as MockAI:
+        MockAI.return_value.get_completion = recording_completion([FIRST, UPDATED], calls)
+        client.post(f"/meetings/{meeting.id}/analyze")
+        set_notes(db_session, meeting.id, edited)
+        resp = client.post(f"/meetings/{meeting.id}/analyze")
+
+    system_message, user_message = calls[1]
+    assert system_message == prompts.ANALYSIS.system
+    assert user_message.endswith(edited)
+    assert resp.json()["analysis_result"] == UPDATED
+    assert resp.json()["analysis_meta"]["analysis"]["mode"] == "full"
+
+
+def test_model_change_falls_back_to_full_analysis(client, db_session, monkeypatch):
+    user = create_user(db_session)
+    meeting = create_meeting(db_session, user.id)
+    login_and_set_cookie(client, "alice")
+
+    calls = []
+    with patch("ami_meeting_svc.routers.meetings.OpenAIService") as MockAI:
+        MockAI.return_value.get_completion = recording_completion([FIRST, UPDATED], calls)
+        client.post(f"/meetings/{meeting.id}/analyze")
+        set_notes(db_session, meeting.id, FIRST_NOTES + APPENDED)
+        monkeypatch.setattr(config, "OPENAI_MODEL_NAME", "another-model")
+        client.post(f"/meetings/{meeting.id}/analyze")
+
+    assert calls[1][0] == prompts.ANALYSIS.system
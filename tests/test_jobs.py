@@ -0,0 +1,227 @@
+import asyncio
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+
+from ami_meeting_svc.models import ActionItem, Base, Job, Meeting, User
+from ami_meeting_svc.services.job_queue import JobQueue, job_queue
+from ami_meeting_svc.utils.security import get_password_hash
+
+
+def create_user(db_session, username: str = "alice", email: str = "alice@example.com", password: str = "secret") -> User:
+    user = User(username=username, email=email, password_hash=get_password_hash(password))
+    db_session.add(user)
+    db_session.commit()
+    db_session.refresh(user)
+    return user
+
+
+def create_meeting(db_session, owner_id: int, notes: str = "x" * 60) -> Meeting:
+    meeting = Meeting(owner_id=owner_id, title="Team Sync", date=datetime.utcnow(), attendees=["a"], notes=notes)
+    db_session.add(meeting)
+    db_session.commit()
+    db_session.refresh(meeting)
+    return meeting
+
+
+def login_and_set_cookie(client, username: str, password: str = "secret"):
+    resp = client.post("/auth/login", json={"username": username, "password": password})
+    assert resp.status_code == 200
+    client.cookies.set("access_token", resp.json()["access_token"])
+
+
+@pytest.fixture
+def submitted(monkeypatch):
+    """Capture submissions instead of racing the app's workers.
+
+    The test database is a single shared SQLite connection, so a worker running
+    concurrently with request sessions would see their rollbacks.
+    """
+    jobs = []
+    monkeypatch.setattr(job_queue, "submit", lambda job_id, bind: jobs.append((job_id, bind)))
+    return jobs
+
+
+def run_job(client, submitted, job_id: int) -> dict:
+    assert [jid for jid, _ in submitted] == [job_id]
+    client.portal.call(job_queue.process, *submitted.pop())
+    resp = client.get(f"/jobs/{job_id}")
+    assert resp.status_code == 200
+    return resp.json()
+
+
+def test_analyze_async_returns_202_and_job_completes(client, db_session, submitted):
+    user = create_user(db_session)
+    meeting = create_meeting(db_session, user.id)
+    login_and_set_cookie(client, "alice")
+
+    mocked_result = {"summary": "s", "key_discussion_points": ["p"], "decisions": []}
+    with patch("ami_meeting_svc.services.job_queue.OpenAIService") as MockAI:
+        MockAI.return_value.get_completion = AsyncMock(return_value=mocked_result)
+
+        resp = client.post(f"/meetings/{meeting.id}/analyze?async=true")
+        assert resp.status_code == 202
+        job = resp.json()
+        assert job["kind"] == "analyze"
+        assert resp.headers["location"] == f"/jobs/{job['id']}"
+
+        assert job["status"] == "queued"
+        done = run_job(client, submitted, job["id"])
+
+    assert done["status"] == "succeeded"
+    assert done["attempts"] == 1
+    assert done["result"]["analysis_result"] == mocked_result
+
+    db_session.expire_all()
+    assert db_session.get(Meeting, meeting.id).analysis_result == mocked_result
+
+
+def test_extract_actions_async_persists_items(client, db_session, submitted):
+    user = create_user(db_session)
+    meeting = create_meeting(db_session, user.id)
+    login_and_set_cookie(client, "alice")
+
+    mocked = {"action_items": [{"description": "Send recap", "assignee": "alice", "priority": "High", "deadline": None}]}
+    with patch("ami_meeting_svc.services.job_queue.OpenAIService") as MockAI:
+        MockAI.return_value.get_completion = AsyncMock(return_value=mocked)
+
+        resp = client.post(f"/meetings/{meeting.id}/extract-actions?async=true")
+        assert resp.status_code == 202
+        done = run_job(client, submitted, resp.json()["id"])
+
+    assert done["status"] == "succeeded"
+    assert [item["description"] for item in done["result"]] == ["Send recap"]
+    persisted = db_session.execute(select(ActionItem).where(ActionItem.meeting_id == meeting.id)).scalars().all()
+    assert len(persisted) == 1
+
+
+def test_job_failure_is_recorded(client, db_session, submitted):
+    user = create_user(db_session)
+    meeting = create_meeting(db_session, user.id)
+    login_and_set_cookie(client, "alice")
+
+    with patch("ami_meeting_svc.services.job_queue.OpenAIService") as MockAI:
+        MockAI.return_value.get_completion = AsyncMock(return_value=["not", "a", "dict"])
+
+        resp = client.post(f"/meetings/{meeting.id}/analyze?async=true")
+        done = run_job(client, submitted, resp.json()["id"])
+
+    assert done["status"] == "failed"
+    assert done["error"] == "Invalid AI response format"
+
+
+def test_async_mode_validates_before_enqueue(client, db_session):
+    user = create_user(db_session)
+    meeting = create_meeting(db_session, user.id, notes="")
+    login_and_set_cookie(client, "alice")
+
+    resp = client.post(f"/meetings/{meeting.id}/analyze?async=true")
+    assert resp.status_code == 400
+    assert db_session.execute(select(Job)).scalars().all() == []
+
+
+def test_job_is_scoped_to_owner(client, db_session):
+    owner = create_user(db_session)
+    meeting = create_meeting(db_session, owner.id)
+    job = Job(kind="analyze", meeting_id=meeting.id, owner_id=owner.id, status="queued")
+    db_session.add(job)
+    db_session.commit()
+
+    create_user(db_session, username="bob", email="bob@example.com")
+    login_and_set_cookie(client, "bob")
+
+    resp = client.get(f"/jobs/{job.id}")
+    assert resp.status_code == 404
+
+
+def test_worker_pool_processes_jobs_once(tmp_path):
+    # A file database gives each worker its own connection, as in production
+    engine = create_engine(f"sqlite:///{tmp_path / 'jobs.db'}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    with Session(engine) as db:
+        owner = create_user(db)
+        meeting = create_meeting(db, owner.id)
+        jobs = [Job(kind="analyze", meeting_id=meeting.id, owner_id=owner.id, status="queued") for _ in range(3)]
+        db.add_all(jobs)
+        db.commit()
+        job_ids = [job.id for job in jobs]
+
+    async def scenario():
+        queue = JobQueue(concurrency=2)
+        # start() re-submits queued jobs; submitting again must not run them twice
+        await queue.start(engine)
+        for job_id in job_ids:
+            queue.submit(job_id, engine)
+        await queue.join()
+        await queue.stop()
+
+    with patch("ami_meeting_svc.services.job_queue.OpenAIService") as MockAI:
+        MockAI.return_value.get_completion = AsyncMock(return_value={"summary": "s"})
+        asyncio.run(scenario())
+
+    with Session(engine) as db:
+        for job_id in job_ids:
+            job = db.get(Job, job_id)
+            assert job.status == "succeeded"
+            assert job.attempts == 1
+
+
+def test_start_recovers_jobs_left_running(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'jobs.db'}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    long_ago = datetime.utcnow() - timedelta(hours=1)
+    with Session(engine) as db:
+        owner = create_user(db)
+        meeting = create_meeting(db, owner.id)
+
+        def running(started_at, attempts):
+            return Job(
+                kind="analyze", meeting_id=meeting.id, owner_id=owner.id,
+                status="running", started_at=started_at, attempts=attempts,
+            )
+
+        jobs = [
+            # Interrupted by a crash: runs again
+            running(long_ago, 1),
+            # Interrupted too often: given up
+            running(long_ago, 3),
+            # Possibly still running in another process: left alone
+            running(datetime.utcnow(), 1),
+        ]
+        db.add_all(jobs)
+        db.commit()
+        retried, exhausted, recent = (job.id for job in jobs)
+
+    async def scenario():
+        queue = JobQueue(concurrency=1)
+        await queue.start(engine)
+        await queue.join()
+        await queue.stop()
+
+    with patch("ami_meeting_svc.services.job_queue.OpenAIService") as MockAI:
+        MockAI.return_value.get_completion = AsyncMock(return_value={"summary": "s"})
+        asyncio.run(scenario())
+
+    with Session(engine) as db:
+        assert (db.get(Job, retried).status, db.get(Job, retried).attempts) == ("succeeded", 2)
+        assert (db.get(Job, exhausted).status, db.get(Job, exhausted).error) == ("failed", "Job was interrupted")
+        assert db.get(Job, recent).status == "running"
+
+
+def test_job_that_cannot_be_submitted_is_failed(client, db_session, monkeypatch):
+    user = create_user(db_session)
+    meeting = create_meeting(db_session, user.id)
+    login_and_set_cookie(client, "alice")
+
+    def refuse(job_id, bind):
+        raise RuntimeError("Job queue is not running")
+
+    monkeypatch.setattr(job_queue, "submit", refuse)
+    resp = client.post(f"/meetings/{meeting.id}/analyze?async=true")
+
+    assert resp.status_code == 500
+    job = db_session.execute(select(Job)).scalar_one()
+    assert (job.status, job.error) == ("failed", "Failed to enqueue job")
@@ -1,6 +1,6 @@
 import pytest
 from datetime import datetime, timedelta
-from unittest.mock import patch, MagicMock
+from unittest.mock import AsyncMock, patch, MagicMock
 
 from ami_meeting_svc.models import User
 from ami_meeting_svc.utils.security import get_password_hash
@@ -127,7 +127,7 @@ def test_analyze_meeting_success(client, db_session):
 
     with patch("ami_meeting_svc.routers.meetings.OpenAIService") as MockAI:
         instance = MockAI.return_value
-        instance.get_completion.return_value = mocked_result
+        instance.get_completion = AsyncMock(return_value=mocked_result)
 
         resp2 = client.post(f"/meetings/{meeting_id}/analyze")
         assert resp2.status_code == 200
@@ -0,0 +1,130 @@
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, patch
+
+from sqlalchemy import select
+
+from ami_meeting_svc.models import ActionItem, ActionItemMetric, Meeting, User
+from ami_meeting_svc.services.metrics_rollup import rebuild_metrics
+from ami_meeting_svc.utils.security import get_password_hash
+
+
+def create_user(db_session, username: str = "alice", email: str = "alice@example.com") -> User:
+    user = User(username=username, email=email, password_hash=get_password_hash("secret"))
+    db_session.add(user)
+    db_session.commit()
+    db_session.refresh(user)
+    return user
+
+
+def create_meeting(db_session, owner_id: int) -> Meeting:
+    meeting = Meeting(owner_id=owner_id, title="Team Sync", date=datetime.utcnow(), attendees=["a"], notes=("x" * 60))
+    db_session.add(meeting)
+    db_session.commit()
+    db_session.refresh(meeting)
+    return meeting
+
+
+def login_and_set_cookie(client, username: str, password: str = "secret"):
+    resp = client.post("/auth/login", json={"username": username, "password": password})
+    assert resp.status_code == 200
+    client.cookies.set("access_token", resp.json()["access_token"])
+
+
+def counters(db_session) -> dict:
+    db_session.expire_all()
+    rows = db_session.execute(select(ActionItemMetric).where(ActionItemMetric.item_count != 0)).scalars().all()
+    return {(row.owner_id, row.assignee, row.status): (row.item_count, row.overdue_count) for row in rows}
+
+
+def test_counters_follow_extraction_and_updates(client, db_session):
+    user = create_user(db_session)
+    meeting = create_meeting(db_session, user.id)
+    login_and_set_cookie(client, "alice")
+
+    mocked = {
+        "action_items": [
+            {"description": "Send recap", "assignee": "bob", "priority": "High", "deadline": None},
+            {"description": "Book room", "assignee": None, "priority": "Low", "deadline": None},
+            {"description": "Draft plan", "assignee": "bob", "priority": "Medium", "deadline": None},
+        ]
+    }
+    with patch("ami_meeting_svc.routers.meetings.OpenAIService") as MockAI:
+        MockAI.return_value.get_completion = AsyncMock(return_value=mocked)
+        items = client.post(f"/meetings/{meeting.id}/extract-actions").json()
+
+    assert counters(db_session) == {(user.id, "bob", "To Do"): (2, 0), (user.id, "", "To Do"): (1, 0)}
+
+    past = (datetime.utcnow() - timedelta(days=1)).isoformat()
+    client.patch(f"/action-items/{items[0]['id']}", json={"status": "Done"})
+    client.patch(f"/action-items/{items[1]['id']}", json={"assignee": "carol", "deadline": past})
+
+    assert counters(db_session) == {
+        (user.id, "bob", "To Do"): (1, 0),
+        (user.id, "bob", "Done"): (1, 0),
+        (user.id, "carol", "To Do"): (1, 1),
+    }
+    data = client.get("/dashboard/metrics").json()
+    assert data["total_items"] == 3
+    assert data["overdue_count"] == 1
+    assert data["completion_rate"] == 33.3
+    assert [s["assignee"] for s in data["assignee_stats"]] == ["bob", "carol"]
+
+    # The incremental counters match a rebuild from scratch
+    before = counters(db_session)
+    rebuild_metrics(db_session)
+    assert counters(db_session) == before
+
+
+def test_dashboard_only_counts_own_meetings(client, db_session):
+    alice = create_user(db_session)
+    bob = create_user(db_session, username="bob", email="bob@example.com")
+    db_session.add_all(
+        [
+            ActionItem(meeting_id=create_meeting(db_session, alice.id).id, description="Mine", priority="High"),
+            ActionItem(meeting_id=create_meeting(db_session, bob.id).id, description="Theirs", priority="High"),
+        ]
+    )
+    db_session.commit()
+    login_and_set_cookie(client, "alice")
+
+    data = client.get("/dashboard/metrics").json()
+    assert data["total_items"] == 1
+    assert data["assignee_stats"] == [{"assignee": None, "todo_count": 1, "in_progress_count": 0, "done_count": 0}]
+
+
+def test_deletes_and_moves_between_meetings_are_counted(db_session):
+    alice = create_user(db_session)
+    bob = create_user(db_session, username="bob", email="bob@example.com")
+    mine, theirs = create_meeting(db_session, alice.id), create_meeting(db_session, bob.id)
+    moved = ActionItem(meeting_id=mine.id, description="Moved", assignee="dan", priority="Low", is_overdue=True)
+    removed = ActionItem(meeting_id=mine.id, description="Removed", assignee="dan", priority="Low")
+    db_session.add_all([moved, removed])
+    db_session.commit()
+
+    # Counted attributes are reassigned on an expired instance: the old values must still be known
+    db_session.expire(moved)
+    moved.meeting_id = theirs.id
+    db_session.delete(removed)
+    db_session.commit()
+
+    assert counters(db_session) == {(bob.id, "dan", "To Do"): (1, 1)}
+
+
+def test_rebuild_repairs_drifted_counters(db_session):
+    alice = create_user(db_session)
+    bob = create_user(db_session, username="bob", email="bob@example.com")
+    for owner in (alice, bob):
+        meeting = create_meeting(db_session, owner.id)
+        db_session.add(ActionItem(meeting_id=meeting.id, description="Task", assignee="dan", priority="Low"))
+    db_session.commit()
+    expected = counters(db_session)
+
+    for row in db_session.execute(select(ActionItemMetric)).scalars():
+        row.item_count = 42
+    db_session.commit()
+
+    assert rebuild_metrics(db_session, owner_id=alice.id) == 1
+    assert counters(db_session)[(alice.id, "dan", "To Do")] == (1, 0)
+    assert counters(db_session)[(bob.id, "dan", "To Do")] == (42, 0)
+    rebuild_metrics(db_session)
+    assert counters(db_session) == expected
@@ -0,0 +1,133 @@
+import asyncio
+from datetime import datetime
+from unittest.mock import AsyncMock, patch
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from ami_meeting_svc import config
+from ami_meeting_svc.models import Meeting, User
+from ami_meeting_svc.models.base import Base
+from ami_meeting_svc.services.batch_analysis import run_batch_analysis
+from ami_meeting_svc.services.meeting_ai import ANALYSIS_PROMPT_VERSION, EXTRACTION_PROMPT_VERSION
+from ami_meeting_svc.services.model_routing import choose_model
+from ami_meeting_svc.utils.security import get_password_hash
+
+ROUTES = {
+    "analysis": [{"max_tokens": 100, "model": "small-model"}, {"model": "large-model"}],
+    "default": [{"model": "extraction-model"}],
+}
+
+ANALYSIS = {"summary": "Ship Friday", "key_discussion_points": ["release"], "decisions": ["ship"]}
+
+
+def create_user(db_session, username: str = "alice", email: str = "alice@example.com", password: str = "secret") -> User:
+    user = User(username=username, email=email, password_hash=get_password_hash(password))
+    db_session.add(user)
+    db_session.commit()
+    db_session.refresh(user)
+    return user
+
+
+def create_meeting(db_session, owner_id: int, notes: str = "Alice: we ship Friday. Bob: agreed.") -> Meeting:
+    meeting = Meeting(owner_id=owner_id, title="Sync", date=datetime.utcnow(), attendees=["a"], notes=notes)
+    db_session.add(meeting)
+    db_session.commit()
+    db_session.refresh(meeting)
+    return meeting
+
+
+def login_and_set_cookie(client, username: str, password: str = "secret"):
+    resp = client.post("/auth/login", json={"username": username, "password": password})
+    assert resp.status_code == 200
+    client.cookies.set("access_token", resp.json()["access_token"])
+
+
+def test_routes_by_task_and_estimated_size(monkeypatch):
+    monkeypatch.setattr(config, "OPENAI_MODEL_ROUTES", ROUTES)
+
+    assert choose_model("analysis", "x" * 400).model == "small-model"
+    long_choice = choose_model("analysis", "x" * 401)
+    assert long_choice.model == "large-model"
+    assert long_choice.estimated_tokens == 101
+    # Tasks without their own routes use the default routes
+    assert choose_model("extraction", "x" * 10_000).model == "extraction-model"
+
+
+def test_falls_back_to_configured_model(monkeypatch):
+    monkeypatch.setattr(config, "OPENAI_MODEL_NAME", "base-model")
+    monkeypatch.setattr(config, "OPENAI_MODEL_ROUTES", {"analysis": [{"max_tokens": 10, "model": "tiny"}, {"oops": 1}]})
+
+    assert choose_model("analysis", "x" * 400).model == "base-model"
+    assert choose_model("combined", "short").model == "base-model"
+
+
+def test_analyze_uses_routed_model_and_records_it(client, db_session, monkeypatch):
+    monkeypatch.setattr(config, "OPENAI_MODEL_ROUTES", ROUTES)
+    user = create_user(db_session)
+    meeting = create_meeting(db_session, user.id)
+    login_and_set_cookie(client, "alice")
+
+    with patch("ami_meeting_svc.routers.meetings.OpenAIService") as MockAI:
+        MockAI.return_value.get_completion = AsyncMock(
+            side_effect=[ANALYSIS, {"action_items": [{"description": "Tag", "priority": "Low"}]}]
+        )
+        analyzed = client.post(f"/meetings/{meeting.id}/analyze")
+        extracted = client.post(f"/meetings/{meeting.id}/extract-actions")
+
+    assert analyzed.status_code == 200
+    assert extracted.status_code == 200
+    assert [call.kwargs["model_name"] for call in MockAI.call_args_list] == ["small-model", "extraction-model"]
+    assert analyzed.json()["analysis_result"] == ANALYSIS
+    assert analyzed.json()["analysis_meta"]["analysis"].items() >= {
+        "task": "analysis",
+        "model": "small-model",
+        "prompt_version": ANALYSIS_PROMPT_VERSION,
+        "estimated_tokens": 9,
+    }.items()
+
+    # Extraction adds its own entry without dropping the analysis one
+    db_session.expire_all()
+    meta = db_session.get(Meeting, meeting.id).analysis_meta
+    assert meta["analysis"]["model"] == "small-model"
+    assert meta["extraction"]["model"] == "extraction-model"
+    assert meta["extraction"]["prompt_version"] == EXTRACTION_PROMPT_VERSION
+
+
+def test_batch_records_model_per_meeting(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "OPENAI_MODEL_ROUTES", ROUTES)
+    engine = create_engine(f"sqlite:///{tmp_path / 'routing.db'}")
+    Base.metadata.create_all(engine)
+
+    with Session(bind=engine) as db:
+        user = create_user(db)
+        short = create_meeting(db, user.id, notes="short notes")
+        long = create_meeting(db, user.id, notes="long notes " * 100)
+        long.analysis_meta = {"extraction": {"model": "earlier"}}
+        db.commit()
+        meetings = [(short.id, short.notes), (long.id, long.notes)]
+        short_id, long_id = short.id, long.id
+
+    models = []
+
+    def factory(model_name=None):
+        models.append(model_name)
+        service = AsyncMock()
+        service.get_completion.return_value = dict(ANALYSIS, summary=model_name)
+        return service
+
+    async def collect():
+        return [e async for e in run_batch_analysis(engine, meetings, factory, concurrency=2, commit_size=5)]
+
+    events = asyncio.run(collect())
+
+    assert sorted(models) == ["large-model", "small-model"]
+    results = {e["meeting_id"]: e for e in events if e["event"] == "result"}
+    assert results[long_id]["model"] == "large-model"
+    with Session(bind=engine) as db:
+        assert db.get(Meeting, short_id).analysis_meta["analysis"]["model"] == "small-model"
+        long_meta = db.get(Meeting, long_id).analysis_meta
+        assert long_meta["analysis"]["model"] == "large-model"
+        assert long_meta["extraction"] == {"model": "earlier"}
+        assert db.get(Meeting, long_id).analysis_result["summary"] == "large-model"
+    engine.dispose()
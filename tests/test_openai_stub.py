@@ -0,0 +1,118 @@
+import asyncio
+import json
+
+import httpx
+import openai
+import pytest
+from fastapi.testclient import TestClient
+from openai import AsyncOpenAI
+
+from ami_meeting_svc import config
+from ami_meeting_svc.openai_stub import StubSettings, create_app
+from ami_meeting_svc.services import ai_service
+from ami_meeting_svc.services.ai_service import OpenAIService, TokenUsage
+from ami_meeting_svc.services.meeting_ai import (
+    build_action_items,
+    build_analysis_prompt,
+    build_combined_prompt,
+    build_extraction_prompt,
+    build_repair_prompt,
+    validate_combined_result,
+)
+from ami_meeting_svc.services.action_item_parsing import parse_action_items
+
+NOTES = "Alice: we agreed to ship on Friday.\nBob: I will send the recap to the team.\nCarol: looks good."
+
+
+def stub_service(settings: StubSettings) -> OpenAIService:
+    app = create_app(settings)
+    client = AsyncOpenAI(
+        api_key="stub",
+        base_url="http://stub/v1",
+        http_client=httpx.AsyncClient(transport=httpx.ASGITransport(app=app)),
+        max_retries=0,
+    )
+    return OpenAIService(client=client, model_name="stub-model")
+
+
+def test_replies_are_shaped_like_each_task():
+    svc = stub_service(StubSettings(latency_ms=0))
+
+    async def run():
+        results = []
+        for prompt in (
+            build_analysis_prompt(NOTES),
+            build_extraction_prompt(NOTES, None, "2026-01-15"),
+            build_combined_prompt(NOTES, "2026-01-15"),
+        ):
+            system_message, user_message = prompt
+            results.append(await svc.get_completion(user_message, system_message=system_message, json_mode=True))
+        return results
+
+    analysis, extraction, combined = asyncio.run(run())
+
+    assert set(analysis) == {"summary", "key_discussion_points", "decisions"}
+    assert analysis["decisions"] == ["Alice: we agreed to ship on Friday."]
+    items = build_action_items(1, parse_action_items(extraction).items)
+    assert [(item.assignee, item.description) for item in items] == [("Bob", "I will send the recap to the team.")]
+    validate_combined_result(combined)
+    assert not parse_action_items(combined).rejected
+    # Deterministic: the same notes always produce the same payload
+    assert asyncio.run(run())[0] == analysis
+
+
+def test_repair_replies_fix_each_rejected_item():
+    svc = stub_service(StubSettings(latency_ms=0))
+    parsed = parse_action_items({"action_items": [{"description": "Send recap", "priority": "soon"}, "Book room"]})
+    system_message, user_message = build_repair_prompt(parsed.rejected, "2026-01-15")
+
+    repaired = asyncio.run(svc.get_completion(user_message, system_message=system_message, json_mode=True))
+
+    assert [(item["description"], item["priority"]) for item in repaired["action_items"]] == [
+        ("Send recap", "Medium"), ("Book room", "Medium")
+    ]
+
+
+def test_streaming_matches_sdk_format():
+    svc = stub_service(StubSettings(latency_ms=0))
+    usage = TokenUsage()
+    system_message, user_message = build_analysis_prompt(NOTES)
+
+    async def collect():
+        deltas = svc.stream_completion(user_message, system_message=system_message, json_mode=True, usage=usage)
+        return [delta async for delta in deltas]
+
+    deltas = asyncio.run(collect())
+    assert len(deltas) > 1
+    assert set(json.loads("".join(deltas))) == {"summary", "key_discussion_points", "decisions"}
+    assert usage.calls == 1 and usage.completion_tokens > 0
+
+
+def test_injected_rate_limits_reach_the_sdk_as_429():
+    client = TestClient(create_app(StubSettings(latency_ms=0, rate_limit_ratio=1.0, retry_after=2)))
+    resp = client.post("/v1/chat/completions", json={"model": "m", "messages": [{"role": "user", "content": "hi"}]})
+    assert resp.status_code == 429
+    assert resp.headers["retry-after"] == "2"
+    assert resp.json()["error"]["type"] == "requests"
+    assert client.get("/stub/stats").json()["rate_limited"] == 1
+
+    svc = stub_service(StubSettings(latency_ms=0, error_ratio=1.0))
+    with pytest.raises(openai.InternalServerError):
+        asyncio.run(svc.get_completion("hi"))
+
+
+def test_seeded_error_injection_is_reproducible():
+    def statuses(seed):
+        client = TestClient(create_app(StubSettings(latency_ms=0, rate_limit_ratio=0.3, error_ratio=0.2, seed=seed)))
+        body = {"model": "m", "messages": [{"role": "user", "content": "hi"}]}
+        return [client.post("/v1/chat/completions", json=body).status_code for _ in range(20)]
+
+    first = statuses(7)
+    assert first == statuses(7)
+    assert {200, 429, 500} <= set(first)
+
+
+def test_base_url_setting_is_used(monkeypatch):
+    monkeypatch.setattr(config, "OPENAI_BASE_URL", "http://localhost:8001/v1")
+    client = ai_service.create_client("stub")
+    assert str(client.base_url) == "http://localhost:8001/v1/"
@@ -0,0 +1,68 @@
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+from ami_meeting_svc.services import ai_service, prompts
+from ami_meeting_svc.services.ai_service import OpenAIService, TokenUsage
+from ami_meeting_svc.services.meeting_ai import (
+    build_analysis_prompt,
+    build_combined_prompt,
+    build_extraction_prompt,
+    build_summary_merge_prompt,
+)
+
+TEMPLATES = [
+    prompts.ANALYSIS,
+    prompts.INCREMENTAL_ANALYSIS,
+    prompts.SUMMARY_MERGE,
+    prompts.EXTRACTION,
+    prompts.EXTRACTION_REPAIR,
+    prompts.COMBINED,
+]
+
+
+def test_system_messages_share_a_stable_prefix():
+    prefix = prompts._SHARED_PREFIX
+    assert all(template.system.startswith(prefix) for template in TEMPLATES)
+    assert len({template.version for template in TEMPLATES}) == len(TEMPLATES)
+
+
+def test_variable_content_only_in_user_message():
+    notes = "Alice: we ship on Friday."
+    built = [
+        build_analysis_prompt(notes),
+        build_analysis_prompt(notes, part=(2, 3)),
+        build_extraction_prompt(notes, {"summary": "s"}, "2026-01-15"),
+        build_combined_prompt(notes, "2026-01-15", part=(1, 2)),
+    ]
+    for (system_message, user_message), template in zip(built, [prompts.ANALYSIS, prompts.ANALYSIS, prompts.EXTRACTION, prompts.COMBINED]):
+        assert system_message == template.system
+        assert user_message.endswith(notes)
+    assert "part 2 of 3" in built[1][1]
+    assert "2026-01-15" in built[2][1] and '"summary": "s"' in built[2][1]
+
+    system_message, user_message = build_summary_merge_prompt(["first", "second"])
+    assert system_message == prompts.SUMMARY_MERGE.system
+    assert user_message.endswith("1. first\n2. second")
+
+
+def test_cached_prompt_tokens_are_accounted(monkeypatch):
+    totals = TokenUsage()
+    monkeypatch.setattr(ai_service, "usage_totals", totals)
+
+    response = MagicMock()
+    response.choices[0].message.content = "ok"
+    response.usage = SimpleNamespace(
+        prompt_tokens=1500, completion_tokens=20, total_tokens=1520,
+        prompt_tokens_details=SimpleNamespace(cached_tokens=1024),
+    )
+    mock_client = MagicMock()
+    mock_client.with_options.return_value = mock_client
+    mock_client.chat.completions.create = AsyncMock(return_value=response)
+
+    asyncio.run(OpenAIService(client=mock_client).get_completion("hi", system_message="rules"))
+
+    assert totals.as_dict()["cached_tokens"] == 1024
+    assert totals.as_dict()["cached_ratio"] == round(1024 / 1500, 4)
+    _, kwargs = mock_client.chat.completions.create.call_args
+    assert kwargs["messages"][0] == {"role": "system", "content": "rules"}
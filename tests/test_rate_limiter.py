@@ -0,0 +1,121 @@
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import openai
+import pytest
+
+from ami_meeting_svc.services import ai_service
+from ami_meeting_svc.services.ai_service import OpenAIService
+from ami_meeting_svc.services.rate_limiter import RateLimitWaitExceeded, TokenBucketLimiter
+
+
+class FakeClock:
+    """Deterministic time source: sleeping just advances the clock."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+        self.slept = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+def make_limiter(clock, db_path=":memory:", rpm=0, tpm=0):
+    return TokenBucketLimiter(rpm, tpm, db_path=db_path, clock=clock, sleep=clock.sleep)
+
+
+def test_requests_per_minute_budget_paces_bursts():
+    clock = FakeClock()
+    limiter = make_limiter(clock, rpm=60)
+
+    async def burst():
+        for _ in range(62):
+            await limiter.acquire(10)
+
+    asyncio.run(burst())
+    # 60 fit in the full bucket, the next two wait one second each for a refill
+    assert clock.slept == pytest.approx([1.0, 1.0])
+    assert limiter.waits == 2
+
+
+def test_token_budget_is_corrected_from_actual_usage():
+    clock = FakeClock()
+    limiter = make_limiter(clock, tpm=600)
+
+    async def scenario():
+        await limiter.acquire(600)
+        # The call used far fewer tokens than estimated; the surplus is returned
+        await limiter.settle(600, 100)
+        await limiter.acquire(500)
+
+    asyncio.run(scenario())
+    assert clock.slept == []
+
+
+def test_budget_is_shared_through_the_store(tmp_path):
+    clock = FakeClock()
+    path = str(tmp_path / "limits.db")
+    # Two limiters on one file behave like two worker processes
+    first = make_limiter(clock, db_path=path, tpm=600)
+    second = make_limiter(clock, db_path=path, tpm=600)
+
+    async def scenario():
+        await first.acquire(600)
+        await second.acquire(60)
+
+    asyncio.run(scenario())
+    # second waits for 60 tokens at 10 tokens/second, re-checking the store at least every 5s
+    assert clock.slept == pytest.approx([5.0, 1.0])
+    first.close()
+    second.close()
+
+
+def test_disabled_limiter_never_waits():
+    clock = FakeClock()
+    limiter = make_limiter(clock)
+    asyncio.run(limiter.acquire(10**9))
+    assert clock.slept == []
+
+
+def test_service_acquires_before_each_call_and_backs_off_on_429(monkeypatch):
+    clock = FakeClock()
+    limiter = make_limiter(clock, rpm=600, tpm=100_000)
+    limiter.acquire = AsyncMock(wraps=limiter.acquire)
+    limiter.exhaust = AsyncMock(wraps=limiter.exhaust)
+    monkeypatch.setattr(ai_service, "openai_rate_limiter", limiter)
+
+    mock_client = MagicMock()
+    mock_client.with_options.return_value = mock_client
+    response = MagicMock()
+    response.choices[0].message.content = "ok"
+    rate_limited = openai.RateLimitError("slow down", response=MagicMock(status_code=429), body=None)
+    mock_client.chat.completions.create = AsyncMock(side_effect=[rate_limited, response])
+
+    svc = OpenAIService(client=mock_client)
+    # Skip tenacity's backoff sleep
+    monkeypatch.setattr(OpenAIService._create_chat_completion.retry, "sleep", AsyncMock())
+    assert asyncio.run(svc.get_completion("hello")) == "ok"
+
+    assert limiter.acquire.await_count == 2
+    limiter.exhaust.assert_awaited_once()
+
+
+def test_acquire_gives_up_when_the_budget_would_overrun_the_deadline():
+    clock = FakeClock()
+    limiter = make_limiter(clock, rpm=60)
+
+    async def drain_then_acquire():
+        for _ in range(60):
+            await limiter.acquire(10)
+        # The next request refills in one second, past a deadline half a second away
+        await limiter.acquire(10, deadline=time.monotonic() + 0.5)
+
+    with pytest.raises(RateLimitWaitExceeded) as excinfo:
+        asyncio.run(drain_then_acquire())
+    assert excinfo.value.retry_after == pytest.approx(1.0)
+    assert clock.slept == []